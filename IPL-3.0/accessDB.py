@@ -1,12 +1,15 @@
-import pymongo
+from frozen import freeze
+from player_repository import MongoPlayerRepository
 
-connection = pymongo.MongoClient('localhost', 27017)
+# Connects (with a pooled client) on the first lookup rather than at import
+repository = MongoPlayerRepository("mongodb://localhost:27017", database="cricmanagerrecent") #database="cricmanager"
 
 def getPlayerInfo(initials):
-	db = connection['cricmanagerrecent'] #db = connection['cricmanager']
-	document = db['playerInfo']
-
 	# fetch = document.find_one({"playerInitials": initials})
-	fetch = document.find_one({"displayName": initials}) #may be same for some
+	fetch = repository.get_many([initials]).get(initials) #may be same for some
+
+	return None if fetch is None else freeze(fetch)
 
-	return fetch
\ No newline at end of file
+def getPlayersInfo(names):
+	"""Fetches many players with a single $in query as frozen records; unknown names are left out."""
+	return {name: freeze(record) for name, record in repository.get_many(names).items()}
\ No newline at end of file
@@ -1,10 +1,145 @@
+"""Player records from data/playerInfoProcessed.json, loaded on demand.
+
+The file holds one top-level object of ~2 MB, but a match needs only its 22
+players, so it is no longer decoded at import. A sidecar index
+(<data file>.idx) maps each player key to the byte offset and length of its
+record; a lookup reads and decodes just that slice, and the most recently
+used records are kept in an LRU. The index is rebuilt (one full scan) when
+the data file's size or mtime no longer match the ones it was built from.
+
+``data`` is a read-only Mapping over the file, so ``data[initials]`` and
+``getPlayerInfo(initials)`` both keep working. ``data`` hands out the
+records it caches and callers must not modify them; ``getPlayerInfo``
+returns a frozen copy (see frozen.freeze) that cannot change what later
+lookups read.
+"""
 import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from frozen import freeze
+
+DATA_PATH = "data/playerInfoProcessed.json"
+# Decoded player records kept in memory
+CACHE_SIZE = 256
+
+
+def _buildIndex(raw):
+	"""Returns {key: (offset, length)} of every value in the top-level JSON object ``raw`` (bytes)."""
+	text = raw.decode("utf-8")
+	decoder = json.JSONDecoder()
+	index = {}
+	pos = text.index("{") + 1
+	bytePos, seen = 0, 0   # byte offset of text[seen], so offsets stay linear for non-ASCII names
+
+	def skip(pos):
+		while text[pos] in " \t\r\n,":
+			pos += 1
+		return pos
+
+	pos = skip(pos)
+	while text[pos] != "}":
+		key, pos = decoder.raw_decode(text, pos)
+		pos = skip(pos)
+		if text[pos] != ":":
+			raise ValueError(f"expected ':' after {key!r} at {pos}")
+		start = skip(pos + 1)
+		_, end = decoder.raw_decode(text, start)
+		bytePos += len(text[seen:start].encode("utf-8"))
+		length = len(text[start:end].encode("utf-8"))
+		index[key] = (bytePos, length)
+		bytePos, seen = bytePos + length, end
+		pos = skip(end)
+	return index
+
+
+class PlayerStore(Mapping):
 
-with open("data/playerInfoProcessed.json") as f:
-	data = json.load(f)
+	def __init__(self, path=DATA_PATH, cacheSize=CACHE_SIZE):
+		self.path = path
+		self.indexPath = path + ".idx"
+		self.cacheSize = cacheSize
+		self._lock = threading.Lock()
+		self._index = None
+		self._cache = OrderedDict()
+
+	def index(self):
+		"""Returns the {key: (offset, length)} index, loading or rebuilding it if needed."""
+		index = self._index
+		if index is not None:
+			return index
+		with self._lock:
+			if self._index is None:
+				self._index = self._loadIndex()
+			return self._index
+
+	def _loadIndex(self):
+		st = os.stat(self.path)
+		stamp = [st.st_size, st.st_mtime_ns]
+		try:
+			with open(self.indexPath) as f:
+				saved = json.load(f)
+			if saved["stamp"] == stamp:
+				return {key: tuple(span) for key, span in saved["index"].items()}
+		except (OSError, ValueError, KeyError):
+			pass
+		with open(self.path, "rb") as f:
+			index = _buildIndex(f.read())
+		tmpPath = f"{self.indexPath}.{os.getpid()}.tmp"
+		try:
+			with open(tmpPath, "w") as f:
+				json.dump({"stamp": stamp, "index": index}, f)
+			os.replace(tmpPath, self.indexPath)
+		except OSError:
+			# Read-only checkout: keep the index in memory only
+			try:
+				os.remove(tmpPath)
+			except OSError:
+				pass
+		return index
+
+	def __getitem__(self, key):
+		with self._lock:
+			record = self._cache.get(key)
+			if record is not None:
+				self._cache.move_to_end(key)
+				return record
+		offset, length = self.index()[key]
+		with open(self.path, "rb") as f:
+			f.seek(offset)
+			record = json.loads(f.read(length))
+		with self._lock:
+			self._cache[key] = record
+			if len(self._cache) > self.cacheSize:
+				self._cache.popitem(last=False)
+		return record
+
+	def __iter__(self):
+		return iter(self.index())
+
+	def __len__(self):
+		return len(self.index())
+
+	def __contains__(self, key):
+		return key in self.index()
+
+	def reload(self):
+		"""Drops the index and cached records, e.g. after the file was edited on disk."""
+		with self._lock:
+			self._index = None
+			self._cache.clear()
+
+
+data = PlayerStore()
 
 def getPlayerInfo(initials):
 	# fetch = document.find_one({"playerInitials": initials})
 	fetch = data[initials] #may be same for some
 
-	return fetch 
\ No newline at end of file
+	return freeze(fetch)
+
+def reload():
+	"""Re-reads the player file, e.g. after it was edited on disk."""
+	data.reload()
@@ -1,32 +1,78 @@
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify
+from flask import Flask, render_template, request, redirect, url_for, session, jsonify, make_response, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 import json
 import mainconnect # Import the game logic from mainconnect.py
-# from match_simulator import MatchSimulator # MatchSimulator is no longer actively used for new game initiation from UI
+import match_random
+import team_registry
+import event_sinks
+import scorecard
+import replay
+from match_simulator import MatchSimulator # Interactive, one-ball-per-request matches
+import match_snapshot
+import session_store
+import match_pool
 import os
-import copy # For deepcopy if needed by process_batting_innings
-import uuid # For unique match IDs
+import base64
+import threading
+from types import MappingProxyType
+import functools # For the replay LRU
+import gzip
+import hashlib
+import hmac
 import logging # For logging errors
 
+
+class RegistryJSONProvider(DefaultJSONProvider):
+    """Serializes the read-only mappings handed out by team_registry and player_model."""
+    @staticmethod
+    def default(o):
+        if isinstance(o, MappingProxyType):
+            return dict(o)
+        return DefaultJSONProvider.default(o)
+
+
 app = Flask(__name__)
-app.secret_key = os.urandom(24)
+app.json = RegistryJSONProvider(app)
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-# Temporary directory for storing match logs
-TMP_LOG_DIR = os.path.join(app.root_path, 'tmp_match_logs')
-if not os.path.exists(TMP_LOG_DIR):
-    try:
-        os.makedirs(TMP_LOG_DIR)
-    except OSError as e:
-        logging.error(f"Error creating temporary log directory {TMP_LOG_DIR}: {e}")
+# Every worker must sign sessions with the same key, or a session started on one
+# cannot be read (or its interactive match restored) on another.
+app.secret_key = os.environ.get("IPL_SECRET_KEY")
+if not app.secret_key:
+    logging.warning("IPL_SECRET_KEY is not set; sessions will only be valid in this process.")
+    app.secret_key = os.urandom(24)
+
+# Replays are stored in the session as {team1, team2, seed, engine} and re-simulated
+# on view; this many regenerated matches are kept in memory.
+REPLAY_CACHE_SIZE = 32
+
+# Interactive matches stay in server memory; the cookie holds only the store key
+# and a match_snapshot (a few dozen bytes) to rebuild one that has expired here.
+INTERACTIVE_TTL = 1800
+interactive_matches = session_store.TTLStore(ttl=INTERACTIVE_TTL, max_entries=512)
+# Keys of interactive matches with a ball in progress; a second request for the
+# same match while one is running is turned away rather than racing it.
+_busy_matches = set()
+_busy_matches_lock = threading.Lock()
+
+# Direct simulations can be served from matches simulated ahead of time in the
+# background (see match_pool). IPL_MATCH_POOL_DEPTH=0 turns this off.
+MATCH_POOL_DEPTH = int(os.environ.get("IPL_MATCH_POOL_DEPTH", 2))
+MATCH_POOL_MAX_BYTES = int(os.environ.get("IPL_MATCH_POOL_MAX_BYTES", 32 * 1024 * 1024))
+direct_matches = match_pool.MatchPool(depth=MATCH_POOL_DEPTH, max_bytes=MATCH_POOL_MAX_BYTES)
+
+# Each live stream simulates its match on a worker thread for as long as the
+# client stays connected; beyond this many at once, new streams get a 503.
+MAX_LIVE_STREAMS = int(os.environ.get("IPL_MAX_LIVE_STREAMS", 8))
+live_streams = threading.BoundedSemaphore(MAX_LIVE_STREAMS)
 
 
 # --- Helper Functions ---
 def load_teams():
     try:
-        with open('teams/teams.json', 'r') as f:
-            return json.load(f)
+        return team_registry.get_teams()
     except FileNotFoundError:
         logging.error("teams/teams.json not found.")
         return {}
@@ -34,66 +80,16 @@ def load_teams():
         logging.error("Could not decode JSON from teams/teams.json.")
         return {}
 
-def process_batting_innings(bat_tracker_original):
-    bat_tracker = copy.deepcopy(bat_tracker_original)
-    wickets = 0
-    for player, stats in bat_tracker.items():
-        stats['how_out'] = "Not out"
-        if not stats.get('ballLog'):
-            stats['how_out'] = "DNB"
-            stats['runs'] = stats.get('runs', '')
-            stats['balls'] = stats.get('balls', '')
-            continue
-        wicket_found = False
-        for log_entry in stats['ballLog']:
-            parts = log_entry.split(':')
-            if len(parts) > 1:
-                event_details = parts[1]
-                if event_details.startswith("W"):
-                    wickets += 1
-                    wicket_found = True
-                    if "-CaughtBy-" in event_details:
-                        try:
-                            details = event_details.split('-')
-                            catcher = details[details.index('CaughtBy') + 1]
-                            bowler = details[details.index('Bowler') + 1]
-                            stats['how_out'] = f"c {catcher} b {bowler}"
-                        except (ValueError, IndexError): stats['how_out'] = "Caught"
-                    elif "-runout" in event_details: stats['how_out'] = "Run out"
-                    elif "-Bowler-" in event_details:
-                        try:
-                            details = event_details.split('-')
-                            dismissal_type = details[0][1:]
-                            bowler = details[details.index('Bowler') + 1]
-                            stats['how_out'] = f"{dismissal_type} b {bowler}"
-                        except (ValueError, IndexError): stats['how_out'] = "Wicket"
-                    else: stats['how_out'] = "Wicket"
-                    break
-        if not wicket_found and stats.get('balls', 0) == 0 and stats.get('runs', 0) == 0:
-            any_other_batted = False
-            for p_stats_check in bat_tracker.values():
-                if p_stats_check.get('balls',0) > 0 :
-                    any_other_batted = True
-                    break
-            if any_other_batted :
-                stats['how_out'] = "DNB"
-    return bat_tracker, wickets
 # --- End Helper Functions ---
 
-scores_dir_path = os.path.join(os.getcwd(), "scores")
-os.makedirs(scores_dir_path, exist_ok=True)
-for f_remove in os.listdir(scores_dir_path):
-    if os.path.isfile(os.path.join(scores_dir_path, f_remove)):
-        try: os.remove(os.path.join(scores_dir_path, f_remove))
-        except OSError as e: logging.warning(f"Error removing file {f_remove} from scores dir: {e}")
-
 
 @app.route('/', methods=['GET'])
 def index():
     teams_data = load_teams()
     session.pop('full_match_data', None)
     session.pop('sim_state', None)
-    session.pop('replay_match_id', None)
+    session.pop('interactive_match', None)
+    session.pop('replay_match', None)
     return render_template('index.html', teams=teams_data, scorecard_data=None)
 
 @app.route('/generate_scorecard', methods=['POST'])
@@ -108,15 +104,17 @@ def generate_scorecard():
     if not simulation_type: return redirect(url_for('index', error_message="Please select a simulation type."))
 
     if simulation_type == 'direct':
-        match_results = mainconnect.game(manual=False, sentTeamOne=team1_code, sentTeamTwo=team2_code, switch="webapp")
+        match_results = direct_matches.take(team1_code, team2_code)
+        if match_results is None:
+            match_results = match_pool.simulate_direct(team1_code, team2_code)
 
         team1_s_name = teams_data.get(team1_code, {}).get('name', team1_code)
         team2_s_name = teams_data.get(team2_code, {}).get('name', team2_code)
         team1_full_name = teams_data.get(team1_code, {}).get('fullName', team1_s_name)
         team2_full_name = teams_data.get(team2_code, {}).get('fullName', team2_s_name)
 
-        innings1_battracker_processed, wickets1_fallen = process_batting_innings(match_results.get("innings1Battracker", {}))
-        innings2_battracker_processed, wickets2_fallen = process_batting_innings(match_results.get("innings2Battracker", {}))
+        innings1_battracker_processed, wickets1_fallen = scorecard.batting_card(match_results.get("innings1Battracker", {}))
+        innings2_battracker_processed, wickets2_fallen = scorecard.batting_card(match_results.get("innings2Battracker", {}))
 
         scorecard_data_for_template = {
             "team1": team1_code, "team2": team2_code,
@@ -136,79 +134,253 @@ def generate_scorecard():
         return render_template('index.html', teams=teams_data, scorecard_data=scorecard_data_for_template)
 
     elif simulation_type == 'ball_by_ball':
-        match_results = mainconnect.game(manual=False, sentTeamOne=team1_code, sentTeamTwo=team2_code, switch="webapp_full_log")
-        innings1_battracker_original = match_results.get("innings1Battracker", {})
-        innings2_battracker_original = match_results.get("innings2Battracker", {})
-        processed_bat_tracker1, wickets1_fallen = process_batting_innings(innings1_battracker_original)
-        processed_bat_tracker2, wickets2_fallen = process_batting_innings(innings2_battracker_original)
-        team1_full_data = teams_data.get(team1_code, {})
-        team2_full_data = teams_data.get(team2_code, {})
-
-        full_match_data_to_save = {
-            "toss_msg": match_results.get("tossMsg"), "team1_code": team1_code, "team2_code": team2_code,
-            "team1_data": team1_full_data, "team2_data": team2_full_data,
-            "innings1_log": match_results.get("innings1Log", []), "innings2_log": match_results.get("innings2Log", []),
-            "innings1_bat_team": match_results.get("innings1BatTeam"), "innings2_bat_team": match_results.get("innings2BatTeam"),
-            "innings1_runs": match_results.get("innings1Runs"), "innings1_wickets": wickets1_fallen,
-            "innings1_balls": match_results.get("innings1Balls", 0),
-            "innings2_runs": match_results.get("innings2Runs"), "innings2_wickets": wickets2_fallen,
-            "innings2_balls": match_results.get("innings2Balls", 0),
-            "win_msg": match_results.get("winMsg"), "winner": match_results.get("winner"),
-            "innings1_battracker": processed_bat_tracker1, "innings2_battracker": processed_bat_tracker2,
-            "innings1_bowltracker": match_results.get("innings1Bowltracker", {}),
-            "innings2_bowltracker": match_results.get("innings2Bowltracker", {})
+        session['replay_match'] = {
+            "team1": team1_code, "team2": team2_code,
+            "seed": match_random.new_seed(), "engine": mainconnect.ENGINE_VERSION,
+            "data": replay_data_version()
         }
-
-        match_id = str(uuid.uuid4())
-        tmp_file_path = os.path.join(TMP_LOG_DIR, f"match_log_{match_id}.json")
-
-        try:
-            with open(tmp_file_path, 'w') as f:
-                json.dump(full_match_data_to_save, f)
-            session['replay_match_id'] = match_id
-        except IOError as e:
-            logging.error(f"Error saving match log to {tmp_file_path}: {e}")
-            return redirect(url_for('index', error_message="Failed to save match data for replay."))
-
         return redirect(url_for('replay_match_view'))
     else:
         return redirect(url_for('index', error_message="Invalid simulation type selected."))
 
+def replay_data_version():
+    """match_pool.data_version() (player repository and teams.json) shortened to fit in a replay record."""
+    return hashlib.sha1(repr(match_pool.data_version()).encode()).hexdigest()[:16]
+
+@functools.lru_cache(maxsize=REPLAY_CACHE_SIZE)
+def build_replay_data(team1_code, team2_code, seed, data_version):
+    """Re-simulates a stored replay and shapes it for replay_ball_by_ball.html.
+
+    The same teams and seed always give the same match on the same engine and
+    data, so only the cache key needs to persist. ``data_version`` is the
+    replay_data_version() the replay was recorded with; it is part of the
+    cache key so a data edit never serves a match cached from the old data,
+    and callers check it against the current one before asking. The ball-by-ball logs are kept as per-over chunks of
+    compact balls (``innings1_overs``/``innings2_overs``, see replay) that the
+    page fetches from /api/replay as it plays. Callers must treat the
+    returned dict as read-only.
+    """
+    teams_data = load_teams()
+    match_results = mainconnect.game(manual=False, sentTeamOne=team1_code, sentTeamTwo=team2_code, switch="webapp_full_log", sink=event_sinks.NullSink(), seed=seed)
+    processed_bat_tracker1, wickets1_fallen = scorecard.batting_card(match_results.get("innings1Battracker", {}))
+    processed_bat_tracker2, wickets2_fallen = scorecard.batting_card(match_results.get("innings2Battracker", {}))
+    return {
+        "toss_msg": match_results.get("tossMsg"), "team1_code": team1_code, "team2_code": team2_code,
+        "team1_data": teams_data.get(team1_code, {}), "team2_data": teams_data.get(team2_code, {}),
+        "innings1_overs": replay.over_chunks(match_results.get("innings1Log", [])),
+        "innings2_overs": replay.over_chunks(match_results.get("innings2Log", [])),
+        "innings1_bat_team": match_results.get("innings1BatTeam"), "innings2_bat_team": match_results.get("innings2BatTeam"),
+        "innings1_runs": match_results.get("innings1Runs"), "innings1_wickets": wickets1_fallen,
+        "innings1_balls": match_results.get("innings1Balls", 0),
+        "innings2_runs": match_results.get("innings2Runs"), "innings2_wickets": wickets2_fallen,
+        "innings2_balls": match_results.get("innings2Balls", 0),
+        "win_msg": match_results.get("winMsg"), "winner": match_results.get("winner"),
+        "innings1_battracker": processed_bat_tracker1, "innings2_battracker": processed_bat_tracker2,
+        "innings1_bowltracker": scorecard.bowling_card(match_results.get("innings1Bowltracker", {})),
+        "innings2_bowltracker": scorecard.bowling_card(match_results.get("innings2Bowltracker", {})),
+        "seed": seed
+    }
+
 @app.route('/replay_match_view')
 def replay_match_view():
-    match_id = session.get('replay_match_id')
-    if not match_id:
-        return redirect(url_for('index', error_message="No match ID found for replay."))
+    replay = session.get('replay_match')
+    if not replay:
+        return redirect(url_for('index', error_message="No match found for replay."))
+    if replay.get('engine') != mainconnect.ENGINE_VERSION:
+        # A different engine would play a different match from the same seed
+        session.pop('replay_match', None)
+        return redirect(url_for('index', error_message="This replay was recorded by an older version of the simulator."))
+    if replay.get('data') != replay_data_version():
+        # Edited team or player data would also play a different match
+        session.pop('replay_match', None)
+        return redirect(url_for('index', error_message="This replay was recorded before the team or player data changed."))
 
-    tmp_file_path = os.path.join(TMP_LOG_DIR, f"match_log_{match_id}.json")
+    if not replay.get('streamed'):
+        # First view: watch the match live while it is simulated; later views replay it from the seed
+        session['replay_match'] = {**replay, 'streamed': True}
+        teams_data = load_teams()
+        page_data = {
+            "team1_code": replay['team1'], "team2_code": replay['team2'],
+            "team1_data": teams_data.get(replay['team1'], {}), "team2_data": teams_data.get(replay['team2'], {}),
+        }
+        replay_meta = {"stream": url_for('live_match_stream', **replay_url_args(replay))}
+        return render_template('replay_ball_by_ball.html',
+                               full_match_data=page_data,
+                               replay_meta=replay_meta,
+                               team1_short_name=page_data['team1_data'].get('name', replay['team1']),
+                               team2_short_name=page_data['team2_data'].get('name', replay['team2']))
 
     try:
-        with open(tmp_file_path, 'r') as f:
-            full_match_data = json.load(f)
-    except FileNotFoundError:
-        logging.error(f"Match log file not found: {tmp_file_path}")
-        session.pop('replay_match_id', None)
-        return redirect(url_for('index', error_message="Match data not found. It might have expired or an error occurred."))
-    except json.JSONDecodeError as e:
-        logging.error(f"Error decoding match log JSON from {tmp_file_path}: {e}")
-        session.pop('replay_match_id', None)
+        full_match_data = build_replay_data(replay['team1'], replay['team2'], replay['seed'], replay['data'])
+    except (KeyError, ValueError) as e:
+        logging.error(f"Error regenerating replay {replay}: {e}")
+        session.pop('replay_match', None)
         return redirect(url_for('index', error_message="Error reading match data."))
 
     team1_s_name = full_match_data.get('team1_data', {}).get('name', full_match_data.get('team1_code', 'Team 1'))
     team2_s_name = full_match_data.get('team2_data', {}).get('name', full_match_data.get('team2_code', 'Team 2'))
 
+    # The page embeds only the summary and scorecards; balls are fetched an over at a time
+    page_data = {key: value for key, value in full_match_data.items() if not key.endswith('_overs')}
+    overs = [full_match_data['innings1_overs'], full_match_data['innings2_overs']]
+    replay_meta = {
+        "url": url_for('replay_base', **replay_url_args(replay)),
+        "overs": [len(chunks) for chunks in overs],
+        "balls": [sum(len(chunk) for chunk in chunks) for chunks in overs],
+    }
+
     return render_template('replay_ball_by_ball.html',
-                           full_match_data=full_match_data,
+                           full_match_data=page_data,
+                           replay_meta=replay_meta,
                            team1_short_name=team1_s_name,
                            team2_short_name=team2_s_name)
 
-# Routes for MatchSimulator based interactive simulation (currently disconnected from main UI flow)
-# @app.route('/ball_by_ball_game_view')
-# def ball_by_ball_game_view():
-#     # ... (code for MatchSimulator based view) ...
-# @app.route('/simulate_next_ball', methods=['POST'])
-# def simulate_next_ball():
-#     # ... (code for MatchSimulator based simulation call) ...
+def replay_token(engine, data, team1, team2, seed):
+    """Signs a replay's URL so the replay endpoints only simulate matches this server handed out."""
+    key = app.secret_key.encode() if isinstance(app.secret_key, str) else app.secret_key
+    return hmac.new(key, f"{engine}:{data}:{team1}:{team2}:{seed}".encode(), hashlib.sha256).hexdigest()[:32]
+
+def replay_token_valid(token, engine, data, team1, team2, seed):
+    return hmac.compare_digest(token, replay_token(engine, data, team1, team2, seed))
+
+def replay_url_args(replay):
+    """url_for arguments of a session replay record for the replay and live-stream endpoints."""
+    args = {"engine": replay['engine'], "data": replay['data'], "team1": replay['team1'],
+            "team2": replay['team2'], "seed": replay['seed']}
+    return {**args, "token": replay_token(**args)}
+
+def replay_etag(engine, data, team1, team2, seed, innings, over):
+    """Chunks are a pure function of these, so the ETag is known without re-simulating."""
+    return hashlib.sha1(f"{engine}:{data}:{team1}:{team2}:{seed}:{innings}:{over}".encode()).hexdigest()
+
+# A replay's overs are fetched from REPLAY_URL/<innings>/<over>; the page is
+# given REPLAY_URL itself, which is only ever built, never served.
+REPLAY_URL = '/api/replay/<int:engine>/<data>/<team1>/<team2>/<int:seed>/<token>'
+app.add_url_rule(REPLAY_URL, endpoint='replay_base', build_only=True)
+
+def _stale_replay(engine, data):
+    """The 410 response for a replay URL from another engine or older data, else None."""
+    if engine != mainconnect.ENGINE_VERSION:
+        return jsonify({"error": "replay was recorded by another simulator version"}), 410
+    if data != replay_data_version():
+        return jsonify({"error": "replay was recorded before the team or player data changed"}), 410
+    return None
+
+@app.route(REPLAY_URL + '/<int:innings>/<int:over>')
+def replay_over(engine, data, team1, team2, seed, token, innings, over):
+    """One over of a replay as {"innings", "over", "balls": [compact balls]}; gzipped and ETag-cached.
+
+    ``token`` is the replay_token issued with the replay page; other teams,
+    seeds or data versions are refused before anything is simulated or
+    answered from cache.
+    """
+    stale = _stale_replay(engine, data)
+    if stale:
+        return stale
+    if innings not in (1, 2):
+        return jsonify({"error": "innings must be 1 or 2"}), 404
+    teams_data = load_teams()
+    if team1 not in teams_data or team2 not in teams_data:
+        return jsonify({"error": "unknown teams"}), 404
+    if not replay_token_valid(token, engine, data, team1, team2, seed):
+        return jsonify({"error": "unknown replay"}), 403
+    etag = replay_etag(engine, data, team1, team2, seed, innings, over)
+    if etag in request.if_none_match:
+        response = make_response('', 304)
+    else:
+        try:
+            chunks = build_replay_data(team1, team2, seed, data)[f'innings{innings}_overs']
+        except (KeyError, ValueError):
+            return jsonify({"error": "unknown teams"}), 404
+        if over >= len(chunks):
+            return jsonify({"error": "over not bowled"}), 404
+        body = json.dumps({"innings": innings, "over": over, "balls": chunks[over]}, separators=(',', ':')).encode()
+        if 'gzip' in request.accept_encodings:
+            body = gzip.compress(body, compresslevel=6)
+            response = make_response(body)
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = make_response(body)
+        response.mimetype = 'application/json'
+    response.set_etag(etag)
+    response.headers['Vary'] = 'Accept-Encoding'
+    # The URL pins the engine and data versions, so a chunk never changes
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
+@app.route('/api/live/<int:engine>/<data>/<team1>/<team2>/<int:seed>/<token>')
+def live_match_stream(engine, data, team1, team2, seed, token):
+    """Server-Sent Events of a match as it is simulated (see replay.stream_match), ending with "done".
+
+    Like replay_over, only replays issued with a replay_token are streamed,
+    and at most MAX_LIVE_STREAMS at a time.
+    """
+    stale = _stale_replay(engine, data)
+    if stale:
+        return stale
+    teams_data = load_teams()
+    if team1 not in teams_data or team2 not in teams_data:
+        return jsonify({"error": "unknown teams"}), 404
+    if not replay_token_valid(token, engine, data, team1, team2, seed):
+        return jsonify({"error": "unknown replay"}), 403
+    if not live_streams.acquire(blocking=False):
+        response = jsonify({"error": "too many live matches; try again shortly"})
+        response.headers['Retry-After'] = '5'
+        return response, 503
+
+    def events():
+        for kind, data in replay.stream_match(team1, team2, seed):
+            yield f"event: {kind}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+        yield "event: done\ndata: {}\n\n"
+
+    response = Response(stream_with_context(events()), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+    # The server closes the response when the stream ends or the client goes away
+    response.call_on_close(live_streams.release)
+    return response
+
+# Routes for MatchSimulator based interactive simulation (no page drives them yet)
+def _store_interactive(key, simulator):
+    interactive_matches.put(key, simulator)
+    session['interactive_match'] = {"id": key, "snapshot": base64.b64encode(simulator.snapshot()).decode('ascii')}
+
+@app.route('/api/interactive', methods=['POST'])
+def start_interactive_match():
+    team1 = request.form.get('selectedTeam1')
+    team2 = request.form.get('selectedTeam2')
+    teams_data = load_teams()
+    if team1 not in teams_data or team2 not in teams_data or team1 == team2:
+        return jsonify({"error": "choose two different teams"}), 400
+    simulator = MatchSimulator(team1, team2, seed=match_random.new_seed())
+    simulator.perform_toss()
+    _store_interactive(interactive_matches.new_key(), simulator)
+    return jsonify({"state": simulator.get_live_state()})
+
+@app.route('/simulate_next_ball', methods=['POST'])
+def simulate_next_ball():
+    """Advances the session's interactive match by one ball; the response size does not grow with the match."""
+    record = session.get('interactive_match')
+    if not record:
+        return jsonify({"error": "no interactive match in progress"}), 404
+    with _busy_matches_lock:
+        if record['id'] in _busy_matches:
+            return jsonify({"error": "the previous ball is still being played"}), 409
+        _busy_matches.add(record['id'])
+    try:
+        simulator = interactive_matches.get(record['id'])
+        if simulator is None:
+            try:
+                simulator = MatchSimulator.from_snapshot(base64.b64decode(record['snapshot']))
+            except (match_snapshot.SnapshotError, ValueError) as e:
+                logging.warning(f"Dropping interactive match that cannot be restored: {e}")
+                session.pop('interactive_match', None)
+                return jsonify({"error": "match can no longer be resumed"}), 410
+        outcome = simulator.simulate_one_ball()
+        _store_interactive(record['id'], simulator)
+        return jsonify({"ball_event": outcome['ball_event'], "state": simulator.get_live_state()})
+    finally:
+        with _busy_matches_lock:
+            _busy_matches.discard(record['id'])
 
-# if __name__ == '__main__':
-#     app.run(debug=True, host='0.0.0.0', port=5000)
+# if __name__ == '__main__':
+#     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,177 @@
+"""Bounded on-disk storage for match artifacts (commentary files, season stats).
+
+Files live under ``root`` in a directory sharded by a hash of their key,
+``<root>/ab/cd/<key>``, so no single directory grows huge. Every write goes
+to a temporary file in the target directory and is renamed into place, so
+readers and other processes never see a half-written file.
+
+``evict()`` removes files older than ``ttl`` seconds, then the oldest files
+until the tree is under ``max_bytes``. It works on whatever is under
+``root``, and tolerates other processes evicting at the same time. Nothing
+runs until the first ``put``: a write starts an eviction on a background
+thread when more than ``max_bytes`` have been written since the last one,
+or when the last one is more than ``evict_interval`` seconds old (so the
+first write of a process sweeps what earlier runs left behind).
+
+``scores()`` is the store behind ``scores/``, where ``mainconnect.game``
+and doipl.py write by default. ``IPL_ARTIFACT_TTL`` (seconds, default one
+day) and ``IPL_ARTIFACT_MAX_BYTES`` (default 64 MB) bound it.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+
+TMP_PREFIX = ".tmp-"
+
+
+def atomic_write(path, data):
+    """Writes ``data`` (str or bytes) to ``path`` through a temporary file and a rename."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=TMP_PREFIX, dir=directory)
+    except FileNotFoundError:  # an evictor removed the empty shard directory in between
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=TMP_PREFIX, dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as fl:
+            fl.write(data.encode("utf-8") if isinstance(data, str) else data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class ArtifactStore:
+
+    def __init__(self, root, max_bytes=64 * 1024 * 1024, ttl=24 * 3600, shard_depth=2, evict_interval=300,
+                 clock=time.time):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.shard_depth = shard_depth
+        self.evict_interval = evict_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._bytes_written = 0  # since the last eviction; triggers an early one past max_bytes
+        self._last_eviction = None
+        self._evictor = None
+
+    def path_for(self, key):
+        if not key or os.sep in key or (os.altsep and os.altsep in key) or key.startswith("."):
+            raise ValueError(f"invalid artifact key {key!r}")
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        shards = [digest[2 * i:2 * i + 2] for i in range(self.shard_depth)]
+        return os.path.join(self.root, *shards, key)
+
+    def put(self, key, data):
+        """Stores ``data`` under ``key`` and returns its path."""
+        path = self.path_for(key)
+        atomic_write(path, data)
+        with self._lock:
+            self._bytes_written += len(data)
+            due = (self._bytes_written > self.max_bytes or self._last_eviction is None
+                   or self._clock() - self._last_eviction >= self.evict_interval)
+            if due and self._evictor is None:
+                self._evictor = threading.Thread(target=self._evict_in_background, name="artifact-eviction",
+                                                 daemon=True)
+                self._evictor.start()
+        return path
+
+    def get(self, key):
+        """Returns the bytes stored under ``key``, or None if missing or expired."""
+        path = self.path_for(key)
+        try:
+            if self._clock() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, "rb") as fl:
+                return fl.read()
+        except FileNotFoundError:
+            return None
+
+    def _files(self):
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, name, stat.st_mtime, stat.st_size
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:  # another process got there first
+            return False
+
+    def evict(self):
+        """Removes expired files, then the oldest ones past ``max_bytes``; returns how many went."""
+        now = self._clock()
+        with self._lock:
+            self._bytes_written = 0
+            self._last_eviction = now
+        removed = 0
+        live = []
+        for path, name, mtime, size in self._files():
+            # Temporary files are only abandoned ones once they are as old as an expired artifact
+            if now - mtime > self.ttl:
+                removed += self._remove(path)
+            elif not name.startswith(TMP_PREFIX):
+                live.append((mtime, size, path))
+        total = sum(size for _, size, _ in live)
+        live.sort()
+        for mtime, size, path in live:
+            if total <= self.max_bytes:
+                break
+            removed += self._remove(path)
+            total -= size
+        self._remove_empty_shards()
+        return removed
+
+    def _remove_empty_shards(self):
+        for dirpath, _, _ in os.walk(self.root, topdown=False):
+            if dirpath != self.root:
+                try:
+                    os.rmdir(dirpath)
+                except OSError:  # not empty, or already gone
+                    pass
+
+    def _evict_in_background(self):
+        try:
+            self.evict()
+        except OSError as e:
+            logging.warning(f"Artifact eviction in {self.root} failed: {e}")
+        finally:
+            with self._lock:
+                self._evictor = None
+
+    def wait_idle(self):
+        """Blocks until an eviction started by ``put`` has finished."""
+        with self._lock:
+            evictor = self._evictor
+        if evictor is not None:
+            evictor.join()
+
+
+_scores = None
+_scores_lock = threading.Lock()
+
+
+def scores():
+    """The shared store for ``scores/`` under the current directory, created on first use."""
+    global _scores
+    with _scores_lock:
+        if _scores is None:
+            _scores = ArtifactStore(os.path.join(os.getcwd(), "scores"),
+                                    max_bytes=int(os.environ.get("IPL_ARTIFACT_MAX_BYTES", 64 * 1024 * 1024)),
+                                    ttl=int(os.environ.get("IPL_ARTIFACT_TTL", 24 * 3600)))
+        return _scores
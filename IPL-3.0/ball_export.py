@@ -0,0 +1,176 @@
+"""Ball-by-ball export to columnar files for analysis with pandas or DuckDB.
+
+Every delivery becomes one row:
+
+    match_id      "<season seed>:<match number>" (league fixtures, then playoffs)
+    stage         "group", "Qualifier 1", ... "Final"
+    innings       1 or 2
+    over, ball    as in the commentary: over 0-19 and the delivery within it,
+                  wides included (an over with a wide has a ball 7)
+    batting_team, bowling_team, batter, bowler
+    runs          off the bat
+    extras        wides
+    dismissal     "caught", "bowled", "runOut", ... or empty
+    fielder       catcher for caught dismissals, else empty
+    score, wickets  the innings total after the ball
+
+``BallRowSink`` is an event sink (see event_sinks) that turns a match's
+"ball" events into rows, so matches can run with ``keep_log=False``.
+``BallExporter`` appends rows to a Parquet, Arrow IPC (Feather) or CSV file,
+picked from the file extension. Rows are buffered and written one row group
+of ``row_group_size`` rows at a time, so an export of any length holds at
+most one row group in memory, and readers can scan the file group by group.
+Parquet and Arrow need pyarrow; CSV needs nothing beyond the standard library.
+
+    python season.py --seed 42 --export balls.parquet
+    python forecast.py --seasons 10000 --export balls.parquet
+"""
+
+import csv
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # CSV export does not need pyarrow
+    pa = None
+
+import event_sinks
+
+COLUMNS = ("match_id", "stage", "innings", "over", "ball", "batting_team", "bowling_team", "batter", "bowler",
+           "runs", "extras", "dismissal", "fielder", "score", "wickets")
+
+FORMATS = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow", ".csv": "csv"}
+
+ROW_GROUP_SIZE = 64 * 1024
+
+
+def _require_pyarrow(fmt):
+    if pa is None:
+        raise ImportError(f"{fmt} export needs pyarrow; install it or export to .csv")
+
+
+def _schema():
+    small = pa.int16()
+    return pa.schema([("match_id", pa.string()), ("stage", pa.string()), ("innings", pa.int8()),
+                      ("over", pa.int8()), ("ball", pa.int8()), ("batting_team", pa.string()),
+                      ("bowling_team", pa.string()), ("batter", pa.string()), ("bowler", pa.string()),
+                      ("runs", small), ("extras", small), ("dismissal", pa.string()), ("fielder", pa.string()),
+                      ("score", small), ("wickets", pa.int8())])
+
+
+class BallRowSink(event_sinks.EventSink):
+    """Collects one match's deliveries in ``rows``: ``COLUMNS`` tuples without match_id and stage."""
+
+    def __init__(self):
+        self.rows = []
+        self._sides = None
+        self._over = None  # (innings, over) of the last delivery
+        self._ball = 0
+
+    def emit(self, kind, payload):
+        if kind == "toss":
+            self._sides = (payload["batting"], payload["bowling"])
+        elif kind == "ball":
+            innings, entry = payload["innings"], payload["ball"]
+            # entry["balls"] counts legal balls including this one
+            over = (entry["balls"] - entry["bowl"][1]) // 6
+            if self._over != (innings, over):
+                self._over, self._ball = (innings, over), 0
+            self._ball += 1
+            batting, bowling = self._sides if innings == 1 else self._sides[::-1]
+            bat = entry["bat"]
+            self.rows.append((innings, over, self._ball, batting, bowling, entry["batsman"], entry["bowler"],
+                              bat[0] if bat else 0, entry["extras"], entry["dismissal"], entry.get("fielder"),
+                              entry["runs"], entry["wickets"]))
+
+
+class RowBuffer(list):
+    """Keeps exported rows in memory behind ``BallExporter``'s interface, e.g. in a worker process."""
+
+    def write_match(self, match_id, stage, rows):
+        self.extend((match_id, stage, *row) for row in rows)
+
+    def write_rows(self, rows):
+        self.extend(rows)
+
+
+class BallExporter:
+    """Writes rows (tuples in ``COLUMNS`` order) to ``path`` one row group at a time.
+
+    Use as a context manager, or call ``close()`` to flush the last group and
+    finish the file.
+    """
+
+    def __init__(self, path, fmt=None, row_group_size=ROW_GROUP_SIZE):
+        if fmt is None:
+            fmt = FORMATS.get(os.path.splitext(path)[1].lower())
+            if fmt is None:
+                raise ValueError(f"cannot tell the export format of {path!r}; use .parquet, .arrow or .csv")
+        if fmt not in ("parquet", "arrow", "csv"):
+            raise ValueError(f"unknown export format {fmt!r}")
+        if fmt != "csv":
+            _require_pyarrow(fmt)
+        self.path = path
+        self.fmt = fmt
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        self._buffer = []
+        self._writer = None
+        self._file = None
+        self._schema = _schema() if fmt != "csv" else None
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if fmt == "parquet":
+            self._writer = pa.parquet.ParquetWriter(path, self._schema)
+        elif fmt == "arrow":
+            self._writer = pa.ipc.new_file(path, self._schema)
+        else:
+            self._file = open(path, "w", newline="", encoding="utf-8")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(COLUMNS)
+
+    def write_match(self, match_id, stage, rows):
+        """Adds one match's ``BallRowSink`` rows."""
+        self.write_rows([(match_id, stage, *row) for row in rows])
+
+    def write_rows(self, rows):
+        self._buffer.extend(rows)
+        while len(self._buffer) >= self.row_group_size:
+            group, self._buffer = self._buffer[:self.row_group_size], self._buffer[self.row_group_size:]
+            self._flush(group)
+
+    def _flush(self, rows):
+        if not rows:
+            return
+        if self.fmt == "csv":
+            self._writer.writerows(rows)
+        else:
+            columns = zip(*rows)
+            batch = pa.RecordBatch.from_arrays([pa.array(column, type=field.type)
+                                                for column, field in zip(columns, self._schema)], schema=self._schema)
+            if self.fmt == "parquet":
+                self._writer.write_batch(batch, row_group_size=len(rows))
+            else:
+                self._writer.write_batch(batch)
+        self.rows_written += len(rows)
+
+    def close(self):
+        if self._writer is None:
+            return
+        try:
+            self._flush(self._buffer)
+            self._buffer = []
+        finally:
+            if self._file is not None:
+                self._file.close()
+            else:
+                self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,100 @@
+"""Compact ball-by-ball log helpers.
+
+Each entry in ``innings1Log``/``innings2Log`` records only the change made by
+that delivery instead of a full copy of both trackers:
+
+    "bat":  [runs, balls, ballLogEntry]          (None when the batter was not charged, e.g. a wide)
+    "bowl": [runs, balls, wickets, ballLogEntry]
+    "extras": runs conceded as extras
+    "dismissal": out type ("caught", "runOut", ...) or None
+    "fielder": catcher's initials (caught dismissals only)
+
+The batter and bowler the delta applies to are the entry's existing
+``batsman`` and ``bowler`` fields. Tracker state at any ball is rebuilt on
+demand from these deltas.
+
+A dismissed batter's tracker also gets a structured ``dismissal`` (see
+``dismissal_record``) so scorecards never have to parse ballLog strings, and
+every batter who came in gets an ``arrival`` number (1 and 2 for the
+openers); rebuilt trackers take it from the entries' ``batter1``/``batter2``.
+"""
+
+
+def ball_delta(bowl_runs, bowl_balls, bowl_wickets, bowl_entry, bat_runs=0, bat_balls=0, bat_entry=None, extras=0, dismissal=None, fielder=None):
+    """Builds the delta fields merged into a log entry for one delivery."""
+    bat = None
+    if bat_entry is not None:
+        bat = [bat_runs, bat_balls, bat_entry]
+    delta = {"bat": bat, "bowl": [bowl_runs, bowl_balls, bowl_wickets, bowl_entry],
+             "extras": extras, "dismissal": dismissal}
+    if fielder is not None:
+        delta["fielder"] = fielder
+    return delta
+
+
+def dismissal_record(out_type, ball, bowler=None, fielder=None):
+    """The ``dismissal`` stored on a batter's tracker: how, on which ball, and who gets the credit.
+
+    ``bowler`` is None for run outs, which are not credited to the bowler.
+    """
+    return {"type": out_type, "ball": ball, "bowler": bowler, "fielder": fielder}
+
+
+def empty_trackers(bat_tracker, bowl_tracker):
+    """Returns fresh (batterTracker, bowlerTracker) with the same players and order as the given trackers."""
+    batters = {name: {'playerInitials': name, 'balls': 0, 'runs': 0, 'ballLog': [], 'dismissal': None, 'arrival': None}
+               for name in bat_tracker}
+    bowlers = {name: {'playerInitials': name, 'balls': 0, 'runs': 0, 'ballLog': [], 'overs': 0, 'wickets': 0}
+               for name in bowl_tracker}
+    return batters, bowlers
+
+
+def apply_delta(entry, batters, bowlers):
+    """Applies one log entry's delta to the trackers in place."""
+    for name in (entry.get('batter1'), entry.get('batter2')):
+        stats = batters.get(name)
+        if stats is not None and stats.get('arrival') is None:
+            stats['arrival'] = 1 + sum(1 for other in batters.values() if other.get('arrival') is not None)
+    bat = entry.get("bat")
+    if bat is not None:
+        stats = batters.setdefault(entry['batsman'], {'playerInitials': entry['batsman'], 'balls': 0, 'runs': 0,
+                                                      'ballLog': [], 'dismissal': None, 'arrival': None})
+        stats['runs'] += bat[0]
+        stats['balls'] += bat[1]
+        stats['ballLog'].append(bat[2])
+        out_type = entry.get("dismissal")
+        if out_type is not None:
+            stats['dismissal'] = dismissal_record(out_type, entry['balls'], None if out_type == "runOut" else entry['bowler'],
+                                                  entry.get("fielder"))
+    bowl = entry["bowl"]
+    stats = bowlers.setdefault(entry['bowler'], {'playerInitials': entry['bowler'], 'balls': 0, 'runs': 0,
+                                                 'ballLog': [], 'overs': 0, 'wickets': 0})
+    stats['runs'] += bowl[0]
+    stats['balls'] += bowl[1]
+    stats['wickets'] += bowl[2]
+    stats['ballLog'].append(bowl[3])
+
+
+def iter_trackers(log, bat_tracker, bowl_tracker):
+    """Yields (entry, batterTracker, bowlerTracker) after each ball.
+
+    The same tracker dicts are updated and yielded every time, so copy them
+    if a snapshot has to outlive the next iteration.
+    """
+    batters, bowlers = empty_trackers(bat_tracker, bowl_tracker)
+    for entry in log:
+        apply_delta(entry, batters, bowlers)
+        yield entry, batters, bowlers
+
+
+def trackers_at(log, index, bat_tracker, bowl_tracker):
+    """Rebuilds (batterTracker, bowlerTracker) as they stood after ``log[index]``.
+
+    ``bat_tracker``/``bowl_tracker`` are the innings' final trackers and only
+    supply the player list and order. A negative index gives the state before
+    the first ball.
+    """
+    batters, bowlers = empty_trackers(bat_tracker, bowl_tracker)
+    for entry in log[:index + 1] if index >= 0 else []:
+        apply_delta(entry, batters, bowlers)
+    return batters, bowlers
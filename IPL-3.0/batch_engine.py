@@ -0,0 +1,405 @@
+"""Vectorized bulk match engine (requires NumPy).
+
+Simulates K matches of one fixture at once: every step draws the next ball
+for all unfinished innings from arrays instead of dicts, and no ball log,
+commentary or scorecard is produced. Meant for aggregate-only Monte Carlo
+work (``monte_carlo.simulate_many(..., engine="batch")``); the per-ball
+engine in mainconnect stays the reference for anything that needs a log.
+
+The ball model follows ``delivery()`` in mainconnect: the batter/bowler
+average of the compiled run and out tables, the innings' pitch effect, the
+batter form, "last 10" and run-rate adjustments, the phase adjustments
+(``balls < 12``, ``< 36``, ``< 102``) and, in the chase, the required-rate
+adjustments from ``innings2``. Two parts are simplified:
+
+* bowlers are picked per over from the same seven bowlers, weighted by their
+  ``overNumbersObject`` for that over (at most four overs each, never two in
+  a row), instead of mainconnect's hand-written phase picks;
+* negative run weights after adjustment count as zero, where mainconnect
+  would occasionally let a ball fall through every bucket.
+"""
+
+import hashlib
+import numbers
+
+try:
+    import numpy as np
+except ImportError:  # the per-ball engine does not need NumPy
+    np = None
+
+import player_model
+import team_registry
+
+DENOMS = ("0", "1", "2", "3", "4", "5", "6")
+OUT_TYPES = ("caught", "runOut", "bowled", "lbw", "hitwicket", "stumped")
+RUN_OUT = OUT_TYPES.index("runOut")
+
+# (bowlOutsRate, '0', '1', '4', '6') multipliers of the pitch effect in each innings
+PITCH_EFFECT = {1: (0.25, 0.25, 0.25, 0.38, 0.3), 2: (0.22, 0.18, 0.22, 0.4, 0.3)}
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("batch_engine needs NumPy; install it or use the per-ball engine in mainconnect")
+
+
+def seed_entropy(seed):
+    """Turns a seed (or a list of seed parts) into entropy NumPy accepts.
+
+    Non-negative ints are used as they are; anything else (strings, negative
+    ints) is replaced by 64 bits of its SHA-256 digest, so the string seeds the
+    per-ball engine takes work here too and give the same stream in any process.
+    """
+    if seed is None:
+        return None
+    if isinstance(seed, (list, tuple)):
+        parts = []
+        for part in seed:
+            entropy = seed_entropy(part)
+            parts.extend(entropy if isinstance(entropy, list) else [entropy])
+        return parts
+    if isinstance(seed, numbers.Integral) and not isinstance(seed, bool) and seed >= 0:
+        return int(seed)
+    return int.from_bytes(hashlib.sha256(str(seed).encode("utf-8")).digest()[:8], "big")
+
+
+def _w(**weights):
+    """Run-denomination weight vector, e.g. _w(d0=-1/2, d4=1/2)."""
+    vec = np.zeros(len(DENOMS))
+    for key, value in weights.items():
+        vec[DENOMS.index(key[1:])] = value
+    return vec
+
+
+class _Side:
+    """Array form of one team's compiled players, ordered like mainconnect orders them."""
+
+    def __init__(self, team_code):
+        names = team_registry.get_team(team_code)['players']
+        compiled = player_model.get_players(names)
+        players = [compiled[p] for p in names]
+
+        batting = sorted(players, key=lambda k: k['posAvg'])
+        self.bat_names = [p['playerInitials'] for p in batting]
+        self.bat_den = np.array([[p['batRunDenominationsObject'].get(d, 0.0) for d in DENOMS] for p in batting])
+        self.bat_out = np.array([p['batOutsRate'] for p in batting])
+        self.bat_out_types = np.array([[p['batOutTypesObject'].get(t, 0.0) for t in OUT_TYPES] for p in batting])
+        self.run_out = np.array([p['runOutRate'] if p['batOutsTotal'] != 0 else 0.01 for p in batting])
+
+        bowling = sorted(players, key=lambda k: k['bowlOutsRate'])
+        bowling.reverse()
+        bowling = bowling[0:7]
+        self.bowl_names = [p['playerInitials'] for p in bowling]
+        self.bowl_den = np.array([[p['bowlRunDenominationsObject'].get(d, 0.0) for d in DENOMS] for p in bowling])
+        self.bowl_out = np.array([p['bowlOutsRate'] for p in bowling])
+        self.bowl_out_types = np.array([[p['bowlOutTypesObject'].get(t, 0.0) for t in OUT_TYPES] for p in bowling])
+        self.wide = np.array([p['bowlWideRate'] for p in bowling])
+        self.over_weights = np.clip(np.array([[p['overNumbersObject'][str(o)] for p in bowling] for o in range(1, 21)]),
+                                    0.0, None) + 1e-3
+
+
+def _pitch(rng, k, typeOfPitch):
+    """Per-match spin factor, mirroring mainconnect.pitchInfo (only spin feeds the innings)."""
+    spin = 1 + 0.5 * (rng.random(k) * (rng.random(k) - rng.random(k)))
+    if typeOfPitch == "dusty":
+        spin -= rng.uniform(0.1, 0.16, k)
+    return spin
+
+
+def _toss(rng, k, typeOfPitch):
+    """True where team1 bats first, mirroring mainconnect.doToss with pitchDetoriate set."""
+    battingLikely = 0.45 + rng.uniform(0.09, 0.2, k)
+    if typeOfPitch == "dead":
+        battingLikely -= rng.uniform(0.05, 0.15, k)
+    elif typeOfPitch == "green":
+        battingLikely += rng.uniform(0.05, 0.15, k)
+    elif typeOfPitch == "dusty":
+        battingLikely += rng.uniform(0.04, 0.1, k)
+    team1Won = rng.integers(0, 2, k) == 0
+    chooseBat = rng.random(k) <= battingLikely
+    return team1Won == chooseBat
+
+
+class _Adjuster:
+    """Applies ``den += u * weights`` / ``out += delta`` to the rows selected by a mask."""
+
+    def __init__(self, rng, den, out):
+        self.rng, self.den, self.out = rng, den, out
+
+    def __call__(self, mask, low, high, weights, out_delta=0.0):
+        if not mask.any():
+            return
+        # Same formula as random.uniform, which also accepts low > high. Adding
+        # zero to unselected rows is cheaper than boolean-indexing the 2-D table.
+        u = (low + (high - low) * self.rng.random(len(mask))) * mask
+        self.den += u[:, None] * weights
+        if out_delta:
+            self.out += out_delta * mask
+
+
+def simulate_innings(rng, bat, bowl, spin, innings, target=None):
+    """Simulates one innings for every row of ``spin`` (K matches) and returns its arrays.
+
+    ``bat``/``bowl`` are ``_Side`` objects, ``spin`` the per-match spin
+    factor and ``target`` (innings 2 only) the per-match target.
+    """
+    k = len(spin)
+    effect = (1.0 - spin) / 2
+    pe = PITCH_EFFECT[innings]
+    pitch_den = _w(d0=pe[1], d1=pe[2], d4=-pe[3], d6=-pe[4])
+
+    runs = np.zeros(k, dtype=np.int64)
+    balls = np.zeros(k, dtype=np.int64)
+    wickets = np.zeros(k, dtype=np.int64)
+    marks = np.zeros(k, dtype=np.int64)      # wickets + wides: the "W" entries mainconnect counts in ballLog
+    striker = np.zeros(k, dtype=np.int64)
+    nonstriker = np.ones(k, dtype=np.int64)
+    next_in = np.full(k, 2, dtype=np.int64)
+    bat_runs = np.zeros((k, len(bat.bat_names)), dtype=np.int64)
+    bat_balls = np.zeros((k, len(bat.bat_names)), dtype=np.int64)
+    nb = len(bowl.bowl_names)
+    bowl_balls = np.zeros((k, nb), dtype=np.int64)
+    bowl_runs = np.zeros((k, nb), dtype=np.int64)
+    bowl_wkts = np.zeros((k, nb), dtype=np.int64)
+    bowler = np.full(k, -1, dtype=np.int64)
+    last_bowler = np.full(k, -1, dtype=np.int64)
+    current_over = np.full(k, -1, dtype=np.int64)
+    active = np.ones(k, dtype=bool)
+    rows_all = np.arange(k)
+
+    while active.any():
+        # New over: swap ends and pick a bowler for the matches that just completed one
+        over = balls // 6
+        change = active & (over != current_over)
+        if change.any():
+            rows = rows_all[change]
+            swap = rows[current_over[rows] >= 0]
+            striker[swap], nonstriker[swap] = nonstriker[swap], striker[swap].copy()
+            last_bowler[rows] = bowler[rows]
+            weights = bowl.over_weights[over[rows]].copy()
+            weights[bowl_balls[rows] >= 24] = 0.0
+            weights[np.arange(len(rows)), np.clip(last_bowler[rows], 0, None)] *= (last_bowler[rows] < 0)
+            empty = weights.sum(axis=1) == 0
+            weights[empty] = 1.0
+            cum = weights.cumsum(axis=1)
+            pick = (cum < rng.random(len(rows))[:, None] * cum[:, -1:]).sum(axis=1)
+            bowler[rows] = np.minimum(pick, nb - 1)
+            current_over[rows] = over[rows]
+
+        rows = rows_all[active]
+        n = len(rows)
+        s = striker[rows]
+        b = bowler[rows]
+        r = runs[rows]
+        bl = balls[rows]
+        wk = wickets[rows]
+        sb = bat_balls[rows, s]
+        sr = bat_runs[rows, s] / np.maximum(sb, 1)
+
+        eff = effect[rows]
+        den = (bat.bat_den[s] + bowl.bowl_den[b] + eff[:, None] * pitch_den) / 2
+        out = (bat.bat_out[s] + bowl.bowl_out[b] + eff * pe[0]) / 2
+        adjust = _Adjuster(rng, den, out)
+
+        # Recent form ("last 10" in mainconnect counts every wicket and wide so far)
+        early = bl < 105
+        few = marks[rows] < 2
+        adjust(early & few, 0.02, 0.04, _w(d0=-1/2, d1=-1/2, d2=1/2, d4=1/2))
+        adjust(early & ~few, 0.038, 0.058, _w(d0=2/2, d4=-1/2, d6=-1/2), -0.02)
+
+        # Batter settling in / getting stuck
+        new_bat = (sb < 8) & (bl < 80)
+        adjust(new_bat, -0.01, 0.03, _w(d0=1.5/3, d1=1/3, d2=0.5/3, d4=-0.5/3, d6=-1.5/3), -0.015)
+        adjust((sb > 15) & (sb < 30), 0.03, 0.07, _w(d0=-1/3, d4=1/3))
+        adjust((sb > 20) & (sr < 110), 0.05, 0.08, _w(d0=1.5/3, d1=0.5/3, d6=2/3), 0.05)
+        if innings == 1:
+            adjust((sb > 40) & (sr < 120), 0.06, 0.09, _w(d0=1.2/3, d1=0.7/3, d6=1.8/3), 0.04)
+            adjust((sb > 30) & (sr > 145) & (wk < 5) | (bl > 102), 0.06, 0.09,
+                   _w(d0=-1/3, d1=-1.5/3, d4=1.6/3, d6=1.9/3))
+            rate = r / np.maximum(bl, 1)
+            slow_death = (bl > 105) & (rate < 1.17)
+            adjust(slow_death, 0.06, 0.09, _w(d0=1.2/3, d1=-1.6/3, d4=1.4/3, d6=2.1/3), 0.03)
+            adjust(~slow_death & (bl > 60) & (rate < 1.1), 0.06, 0.09, _w(d0=-1.2/3, d1=-0.8/3, d4=1/3, d6=1/3), 0.02)
+            _phase_innings1(rng, adjust, den, out, bl, wk)
+        else:
+            adjust((sb > 40) & (sr < 135), 0.06, 0.09, _w(d0=1.5/3, d1=0.7/3, d6=1.8/3), 0.04)
+            adjust((sb > 30) & (sr > 145) & (wk < 5) | (bl > 102), 0.06, 0.09,
+                   _w(d0=-1/3, d1=-1.5/3, d4=1.6/3, d6=1.9/3), 0.02)
+            rrr = (target[rows] - r) / (120 - bl)
+            _phase_innings2(rng, adjust, den, out, bl, wk, rrr)
+
+        # Outcome, as in getOutcome(): wide, else a run denomination, and a dot may be a wicket
+        wide = bowl.wide[b] > rng.random(n)
+        den = np.clip(den, 0.0, None)
+        total = den.sum(axis=1)
+        cum = den.cumsum(axis=1)
+        denom = np.minimum((cum <= (rng.random(n) * total)[:, None]).sum(axis=1), len(DENOMS) - 1)
+        ball_runs = denom.copy()
+        dot = ~wide & (denom == 0)
+        prob_out = out * total / np.where(den[:, 0] > 0, den[:, 0], np.inf)
+        is_out = dot & (prob_out > rng.random(n))
+
+        out_types = (bat.bat_out_types[s] + bowl.bowl_out_types[b]) / 2
+        out_types[:, RUN_OUT] = bat.run_out[s]
+        ocum = out_types.cumsum(axis=1)
+        otype = np.minimum((ocum <= (rng.random(n) * ocum[:, -1])[:, None]).sum(axis=1), len(OUT_TYPES) - 1)
+        run_out = is_out & (otype == RUN_OUT)
+        ball_runs[run_out] = rng.integers(0, 3, int(run_out.sum()))
+        ball_runs[wide] = 0
+
+        legal = ~wide
+        runs[rows] += ball_runs + wide
+        balls[rows] += legal
+        marks[rows] += wide + is_out
+        bat_runs[rows, s] += ball_runs
+        bat_balls[rows, s] += legal
+        bowl_runs[rows, b] += ball_runs + wide
+        bowl_balls[rows, b] += legal
+        bowl_wkts[rows, b] += is_out & ~run_out
+        wickets[rows] += is_out
+
+        # Strike: odd runs off the bat swap ends, a new batter takes strike after a wicket
+        swap = legal & ~is_out & (ball_runs % 2 == 1)
+        sw = rows[swap]
+        striker[sw], nonstriker[sw] = nonstriker[sw], striker[sw].copy()
+        gone = rows[is_out & (wickets[rows] < 10)]
+        striker[gone] = next_in[gone]
+        next_in[gone] += 1
+
+        done = (balls >= 120) | (wickets >= 10)
+        if target is not None:
+            done |= runs >= target
+        active &= ~done
+
+    return {"runs": runs, "wickets": wickets, "balls": balls, "bat_runs": bat_runs, "bat_balls": bat_balls,
+            "bowl_wickets": bowl_wkts, "bowl_balls": bowl_balls}
+
+
+def _phase_innings1(rng, adjust, den, out, bl, wk):
+    pp = bl < 12
+    if pp.any():
+        out[pp] = np.where(out[pp] < 0.07, 0.0, out[pp] - 0.07)
+        six = np.minimum(rng.uniform(0.02, 0.05, int(pp.sum())), den[pp, 6])
+        den[pp] += six[:, None] * _w(d6=-1, d0=1/3, d1=2/3)
+    mid = (bl >= 12) & (bl < 36)
+    adjust(mid & (wk == 0), 0.05, 0.11, _w(d0=-2/3, d1=-1/3, d4=2/3, d6=1/3))
+    adjust(mid & (wk != 0), 0.02, 0.08, _w(d0=-2/3, d1=-1/3, d4=2.5/3, d6=0.5/3), -0.03)
+    middle = (bl >= 36) & (bl < 102)
+    adjust(middle & (wk < 3), 0.05, 0.11, _w(d0=-1.5/3, d1=-1/3, d4=1.5/3, d6=1/3))
+    adjust(middle & (wk >= 3), 0.02, 0.07, _w(d0=-1.6/3, d1=-1.2/3, d4=2.1/3, d6=0.9/3), -0.03)
+    death = bl >= 102
+    adjust(death & (wk < 7), 0.07, 0.1, _w(d0=-0.4/3, d1=-1/3, d4=1.4/3, d6=1.8/3), 0.01)
+    adjust(death & (wk >= 7), 0.07, 0.09, _w(d0=-0.4/3, d1=-1.8/3, d4=1.5/3, d6=1.5/3), 0.01)
+
+
+def _phase_innings2(rng, adjust, den, out, bl, wk, rrr):
+    rrro = rrr * 6
+    pp = (bl < 12) & (rrr < 1.5)
+    if pp.any():
+        out[pp] = np.where(out[pp] < 0.07, 0.0, out[pp] - 0.07)
+        six = np.minimum(rng.uniform(0.02, 0.05, int(pp.sum())), den[pp, 6])
+        den[pp] += six[:, None] * _w(d6=-1, d0=1/3, d1=2/3)
+
+    early = (bl >= 12) & (bl < 36)
+    adjust(early & (rrro < 8), 0.05, 0.09, _w(d6=-2/3, d4=-1/3, d1=1), -0.04)
+    adjust(early & (rrro >= 8) & (rrro <= 10.4), 0.04, 0.08, _w(d6=0.6/3, d4=1/3, d0=1/3, d1=-1/3, d2=-0.6/3), -0.03)
+    hot = early & (rrro > 10.4)
+    if hot.any():
+        u = rng.uniform(0.04, 0.08, int(hot.sum())) + (rrro[hot] * 1.1) / 1000
+        den[hot] += u[:, None] * _w(d6=1.5/3, d4=1/3, d0=0.5/3, d1=-2/3, d2=-1/3)
+        out[hot] += 0.02 + (rrro[hot] * 1.1) / 1000
+
+    mid = (bl >= 36) & (bl < 102)
+    lo = wk < 3
+    easy = mid & (rrro < 8)
+    adjust(easy & lo, 0.05, 0.09, _w(d6=-0.8/3, d0=-1/3, d2=1/3, d1=1.5/3), -0.02)
+    adjust(easy & ~lo, 0.05, 0.09, _w(d1=1), -0.04)
+    par = mid & (rrro >= 8) & (rrro <= 10.4)
+    adjust(par & lo, 0.6, 0.08, _w(d6=1/3, d4=1.15/3, d0=0.1/3, d1=-1/3, d2=-1/3), 0.015)
+    adjust(par & ~lo, 0.04, 0.08, _w(d6=0.95/3, d4=1.12/3, d0=0.2/3, d1=-0.9/3, d2=-0.7/3), 0.01)
+    up = mid & (rrro > 10.4) & (rrro < 12)
+    adjust(up & lo, 0.075, 0.1, _w(d6=1.5/3, d4=1.5/3, d0=0.5/3, d1=-1.5/3, d2=-1.5/3, d3=-0.7/3), 0.025)
+    adjust(up & ~lo, 0.06, 0.1, _w(d6=1.4/3, d4=1/3, d0=0.6/3, d1=-1.1/3, d2=-1.1/3, d3=-0.7/3), 0.035)
+    steep = mid & (rrro >= 12) & (rrro <= 15)
+    late = bl > 85
+    adjust(steep & late & lo, 0.065, 0.115, _w(d6=1.5/3, d4=1.2/3, d0=1.4/3, d1=-1.2/3, d2=-1.7/3, d3=-0.9/3), 0.04)
+    adjust(steep & late & ~lo, 0.05, 0.1, _w(d6=1.2/3, d4=0.8/3, d0=1.2/3, d1=-1.2/3, d2=-1.6/3, d3=-0.9/3), 0.05)
+    adjust(steep & ~late, 0.05, 0.1, _w(d6=1.3/3, d4=1/3, d0=1.2/3, d1=-1.2/3, d2=-1.6/3, d3=-0.9/3), 0.03)
+    gone = mid & (rrro > 15)
+    adjust(gone & lo, 0.075, 0.125, _w(d6=2/3, d4=1.5/3, d0=1.8/3, d1=-1.2/3, d2=-1.6/3, d3=-0.9/3), 0.05)
+    adjust(gone & ~lo, 0.07, 0.12, _w(d6=1.8/3, d4=1.5/3, d0=1.8/3, d1=-1.6/3, d2=-1.7/3, d3=-0.9/3), 0.04)
+
+    death = bl >= 102
+    attack = (wk < 7) | (rrro > 12)
+    adjust(death & attack, 0.07, 0.1, _w(d0=1.8/3, d1=-1/3, d4=1.45/3, d6=1.85/3), 0.032)
+    adjust(death & ~attack, 0.07, 0.09, _w(d0=-1.2/3, d1=-1.8/3, d4=1.5/3, d6=1.5/3), 0.028)
+
+
+def simulate_batch(team1, team2, k, seed=None, typeOfPitch="dusty"):
+    """Simulates ``k`` matches of ``team1`` v ``team2`` and returns per-match arrays.
+
+    The result holds ``team1_bats_first`` (bool), ``winner`` (0 = team1,
+    1 = team2, 2 = tie), and for ``innings1``/``innings2`` the arrays from
+    ``simulate_innings`` plus ``bat_team``/``bat_names``/``bowl_names`` for
+    each group of matches with the same batting order. ``seed`` may be an int,
+    a string or a list of either (see ``seed_entropy``).
+    """
+    _require_numpy()
+    team1, team2 = team1.lower(), team2.lower()
+    rng = np.random.default_rng(seed_entropy(seed))
+    sides = {team1: _Side(team1), team2: _Side(team2)}
+    spin = _pitch(rng, k, typeOfPitch)
+    team1_first = _toss(rng, k, typeOfPitch)
+
+    winner = np.empty(k, dtype=np.int64)
+    groups = []
+    for first, second, rows in ((team1, team2, np.flatnonzero(team1_first)),
+                                (team2, team1, np.flatnonzero(~team1_first))):
+        if len(rows) == 0:
+            continue
+        inn1 = simulate_innings(rng, sides[first], sides[second], spin[rows], 1)
+        inn2 = simulate_innings(rng, sides[second], sides[first], spin[rows], 2, target=inn1["runs"] + 1)
+        first_idx = 0 if first == team1 else 1
+        won = np.where(inn2["runs"] > inn1["runs"], 1 - first_idx, first_idx)
+        winner[rows] = np.where(inn2["runs"] == inn1["runs"], 2, won)
+        groups.append({"rows": rows, "batting_first": first, "innings1": inn1, "innings2": inn2,
+                       "bat_names": (sides[first].bat_names, sides[second].bat_names),
+                       "bowl_names": (sides[second].bowl_names, sides[first].bowl_names)})
+    return {"team1": team1, "team2": team2, "team1_bats_first": team1_first, "winner": winner, "groups": groups}
+
+
+def _counts(values):
+    uniq, counts = np.unique(values, return_counts=True)
+    return dict(zip(uniq.tolist(), counts.tolist()))
+
+
+def aggregate(result):
+    """Reduces ``simulate_batch`` output to the {value: count} aggregate used by monte_carlo.merge."""
+    team1, team2 = result["team1"], result["team2"]
+    names = (team1, team2, "tie")
+    agg = {"matches": len(result["winner"]),
+           "wins": {names[code]: count for code, count in _counts(result["winner"]).items()},
+           "scores": {team1: {}, team2: {}}, "wickets": {team1: {}, team2: {}},
+           "margins": {"runs": {}, "wickets": {}}, "player_runs": {}, "player_wickets": {}}
+
+    def add(target, counts):
+        for value, count in counts.items():
+            target[value] = target.get(value, 0) + count
+
+    for group in result["groups"]:
+        first = group["batting_first"]
+        teams = (first, team2 if first == team1 else team1)
+        for i, inn in enumerate(("innings1", "innings2")):
+            arrays = group[inn]
+            add(agg["scores"][teams[i]], _counts(arrays["runs"]))
+            add(agg["wickets"][teams[i]], _counts(arrays["wickets"]))
+            for j, name in enumerate(group["bat_names"][i]):
+                played = arrays["bat_balls"][:, j] > 0
+                add(agg["player_runs"].setdefault(name, {}), _counts(arrays["bat_runs"][played, j]))
+            for j, name in enumerate(group["bowl_names"][i]):
+                bowled = arrays["bowl_balls"][:, j] > 0
+                add(agg["player_wickets"].setdefault(name, {}), _counts(arrays["bowl_wickets"][bowled, j]))
+        runs1, runs2 = group["innings1"]["runs"], group["innings2"]["runs"]
+        add(agg["margins"]["wickets"], _counts(10 - group["innings2"]["wickets"][runs2 > runs1]))
+        add(agg["margins"]["runs"], _counts((runs1 - runs2)[runs1 > runs2]))
+    return agg
@@ -1,31 +1,29 @@
 import os
-import sys
-import random
 from mainconnect import game
+from match_random import MatchRandom
+import scorecard
+import artifact_store
+from player_stats import SeasonStats, batting_average, economy, strike_rate
+from points_table import PointsTable
 from tabulate import tabulate
-import copy
 
-# Ensure scores directory exists
-dir_path = os.path.join(os.getcwd(), "scores")
-os.makedirs(dir_path, exist_ok=True)
-
-# Clean scores folder before starting
-for f in os.listdir(dir_path):
-    os.remove(os.path.join(dir_path, f))
+# Commentary and stats go to the scores/ artifact store, which expires old files
+# and caps its size, so earlier seasons no longer need clearing out first
+scores = artifact_store.scores()
 
 teams = ['dc', 'csk', 'rcb', 'mi', 'kkr', 'pbks', 'rr', 'srh']
-points = {}
-battingInfo = {}
-bowlingInfo = {}
-
-# Initialize points table
-for team in teams:
-    points[team] = {
-        "P": 0, "W": 0, "L": 0, "T": 0,
-        "runsScored": 0, "ballsFaced": 0,
-        "runsConceded": 0, "ballsBowled": 0,
-        "pts": 0
-    }
+
+# One seed drives the whole season: every match gets a seed derived from it,
+# and commentary lines come from their own stream so they never shift results.
+# Set IPL_SEASON_SEED to replay a season.
+season = MatchRandom(os.environ.get("IPL_SEASON_SEED"))
+print(f"Season seed: {season.seed}")
+commentary = season.commentary
+# Fixed-size per-player season totals; each match's ballLogs are read once and dropped
+playerStats = SeasonStats()
+
+# Points table: net run rate and standings are updated as each result is recorded
+points = PointsTable(teams)
 
 battingf = 0
 bowlingf = 0
@@ -91,36 +89,25 @@ commentary_lines = {
 
 def display_points_table():
     pointsTabulate = []
-    for team in points:
+    for team in points.standings():
         data = points[team]
-        nrr = 0
-        if data['ballsFaced'] > 0 and data['ballsBowled'] > 0:
-            nrr = (data['runsScored'] / data['ballsFaced']) * 6 - (data['runsConceded'] / data['ballsBowled']) * 6
-        row = [team.upper(), data['P'], data['W'], data['L'], data['T'], round(nrr, 2), data['pts']]
-        pointsTabulate.append(row)
-    pointsTabulate = sorted(pointsTabulate, key=lambda x: (x[6], x[5]), reverse=True)
+        pointsTabulate.append([team.upper(), data['P'], data['W'], data['L'], data['T'], round(data['nrr'], 2), data['pts']])
     print("\nCurrent Points Table:")
     print(tabulate(pointsTabulate, headers=["Team", "Played", "Won", "Lost", "Tied", "NRR", "Points"], tablefmt="grid"))
 
 def display_top_players():
     battingTabulate = []
-    for b in battingInfo:
-        c = battingInfo[b]
-        outs = sum(1 for bl in c['ballLog'] if "W" in bl)
-        avg = round(c['runs'] / outs, 2) if outs else float('inf')
-        sr = round((c['runs'] / c['balls']) * 100, 2) if c['balls'] else 0
-        battingTabulate.append([b, c['runs'], avg, sr])
-    battingTabulate = sorted(battingTabulate, key=lambda x: x[1], reverse=True)[:3]
+    for b, c in playerStats.top_batters(3):
+        avg, sr = batting_average(c), strike_rate(c)
+        battingTabulate.append([b, c['runs'], float('inf') if avg is None else round(avg, 2), 0 if sr is None else round(sr, 2)])
     
     print("\nTop 3 Batsmen:")
     print(tabulate(battingTabulate, headers=["Player", "Runs", "Average", "Strike Rate"], tablefmt="grid"))
 
     bowlingTabulate = []
-    for b in bowlingInfo:
-        c = bowlingInfo[b]
-        economy = round((c['runs'] / c['balls']) * 6, 2) if c['balls'] else float('inf')
-        bowlingTabulate.append([b, c['wickets'], economy])
-    bowlingTabulate = sorted(bowlingTabulate, key=lambda x: x[1], reverse=True)[:3]
+    for b, c in playerStats.top_bowlers(3):
+        econ = economy(c)
+        bowlingTabulate.append([b, c['wickets'], float('inf') if econ is None else round(econ, 2)])
     
     print("\nTop 3 Bowlers:")
     print(tabulate(bowlingTabulate, headers=["Player", "Wickets", "Economy"], tablefmt="grid"))
@@ -129,47 +116,21 @@ def display_scorecard(bat_tracker, bowl_tracker, team_name, innings_num):
     print(f"\n--- {team_name.upper()} Scorecard: Innings {innings_num} ---")
     
     # Batting Scorecard
+    battingCard, _ = scorecard.batting_card(bat_tracker)
     batsmanTabulate = []
-    for player in bat_tracker:
-        data = bat_tracker[player]
-        runs = data['runs']
-        balls = data['balls']
-        sr = round((runs / balls) * 100, 2) if balls else 'NA'
-        how_out = "DNB"
-        batted = False
-        for log in data['ballLog']:
-            batted = True
-            if "W" in log:
-                if "CaughtBy" in log:
-                    split_log = log.split("-")
-                    catcher = split_log[2]
-                    bowler = split_log[-1]
-                    how_out = f"c {catcher} b {bowler}"
-                elif "runout" in log:
-                    how_out = "Run out"
-                else:
-                    split_log = log.split("-")
-                    out_type = split_log[1]
-                    bowler = split_log[-1]
-                    how_out = f"{out_type} b {bowler}"
-            else:
-                how_out = "Not out" if balls > 0 else "DNB"
-        if batted or balls > 0:
-            batsmanTabulate.append([player, runs, balls, sr, how_out])
+    for player, row in battingCard.items():
+        if row['how_out'] != "DNB":
+            sr = row['strike_rate'] if row['strike_rate'] is not None else 'NA'
+            batsmanTabulate.append([player, row['runs'], row['balls'], sr, row['how_out']])
     
     print("\nBatting:")
     print(tabulate(batsmanTabulate, headers=["Player", "Runs", "Balls", "SR", "How Out"], tablefmt="grid"))
 
     # Bowling Scorecard
     bowlerTabulate = []
-    for player in bowl_tracker:
-        data = bowl_tracker[player]
-        runs = data['runs']
-        balls = data['balls']
-        wickets = data['wickets']
-        overs = f"{balls // 6}.{balls % 6}" if balls else "0.0"
-        economy = round((runs / balls) * 6, 2) if balls else 'NA'
-        bowlerTabulate.append([player, overs, runs, wickets, economy])
+    for player, row in scorecard.bowling_card(bowl_tracker).items():
+        economy = row['economy'] if row['economy'] is not None else 'NA'
+        bowlerTabulate.append([player, row['overs'], row['runs'], row['wickets'], economy])
     
     print("\nBowling:")
     print(tabulate(bowlerTabulate, headers=["Player", "Overs", "Runs", "Wickets", "Economy"], tablefmt="grid"))
@@ -179,10 +140,10 @@ def display_ball_by_ball(innings_log, innings_num, team_name, runs, balls, wicke
     for event in innings_log:
         outcome = event['event'].split()[-2]  # Extract outcome (e.g., '4', 'W', 'Wide')
         commentary_key = outcome if outcome in commentary_lines else ('wicket' if 'W' in outcome else '0')
-        print(f"Ball {event['balls']}: {event['event']} - {random.choice(commentary_lines[commentary_key])}")
+        print(f"Ball {event['balls']}: {event['event']} - {commentary.choice(commentary_lines[commentary_key])}")
     overs = f"{balls // 6}.{balls % 6}"
     print(f"\nInnings Total: {runs}/{wickets} in {overs} overs")
-    print(random.choice(commentary_lines['innings_end']))
+    print(commentary.choice(commentary_lines['innings_end']))
     
     # Display scorecard after innings
     display_scorecard(bat_tracker, bowl_tracker, team_name, innings_num)
@@ -196,9 +157,9 @@ for i in range(len(teams)):
         try:
             input("Press Enter to start the match...")
             
-            print(random.choice(commentary_lines['start']))
+            print(commentary.choice(commentary_lines['start']))
             
-            resList = game(False, team1, team2)
+            resList = game(False, team1, team2, seed=season.child_seed(team1, team2, "group"))
 
             # Display ball-by-ball and innings summary for both innings
             for innings, team_key, runs_key, balls_key, bat_tracker_key, bowl_tracker_key in [
@@ -217,7 +178,7 @@ for i in range(len(teams)):
                 )
 
             print(f"\nResult: {resList['winMsg']}")
-            print(random.choice(commentary_lines['end']))
+            print(commentary.choice(commentary_lines['end']))
 
             # Track batting/bowling format win
             if "runs" in resList['winMsg']:
@@ -225,63 +186,16 @@ for i in range(len(teams)):
             else:
                 bowlingf += 1
 
-            # Update batting stats
-            for bat_map in [('innings1Battracker', 'innings1BatTeam'), ('innings2Battracker', 'innings2BatTeam')]:
-                bat_tracker = resList[bat_map[0]]
-                for player in bat_tracker:
-                    if player not in battingInfo:
-                        battingInfo[player] = copy.deepcopy(bat_tracker[player])
-                        battingInfo[player]['innings'] = 1
-                        battingInfo[player]['scoresArray'] = [int(battingInfo[player]['runs'])]
-                    else:
-                        battingInfo[player]['balls'] += bat_tracker[player]['balls']
-                        battingInfo[player]['runs'] += bat_tracker[player]['runs']
-                        battingInfo[player]['ballLog'] += bat_tracker[player]['ballLog']
-                        battingInfo[player]['innings'] += 1
-                        battingInfo[player]['scoresArray'].append(int(bat_tracker[player]['runs']))
-
-            # Update bowling stats
-            for bowl_map in [('innings1Bowltracker',), ('innings2Bowltracker',)]:
-                bowl_tracker = resList[bowl_map[0]]
-                for player in bowl_tracker:
-                    if player not in bowlingInfo:
-                        bowlingInfo[player] = copy.deepcopy(bowl_tracker[player])
-                        bowlingInfo[player]['matches'] = 1
-                    else:
-                        bowlingInfo[player]['balls'] += bowl_tracker[player]['balls']
-                        bowlingInfo[player]['runs'] += bowl_tracker[player]['runs']
-                        bowlingInfo[player]['ballLog'] += bowl_tracker[player]['ballLog']
-                        bowlingInfo[player]['wickets'] += bowl_tracker[player]['wickets']
-                        bowlingInfo[player]['matches'] += 1
+            # Update batting and bowling stats
+            playerStats.add_match(resList)
 
             # Points Table Update
             teamA = resList['innings1BatTeam']
             teamB = resList['innings2BatTeam']
-            teamARuns, teamABalls = resList['innings1Runs'], resList['innings1Balls']
-            teamBRuns, teamBBalls = resList['innings2Runs'], resList['innings2Balls']
-            winner = resList['winner']
-            loser = team1 if winner == team2 else team2
-
-            for t in [team1, team2]:
-                points[t]['P'] += 1
-
-            if winner == "tie":
-                for t in [team1, team2]:
-                    points[t]['T'] += 1
-                    points[t]['pts'] += 1
-            else:
-                points[winner]['W'] += 1
-                points[loser]['L'] += 1
-                points[winner]['pts'] += 2
-
-            points[teamA]['runsScored'] += teamARuns
-            points[teamB]['runsScored'] += teamBRuns
-            points[teamA]['runsConceded'] += teamBRuns
-            points[teamB]['runsConceded'] += teamARuns
-            points[teamA]['ballsFaced'] += teamABalls
-            points[teamB]['ballsFaced'] += teamBBalls
-            points[teamA]['ballsBowled'] += teamBBalls
-            points[teamB]['ballsBowled'] += teamABalls
+            points.record(team1, team2, resList['winner'], [
+                {"team": teamA, "runs": resList['innings1Runs'], "balls": resList['innings1Balls']},
+                {"team": teamB, "runs": resList['innings2Runs'], "balls": resList['innings2Balls']},
+            ])
 
             display_points_table()
             display_top_players()
@@ -302,9 +216,9 @@ def playoffs(team1, team2, matchtag):
     print(f"\n{matchtag.upper()} - {team1.upper()} vs {team2.upper()}")
     try:
         input("Press Enter to start the playoff match...")
-        print(random.choice(commentary_lines['start']))
+        print(commentary.choice(commentary_lines['start']))
         
-        res = game(False, team1.lower(), team2.lower(), matchtag)
+        res = game(False, team1.lower(), team2.lower(), matchtag, seed=season.child_seed(team1.lower(), team2.lower(), matchtag))
         
         for innings, team_key, runs_key, balls_key, bat_tracker_key, bowl_tracker_key in [
             ('innings1Log', 'innings1BatTeam', 'innings1Runs', 'innings1Balls', 'innings1Battracker', 'innings1Bowltracker'),
@@ -322,37 +236,12 @@ def playoffs(team1, team2, matchtag):
             )
         
         print(f"\nResult: {res['winMsg'].upper()}")
-        print(random.choice(commentary_lines['end']))
+        print(commentary.choice(commentary_lines['end']))
 
         winner = res['winner']
         loser = team1 if winner == team2 else team2
 
-        for bat_map in ['innings1Battracker', 'innings2Battracker']:
-            tracker = res[bat_map]
-            for player in tracker:
-                if player not in battingInfo:
-                    battingInfo[player] = copy.deepcopy(tracker[player])
-                    battingInfo[player]['innings'] = 1
-                    battingInfo[player]['scoresArray'] = [int(tracker[player]['runs'])]
-                else:
-                    battingInfo[player]['balls'] += tracker[player]['balls']
-                    battingInfo[player]['runs'] += tracker[player]['runs']
-                    battingInfo[player]['ballLog'] += tracker[player]['ballLog']
-                    battingInfo[player]['innings'] += 1
-                    battingInfo[player]['scoresArray'].append(int(tracker[player]['runs']))
-
-        for bowl_map in ['innings1Bowltracker', 'innings2Bowltracker']:
-            tracker = res[bowl_map]
-            for player in tracker:
-                if player not in bowlingInfo:
-                    bowlingInfo[player] = copy.deepcopy(tracker[player])
-                    bowlingInfo[player]['matches'] = 1
-                else:
-                    bowlingInfo[player]['balls'] += tracker[player]['balls']
-                    bowlingInfo[player]['runs'] += tracker[player]['runs']
-                    bowlingInfo[player]['ballLog'] += tracker[player]['ballLog']
-                    bowlingInfo[player]['wickets'] += tracker[player]['wickets']
-                    bowlingInfo[player]['matches'] += 1
+        playerStats.add_match(res)
 
         display_points_table()
         display_top_players()
@@ -368,13 +257,9 @@ def playoffs(team1, team2, matchtag):
         return team1, team2  # Default to team1 as winner to continue playoffs
 
 # PLAYOFF SEQUENCE
-pointsTabulate = sorted(
-    [[team, points[team]['pts'], (points[team]['runsScored'] / points[team]['ballsFaced']) * 6 - (points[team]['runsConceded'] / points[team]['ballsBowled']) * 6]
-     for team in points],
-    key=lambda x: (x[1], x[2]), reverse=True
-)
-q1 = [pointsTabulate[0][0], pointsTabulate[1][0]]
-elim = [pointsTabulate[2][0], pointsTabulate[3][0]]
+standings = points.standings()
+q1 = [standings[0], standings[1]]
+elim = [standings[2], standings[3]]
 
 finalists = []
 
@@ -391,33 +276,20 @@ print(f"\n🏆 {finalWinner.upper()} WINS THE IPL!!!")
 
 # === SAVE FINAL STATS ===
 battingTabulate = []
-for b in battingInfo:
-    c = battingInfo[b]
-    outs = sum(1 for bl in c['ballLog'] if "W" in bl)
-    avg = round(c['runs'] / outs, 2) if outs else "NA"
-    sr = round((c['runs'] / c['balls']) * 100, 2) if c['balls'] else "NA"
-    battingTabulate.append([b, c['innings'], c['runs'], avg, max(c['scoresArray']), sr, c['balls']])
-
-battingTabulate = sorted(battingTabulate, key=lambda x: x[2], reverse=True)
+for b, c in playerStats.top_batters(len(playerStats.batting)):
+    avg, sr = batting_average(c), strike_rate(c)
+    battingTabulate.append([b, c['innings'], c['runs'], "NA" if avg is None else round(avg, 2), c['highest'],
+                            "NA" if sr is None else round(sr, 2), c['balls'], c['fours'], c['sixes']])
 
 bowlingTabulate = []
-for b in bowlingInfo:
-    c = bowlingInfo[b]
+for b, c in playerStats.top_bowlers(len(playerStats.bowling)):
     overs = f"{c['balls'] // 6}.{c['balls'] % 6}" if c['balls'] else "0"
-    economy = round((c['runs'] / c['balls']) * 6, 2) if c['balls'] else "NA"
-    bowlingTabulate.append([b, c['wickets'], overs, c['runs'], economy])
-
-bowlingTabulate = sorted(bowlingTabulate, key=lambda x: x[1], reverse=True)
-
-with open(os.path.join(dir_path, "batStats.txt"), "w") as f:
-    sys.stdout = f
-    print(tabulate(battingTabulate, headers=["Player", "Innings", "Runs", "Average", "Highest", "SR", "Balls"], tablefmt="grid"))
-    sys.stdout = sys.__stdout__
+    econ = economy(c)
+    bowlingTabulate.append([b, c['wickets'], overs, c['runs'], "NA" if econ is None else round(econ, 2)])
 
-with open(os.path.join(dir_path, "bowlStats.txt"), "w") as f:
-    sys.stdout = f
-    print(tabulate(bowlingTabulate, headers=["Player", "Wickets", "Overs", "Runs Conceded", "Economy"], tablefmt="grid"))
-    sys.stdout = sys.__stdout__
+batStatsPath = scores.put("batStats.txt", tabulate(battingTabulate, headers=["Player", "Innings", "Runs", "Average", "Highest", "SR", "Balls", "4s", "6s"], tablefmt="grid") + "\n")
+bowlStatsPath = scores.put("bowlStats.txt", tabulate(bowlingTabulate, headers=["Player", "Wickets", "Overs", "Runs Conceded", "Economy"], tablefmt="grid") + "\n")
+print("Season stats written to", batStatsPath, "and", bowlStatsPath)
 
 print("bat", battingf, "bowl", bowlingf)
 input("\nPress Enter to exit...")
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""Destinations for the events a Match produces while it is simulated.
+
+``Match`` calls ``sink.emit(kind, payload)`` instead of printing, so the cost
+of commentary is only paid by callers that actually want it. Event kinds:
+
+    "squads"    {"team1": [...], "team2": [...]}
+    "toss"      {"message": str, "batting": team code, "bowling": team code}
+    "ball"      {"innings": 1|2, "ball": <innings log entry>}
+    "all_out"   {"innings": 1|2}
+    "scorecard" {"innings": 1|2, "batting": str, "bowling": str}
+    "result"    {"winner": str, "message": str}
+
+Payloads are the live objects from the match; sinks must not modify them.
+``emit`` runs on the simulating thread, and by the time an innings'
+"scorecard" is emitted its trackers are set on the match
+(``innings1Battracker`` etc.).
+"""
+
+import io
+import json
+import queue
+
+import artifact_store
+
+
+class EventSink:
+    """Base sink. Subclasses override ``emit`` and, if they hold resources, ``close``."""
+
+    def emit(self, kind, payload):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class NullSink(EventSink):
+    """Discards every event. Used by the web app, which only needs the result dict."""
+
+
+class MemorySink(EventSink):
+    """Keeps (kind, payload) tuples in ``events``, mainly for tests and in-process consumers."""
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, kind, payload):
+        self.events.append((kind, payload))
+
+
+class SinkClosed(Exception):
+    """Raised from ``emit`` once a QueueSink's consumer has gone, to stop the match."""
+
+
+class QueueSink(EventSink):
+    """Hands (kind, payload) to another thread through a bounded queue.
+
+    ``emit`` blocks while the queue is full, so a slow consumer slows the
+    simulation down instead of letting events pile up. After ``cancel()``
+    it raises SinkClosed. ``close()`` enqueues ``QueueSink.DONE``.
+    """
+
+    DONE = object()
+
+    def __init__(self, maxsize=64):
+        self.queue = queue.Queue(maxsize)
+        self.cancelled = False
+
+    def emit(self, kind, payload):
+        self.put((kind, payload))
+
+    def put(self, item):
+        while not self.cancelled:
+            try:
+                self.queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+        raise SinkClosed()
+
+    def cancel(self):
+        self.cancelled = True
+
+    def close(self):
+        try:
+            self.put(QueueSink.DONE)
+        except SinkClosed:
+            pass
+
+
+class _FileSink(EventSink):
+    """Buffers output in memory and writes it to ``target`` in one go on close.
+
+    ``target`` is either a path, replaced atomically on close, or an open text
+    file, which is written to but left open for the caller. With ``store`` (an
+    artifact_store.ArtifactStore), ``target`` is the key the output is stored
+    under instead.
+    """
+
+    def __init__(self, target, store=None):
+        self.target = target
+        self.store = store
+        self.buffer = io.StringIO()
+
+    def close(self):
+        if self.buffer is None:
+            return
+        text = self.buffer.getvalue()
+        self.buffer = None
+        if self.store is not None:
+            self.store.put(self.target, text)
+        elif isinstance(self.target, str):
+            artifact_store.atomic_write(self.target, text)
+        else:
+            self.target.write(text)
+
+
+class TextSink(_FileSink):
+    """Plain-text commentary and scorecards, in the format of the old scores/*.txt files."""
+
+    def emit(self, kind, payload):
+        write = self.buffer.write
+        if kind == "ball":
+            write(payload["ball"]["event"] + "\n")
+        elif kind == "scorecard":
+            write(payload["batting"] + "\n" + payload["bowling"] + "\n")
+        elif kind == "toss" or kind == "result":
+            write(payload["message"] + "\n")
+        elif kind == "all_out":
+            write("ALL OUT\n")
+        elif kind == "squads":
+            write(str(payload["team1"]) + "\n")
+
+
+class JsonLinesSink(_FileSink):
+    """One JSON object per event: {"type": kind, **payload}."""
+
+    def emit(self, kind, payload):
+        self.buffer.write(json.dumps({"type": kind, **payload}) + "\n")
@@ -0,0 +1,289 @@
+"""Monte Carlo season forecaster: table positions, playoffs and title odds.
+
+``iter_forecast`` plays many seasons in the format of season.py (league,
+then Qualifier 1 / Eliminator / Qualifier 2 / Final) across a process pool
+and yields an estimate after every chunk of seasons: per team, the
+probability of each final table position, of reaching the playoffs (top
+four), of reaching the final and of winning the title, each with a Wilson
+score confidence interval. With ``tolerance`` set it stops as soon as every
+interval is within +/- tolerance.
+
+Season ``i`` is seeded from ``(seed, i)`` and chunks are merged in order, so
+a seed gives the same estimates (and stops at the same point) whatever the
+number of workers. Two engines, as in monte_carlo:
+
+    "ball"   season.run_season in each worker: the per-ball engine with no
+             ball log, commentary or files
+    "batch"  batch_engine (NumPy): every fixture is simulated for a whole
+             chunk of seasons at once, orders of magnitude faster
+
+    python forecast.py --seasons 5000 --engine batch --tolerance 0.01
+"""
+
+import argparse
+import contextlib
+import os
+import random
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from statistics import NormalDist
+
+from tabulate import tabulate
+
+import ball_export
+import batch_engine
+import season
+
+# Seasons per chunk; fixed per engine so results do not depend on the worker count
+BALL_CHUNK = 2
+BATCH_CHUNK = 1000
+
+
+def _empty_aggregate(teams):
+    return {"seasons": 0,
+            "positions": {team: [0] * len(teams) for team in teams},  # team -> seasons finished in each place
+            "final": {team: 0 for team in teams},
+            "title": {team: 0 for team in teams}}
+
+
+def merge(agg, other):
+    """Adds aggregate ``other`` into ``agg`` in place and returns ``agg``."""
+    agg["seasons"] += other["seasons"]
+    for team, counts in other["positions"].items():
+        agg["positions"][team] = [a + b for a, b in zip(agg["positions"][team], counts)]
+    for key in ("final", "title"):
+        for team, count in other[key].items():
+            agg[key][team] += count
+    return agg
+
+
+def _run_ball_chunk(teams, seed, indices, export=False):
+    agg = _empty_aggregate(teams)
+    balls = ball_export.RowBuffer() if export else None
+    if export:
+        agg["balls"] = balls  # taken off again before merging, see iter_forecast
+    for i in indices:
+        result = season.run_season(teams, seed=f"{seed}-{i}", workers=1, exporter=balls)
+        agg["seasons"] += 1
+        for place, team in enumerate(result["standings"]):
+            agg["positions"][team][place] += 1
+        final = result["playoffs"]["Final"]
+        for team in (final["team1"], final["team2"]):
+            agg["final"][team] += 1
+        agg["title"][result["champion"]] += 1
+    return agg
+
+
+def _run_batch_chunk(teams, seed, indices):
+    np = batch_engine.np
+    batch_engine._require_numpy()
+    n, k = len(teams), len(indices)
+    index = {team: i for i, team in enumerate(teams)}
+    pts = np.zeros((k, n), dtype=np.int64)
+    scored, faced, conceded, bowled = (np.zeros((k, n), dtype=np.int64) for _ in range(4))
+
+    for f, (team1, team2) in enumerate(season.league_fixtures(teams)):
+        result = batch_engine.simulate_batch(team1, team2, k, seed=[seed, indices.start, f])
+        winner = result["winner"]
+        pts[:, index[team1]] += np.where(winner == 0, 2, winner == 2)
+        pts[:, index[team2]] += np.where(winner == 1, 2, winner == 2)
+        for group in result["groups"]:
+            rows = group["rows"]
+            first = index[group["batting_first"]]
+            second = index[team2] if group["batting_first"] == team1 else index[team1]
+            runs1, runs2 = group["innings1"]["runs"], group["innings2"]["runs"]
+            balls1, balls2 = 120, group["innings2"]["balls"]  # Match.play() counts the first innings as 120 balls
+            scored[rows, first] += runs1
+            faced[rows, first] += balls1
+            conceded[rows, first] += runs2
+            bowled[rows, first] += balls2
+            scored[rows, second] += runs2
+            faced[rows, second] += balls2
+            conceded[rows, second] += runs1
+            bowled[rows, second] += balls1
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        nrr = np.where((faced > 0) & (bowled > 0), scored / faced * 6 - conceded / bowled * 6, 0.0)
+    # Same order as PointsTable.standings: points, then net run rate, then team code
+    code_rank = np.argsort(np.argsort(teams))
+    order = np.array([np.lexsort((code_rank, -nrr[row], -pts[row])) for row in range(k)])
+    place = np.argsort(order, axis=1)  # place[season, team]
+
+    def play(round_no, *games):
+        # games are (side_a, side_b) arrays of team indices, one entry per season. All
+        # seasons' matches between the same two teams in a round share one batch call.
+        side_a = np.concatenate([game[0] for game in games])
+        side_b = np.concatenate([game[1] for game in games])
+        seasons_of = np.tile(np.arange(k), len(games))
+        low, high = np.minimum(side_a, side_b), np.maximum(side_a, side_b)
+        winner = low.copy()
+        for a, b in sorted(set(zip(low.tolist(), high.tolist()))):
+            picked = np.flatnonzero((low == a) & (high == b))
+            result = batch_engine.simulate_batch(teams[a], teams[b], len(picked), seed=[seed, indices.start, 100 + round_no, a, b])
+            rows = seasons_of[picked]
+            # No super overs: a tie sends the higher-placed team through, as in season.py
+            b_wins = (result["winner"] == 1) | ((result["winner"] == 2) & (place[rows, b] < place[rows, a]))
+            winner[picked] = np.where(b_wins, b, a)
+        loser = side_a + side_b - winner
+        return [(winner[i * k:(i + 1) * k], loser[i * k:(i + 1) * k]) for i in range(len(games))]
+
+    (winner_q1, loser_q1), (winner_elim, _) = play(0, (order[:, 0], order[:, 1]), (order[:, 2], order[:, 3]))
+    (winner_q2, _), = play(1, (winner_elim, loser_q1))
+    (champion, _), = play(2, (winner_q1, winner_q2))
+
+    agg = _empty_aggregate(teams)
+    agg["seasons"] = k
+    for i, team in enumerate(teams):
+        agg["positions"][team] = np.bincount(place[:, i], minlength=n).tolist()
+        agg["final"][team] = int(np.count_nonzero(winner_q1 == i) + np.count_nonzero(winner_q2 == i))
+        agg["title"][team] = int(np.count_nonzero(champion == i))
+    return agg
+
+
+def wilson_interval(successes, n, z):
+    """Wilson score interval for a binomial proportion, as {"p", "low", "high"}."""
+    if n == 0:
+        return {"p": None, "low": 0.0, "high": 1.0}
+    p = successes / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * ((p * (1 - p) / n + z * z / (4 * n * n)) ** 0.5) / denom
+    return {"p": p, "low": max(0.0, centre - half), "high": min(1.0, centre + half)}
+
+
+def summarize(agg, confidence=0.95):
+    """Turns an aggregate into per-team probabilities with confidence intervals."""
+    n = agg["seasons"]
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    teams = {}
+    widest = 0.0
+    for team, counts in agg["positions"].items():
+        row = {"positions": [wilson_interval(c, n, z) for c in counts],
+               "playoffs": wilson_interval(sum(counts[:4]), n, z),
+               "final": wilson_interval(agg["final"][team], n, z),
+               "title": wilson_interval(agg["title"][team], n, z)}
+        for interval in row["positions"] + [row["playoffs"], row["final"], row["title"]]:
+            widest = max(widest, (interval["high"] - interval["low"]) / 2)
+        teams[team] = row
+    return {"seasons": n, "confidence": confidence, "max_half_width": widest, "teams": teams}
+
+
+def iter_forecast(teams=season.TEAMS, seasons=1000, workers=None, seed=None, engine="ball",
+                  tolerance=None, min_seasons=50, confidence=0.95, chunk_size=None, exporter=None):
+    """Yields a ``summarize()``'d estimate after every chunk of seasons.
+
+    The last estimate has ``done`` set; ``stopped_early`` says whether it
+    came from ``tolerance`` being reached (after at least ``min_seasons``)
+    rather than from running all ``seasons``. With an ``exporter`` (a
+    ``ball_export.BallExporter``, ball engine only) every ball of the
+    seasons counted is written to it, chunk by chunk in season order.
+    """
+    teams = [team.lower() for team in teams]
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    workers = workers or os.cpu_count() or 1
+    if engine == "batch":
+        if exporter is not None:
+            raise ValueError("the batch engine does not simulate individual balls; export needs engine='ball'")
+        batch_engine._require_numpy()
+        run_chunk, chunk_size = _run_batch_chunk, chunk_size or BATCH_CHUNK
+    elif engine == "ball":
+        run_chunk, chunk_size = partial(_run_ball_chunk, export=exporter is not None), chunk_size or BALL_CHUNK
+    else:
+        raise ValueError(f"unknown engine {engine!r}")
+    chunks = deque(range(start, min(start + chunk_size, seasons)) for start in range(0, seasons, chunk_size))
+
+    agg = _empty_aggregate(teams)
+
+    def estimate(done, stopped_early):
+        result = summarize(agg, confidence)
+        result.update(seed=seed, engine=engine, done=done, stopped_early=stopped_early)
+        return result
+
+    def add(chunk):
+        balls = chunk.pop("balls", None)
+        if balls is not None:
+            exporter.write_rows(balls)
+        merge(agg, chunk)
+
+    def converged():
+        return (tolerance is not None and agg["seasons"] >= min_seasons
+                and summarize(agg, confidence)["max_half_width"] <= tolerance)
+
+    if workers == 1:
+        while chunks:
+            add(run_chunk(teams, seed, chunks.popleft()))
+            if converged():
+                yield estimate(True, bool(chunks))
+                return
+            yield estimate(not chunks, False)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # A couple of chunks per worker in flight; merged in submission order
+        running = deque()
+        try:
+            while chunks or running:
+                while chunks and len(running) < workers * 2:
+                    running.append(pool.submit(run_chunk, teams, seed, chunks.popleft()))
+                add(running.popleft().result())
+                if converged():
+                    yield estimate(True, bool(chunks or running))
+                    return
+                yield estimate(not (chunks or running), False)
+        finally:
+            for future in running:
+                future.cancel()
+
+
+def forecast(*args, **kwargs):
+    """Runs ``iter_forecast`` to the end and returns the final estimate."""
+    result = None
+    for result in iter_forecast(*args, **kwargs):
+        pass
+    return result
+
+
+def _pct(interval):
+    return f"{interval['p'] * 100:.1f}% ({interval['low'] * 100:.1f}-{interval['high'] * 100:.1f})"
+
+
+def forecast_table(result):
+    rows = []
+    for team, row in sorted(result["teams"].items(), key=lambda item: -item[1]["title"]["p"]):
+        top = max(range(len(row["positions"])), key=lambda place: row["positions"][place]["p"])
+        rows.append([team.upper(), _pct(row["title"]), _pct(row["final"]), _pct(row["playoffs"]), top + 1])
+    return tabulate(rows, headers=["Team", "Title", "Final", "Playoffs", "Likeliest place"], tablefmt="grid")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Forecast playoff and title probabilities by simulating many seasons.")
+    parser.add_argument("--teams", default=",".join(season.TEAMS), help="comma-separated team codes")
+    parser.add_argument("--seasons", type=int, default=1000, help="seasons to simulate at most")
+    parser.add_argument("--engine", choices=("ball", "batch"), default="ball")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--tolerance", type=float, default=None,
+                        help="stop once every interval is within +/- this (e.g. 0.01)")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--export", help="write every ball to this .parquet, .arrow or .csv file (ball engine)")
+    args = parser.parse_args(argv)
+    if args.export and args.engine != "ball":
+        parser.error("--export needs --engine ball")
+
+    result = None
+    with contextlib.ExitStack() as stack:
+        exporter = stack.enter_context(ball_export.BallExporter(args.export)) if args.export else None
+        for result in iter_forecast(args.teams.split(","), args.seasons, workers=args.workers, seed=args.seed,
+                                    engine=args.engine, tolerance=args.tolerance, confidence=args.confidence,
+                                    exporter=exporter):
+            print(f"{result['seasons']} seasons, widest interval +/-{result['max_half_width'] * 100:.1f}%",
+                  file=sys.stderr)
+    print(f"Seed: {result['seed']}  Seasons: {result['seasons']}" + ("  (stopped early)" if result["stopped_early"] else ""))
+    print(forecast_table(result))
+
+
+if __name__ == "__main__":
+    main()
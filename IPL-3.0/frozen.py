@@ -0,0 +1,16 @@
+"""Read-only copies of JSON-like data shared across a process.
+
+Used for values many callers hold at once (compiled player records, the
+teams registry), so no caller can change what the others see.
+"""
+
+from types import MappingProxyType
+
+
+def freeze(obj):
+    """Returns a read-only copy of a JSON-like value (dicts -> mappingproxy, lists -> tuples)."""
+    if isinstance(obj, (dict, MappingProxyType)):
+        return MappingProxyType({key: freeze(value) for key, value in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(freeze(value) for value in obj)
+    return obj
@@ -1,8 +1,15 @@
 import random
-import accessJSON
-import copy
-import sys 
-import json
+import player_model
+import team_registry
+import ball_log
+import scorecard
+import event_sinks
+import artifact_store
+from match_random import MatchRandom
+
+# Bump whenever a change to the simulation alters what a given seed produces;
+# stored replays (teams + seed) are only valid for the version that made them.
+ENGINE_VERSION = 1
 
 
 #NEXT UPDATE -
@@ -63,103 +70,81 @@ import json
 #Player analysis by phases
 from tabulate import tabulate
 
-target = 1 
-
-innings1Batting = None
-innings1Bowling = None
-innings2Batting = None
-innings2Bowling = None
-innings1Balls = None
-innings2Balls = None
-innings1Runs = None
-innings2Runs = None
-winner = None
-winMsg = None
-
-innings1Battracker = None
-innings2Battracker = None
-innings1Bowltracker = None
-innings2Bowltracker = None
-
-innings1Log = []
-innings2Log = []
-
-tossMsg = None
-
-def doToss(pace, spin, outfield, secondInnDew, pitchDetoriate, typeOfPitch, team1, team2):
-    global tossMsg
+def doToss(match, pace, spin, outfield, secondInnDew, pitchDetoriate, typeOfPitch, team1, team2):
     battingLikely =  0.45
     if(secondInnDew):
-          battingLikely = battingLikely - random.uniform(0.09, 0.2)
+          battingLikely = battingLikely - match.rng.toss.uniform(0.09, 0.2)
     if(pitchDetoriate):
-        battingLikely = battingLikely + random.uniform(0.09, 0.2)
+        battingLikely = battingLikely + match.rng.toss.uniform(0.09, 0.2)
     if(typeOfPitch == "dead"):
-        battingLikely = battingLikely - random.uniform(0.05, 0.15)
+        battingLikely = battingLikely - match.rng.toss.uniform(0.05, 0.15)
     if(typeOfPitch == "green"):
-        battingLikely = battingLikely + random.uniform(0.05, 0.15)
+        battingLikely = battingLikely + match.rng.toss.uniform(0.05, 0.15)
     if(typeOfPitch == "dusty"):
-        battingLikely = battingLikely + random.uniform(0.04, 0.1)
+        battingLikely = battingLikely + match.rng.toss.uniform(0.04, 0.1)
 
-    toss = random.randint(0, 1)
+    toss = match.rng.toss.randint(0, 1)
     # print(toss, battingLikely)
     if(toss == 0):
-        outcome = random.uniform(0, 1)
+        outcome = match.rng.toss.uniform(0, 1)
         if(outcome > battingLikely):
-            print(team1, "won the toss and chose to field")
-            tossMsg = team1 + " won the toss and chose to field"
+            match.tossMsg = team1 + " won the toss and chose to field"
             return(1)
         else:
-            print(team1, "won the toss and chose to bat")
-            tossMsg = team1 + " won the toss and chose to bat"
+            match.tossMsg = team1 + " won the toss and chose to bat"
             return(0)
 
     else:
-        outcome = random.uniform(0, 1)
+        outcome = match.rng.toss.uniform(0, 1)
         if(outcome > battingLikely):
-            print(team2, "won the toss and chose to field")
-            tossMsg = team2 + " won the toss and chose to bat"
+            match.tossMsg = team2 + " won the toss and chose to field"
             return(0)
         else:
-            print(team2, "won the toss and chose to bat")
-            tossMsg = team2 + " won the toss and chose to field"
+            match.tossMsg = team2 + " won the toss and chose to bat"
             return(1)
 
 
-def pitchInfo(venue, typeOfPitch):
+def pitchInfo(venue, typeOfPitch, rng=random):
     if(typeOfPitch == "dusty"):
         # how good the pitch is for pace. 0.75-1.25, lower is better for bowling
-        pace = 1 + 0.5*(random.random() * (random.random()-random.random()))
+        pace = 1 + 0.5*(rng.random() * (rng.random()-rng.random()))
         # how good the pitch is for spin. 0.75-1.25, lower is better for bowling
-        spin = 1 + 0.5*(random.random() * (random.random()-random.random()))
-        spin = spin - random.uniform(0.1, 0.16)
+        spin = 1 + 0.5*(rng.random() * (rng.random()-rng.random()))
+        spin = spin - rng.uniform(0.1, 0.16)
         # how good the outfield is. 0.75-1.25, lower is better for bowling
-        outfield = 1 + 0.5*(random.random() *
-                            (random.random()-random.random()))
+        outfield = 1 + 0.5*(rng.random() *
+                            (rng.random()-rng.random()))
     elif(typeOfPitch == "green"):
         # how good the pitch is for pace. 0.75-1.25, lower is better for bowling
-        pace = 1 + 0.5*(random.random() * (random.random()-random.random()))
-        pace = pace - random.uniform(0.1, 0.16)
+        pace = 1 + 0.5*(rng.random() * (rng.random()-rng.random()))
+        pace = pace - rng.uniform(0.1, 0.16)
         # how good the pitch is for spin. 0.75-1.25, lower is better for bowling
-        spin = 1 + 0.5*(random.random() * (random.random()-random.random()))
+        spin = 1 + 0.5*(rng.random() * (rng.random()-rng.random()))
         # how good the outfield is. 0.75-1.25, lower is better for bowling
-        outfield = 1 + 0.5*(random.random() *
-                            (random.random()-random.random()))
+        outfield = 1 + 0.5*(rng.random() *
+                            (rng.random()-rng.random()))
     elif(typeOfPitch == "dead"):
         # how good the pitch is for pace. 0.75-1.25, lower is better for bowling
-        pace = 1 + 0.5*(random.random() * (random.random()-random.random()))
+        pace = 1 + 0.5*(rng.random() * (rng.random()-rng.random()))
         # how good the pitch is for spin. 0.75-1.25, lower is better for bowling
-        spin = 1 + 0.5*(random.random() * (random.random()-random.random()))
+        spin = 1 + 0.5*(rng.random() * (rng.random()-rng.random()))
         # how good the outfield is. 0.75-1.25, lower is better for bowling
-        outfield = 1 + 0.5*(random.random() *
-                            (random.random()-random.random()))
+        outfield = 1 + 0.5*(rng.random() *
+                            (rng.random()-rng.random()))
 
     return [pace, spin, outfield]
 
 
-def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, dew, detoriate):
-    global target, innings1Balls, innings1Runs, innings1Batting, innings1Bowling, winner, winMsg, innings1Battracker, innings1Bowltracker, innings1Log
+def innings1(match, batting, bowling, battingName, bowlingName, pace, spin, outfield, dew, detoriate):
+    """Simulates the first innings as a generator.
+
+    Yields the innings state (see stepState) after every delivery and sets the
+    innings results on ``match`` when it finishes. Nothing runs until the
+    caller starts iterating.
+    """
     # print(battingName, bowlingName, pace, spin, outfield, dew, detoriate)
     bowlerTracker = {} #add names of all in innings def
+    pitchBowling = {} # playerInitials -> (bowlOutsRate, bowlRunDenominations) with the pitch effect applied
     batterTracker = {} #add names of all in innings def
     battingOrder = []
     catchingOrder = []
@@ -171,108 +156,40 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
     # break or spin; medium or fast
 
     # Deciding batting order
+    # Probability tables come precompiled on each player (see player_model)
     for i in batting:
-        batterTracker[i['playerInitials']] = {'playerInitials': i['playerInitials'], 'balls': 0, 'runs': 0, 'ballLog': []}
-        runObj = {}
-        outObj = {}
-
-        i['batBallsTotal'] += 1
-        for run in i['batRunDenominations']:
-            runObj[run] = i['batRunDenominations'][run] / i['batBallsTotal']
-        i['batRunDenominationsObject'] = runObj
-
-        for out in i['batOutTypes']:
-            outObj[out] = i['batOutTypes'][out] / i['batBallsTotal']
-        i['batOutTypesObject'] = outObj
-
-        # for styles in i['byBowler']:
-
-        #     runObj2 = {}
-        #     outObj2 = {}
-        #     batOutsRate = i['byBowler'][styles]['batOutsTotal'] / \
-        #         i['byBowler'][styles]['batBallsTotal']
-        #     i['byBowler'][styles]['batOutsRate'] = batOutsRate
-        #     for run in i['byBowler'][styles]['batRunDenominations']:
-        #         runObj2[run] = i['byBowler'][styles]['batRunDenominations'][run] / \
-        #             i['byBowler'][styles]['batBallsTotal']
-        #     i['byBowler'][styles]['batRunDenominationsObject'] = runObj2
-        #     for out in i['byBowler'][styles]['batOutTypes']:
-        #         outObj2[out] = i['byBowler'][styles]['batOutTypes'][out] / \
-        #             i['byBowler'][styles]['batBallsTotal']
-        #     i['byBowler'][styles]['batOutTypesObject'] = outObj2
-
-        i['batOutsRate'] = i['batOutsTotal'] / i['batBallsTotal']
-
-        newPos = []
-        posAvgObj = {"0": 0, "1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "6": 0, "7":0,"8": 0, "9":0, "10":0}
-        for p in i['position']:
-            if(p != "null"):
-                newPos.append(p)
-        posTotal = sum(newPos)
-        for p in newPos:
-            if(str(p) in posAvgObj):
-                posAvgObj[str(p)] += 1
-            else:
-                posAvgObj[str(p)] = 1
-
-        for key_p in posAvgObj:
-            posAvgObj[key_p] = posAvgObj[key_p]/i['matches'] 
-
-        if(len(newPos) != 0):
-            posAvg = posTotal/len(newPos)
-        else:
-            posAvg = 9.0
-        battingOrder.append({"posAvg": posAvg, "player": i, "posAvgsAll": posAvgObj})
+        batterTracker[i['playerInitials']] = {'playerInitials': i['playerInitials'], 'balls': 0, 'runs': 0, 'ballLog': [], 'dismissal': None, 'arrival': None}
+        battingOrder.append({"posAvg": i['posAvg'], "player": i, "posAvgsAll": i['posAvgsAll']})
 
     battingOrder = sorted(battingOrder, key=lambda k: k['posAvg'])
     catchingOrder = sorted(catchingOrder, key=lambda k: k['catchRate'])
 
     for i in bowling:
-        i['bowlBallsTotalRate'] = i['bowlBallsTotal'] / i['matches']
         bowlerTracker[i['playerInitials']] = {'playerInitials': i['playerInitials'], 'balls': 0, 
         'runs': 0, 'ballLog': [], 'overs': 0, 'wickets': 0}
-        runObj = {}
-        outObj = {}
-        i['catchRate'] = i['catches'] / i['matches']
-        i['bowlWideRate'] = i['bowlWides'] / (i['bowlBallsTotal'] + 1)
-        i['bowlNoballRate'] = i['bowlNoballs'] / (i['bowlBallsTotal'] + 1)
-        i['bowlBallsTotal'] += 1
-        for run in i['bowlRunDenominations']:
-            runObj[run] = i['bowlRunDenominations'][run] / i['bowlBallsTotal']
-        i['bowlRunDenominationsObject'] = runObj
-
-        for out in i['bowlOutTypes']:
-            outObj[out] = i['bowlOutTypes'][out] / i['bowlBallsTotal']
-        i['bowlOutTypesObject'] = outObj
-
-        # for styles in i['byBatsman']:
-        #     runObj2 = {}
-        #     outObj2 = {}
-        #     bowlOutsRate = i['byBatsman'][styles]['bowlOutsTotal'] / \
-        #         i['byBatsman'][styles]['bowlBallsTotal']
-        #     i['byBatsman'][styles]['bowlOutsRate'] = batOutsRate
-        #     for run in i['byBatsman'][styles]['bowlRunDenominations']:
-        #         runObj2[run] = i['byBatsman'][styles]['bowlRunDenominations'][run] / \
-        #             i['byBatsman'][styles]['bowlBallsTotal']
-        #     i['byBatsman'][styles]['bowlRunDenominationsObject'] = runObj2
-        #     for out in i['byBatsman'][styles]['bowlOutTypes']:
-        #         outObj2[out] = i['byBatsman'][styles]['bowlOutTypes'][out] / \
-        #             i['byBatsman'][styles]['bowlBallsTotal']
-        #     i['byBatsman'][styles]['bowlOutTypesObject'] = outObj2
-
-        i['bowlOutsRate'] = i['bowlOutsTotal'] / i['bowlBallsTotal']
-
-        obj = {"20": 0, "1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "6": 0, "7": 0, "8": 0, "9": 0,
-               "10": 0, "11": 0, "12": 0, "13": 0, "14": 0, "15": 0, "16": 0, "17": 0, "18": 0, "19": 0}
-        for over in i['overNumbers']:
-            obj[over] += 1
-        for keys in obj:
-            if(i['matches'] != 0):
-                avg = obj[keys]/i['matches']
-            else:
-                avg = -1
-            obj[keys] = avg
-        i['overNumbersObject'] = obj
+
+        # The pitch effect only depends on the bowler and this innings' conditions,
+        # so each bowler's adjusted out rate and run table are built once here
+        bowlOutsRate = i['bowlOutsRate']
+        bowlRunDenominations = dict(i['bowlRunDenominationsObject'])
+        # Increase effect and divide from negative things for bowler to positive (W, 1, 0)
+        if('break' or 'spin' in i['bowlStyle']):
+            effect = (1.0 - spin)/2
+            # print("effect:", effect, "original:", spin)
+            bowlOutsRate += (effect * 0.25)
+            bowlRunDenominations['0'] += (effect * 0.25)
+            bowlRunDenominations['1'] += (effect * 0.25)
+            bowlRunDenominations['4'] -= (effect * 0.38)
+            bowlRunDenominations['6'] -= (effect * 0.3)
+        elif('medium' or 'fast' in i['bowlStyle']):
+            effect = (1.0 - fast)/2
+            # print("effect:", effect, "original:", fast)
+            bowlOutsRate += (effect * 0.25)
+            bowlRunDenominations['0'] += (effect * 0.25)
+            bowlRunDenominations['1'] += (effect * 0.25)
+            bowlRunDenominations['4'] -= (effect * 0.38)
+            bowlRunDenominations['6'] -= (effect * 0.3)
+        pitchBowling[i['playerInitials']] = (bowlOutsRate, bowlRunDenominations)
 
     bowling = sorted(bowling, key=lambda k: k['bowlOutsRate'])
     bowling.reverse()
@@ -296,12 +213,20 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
 
     lastOver = None
 
+    def stepState(overBowler):
+        # Everything a caller needs to show or store the innings after a ball;
+        # plain strings, numbers and the live trackers, so it serializes as JSON
+        return {"innings": 1, "runs": runs, "balls": balls, "wickets": wickets, "target": None,
+                "batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'],
+                "onStrike": onStrike['player']['playerInitials'], "bowler": overBowler['playerInitials'],
+                "lastOver": lastOver, "batterTracker": batterTracker, "bowlerTracker": bowlerTracker}
+
 
     def playerDismissed(player):
         nonlocal batter1, batter2, onStrike
         # print("OUT", player['player']['playerInitials'])
         if(wickets == 10):
-            print("ALL OUT")
+            match.sink.emit("all_out", {"innings": 1})
         else:
             if(batter1 == player):
                 onStrike = battingOrder[wickets + 1]
@@ -341,7 +266,11 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
 
     def delivery(bowler, batter, over):
         nonlocal batterTracker, bowlerTracker, onStrike, ballLog, balls, runs, wickets
-        global innings1Log
+        # Both batters at the crease for this ball have come in; numbered in order for the scorecard
+        for atCrease in (batter1, batter2):
+            creaseStats = batterTracker[atCrease['player']['playerInitials']]
+            if creaseStats['arrival'] is None:
+                creaseStats['arrival'] = 1 + sum(1 for stats in batterTracker.values() if stats['arrival'] is not None)
         batInfo = None
         bowlInfo = None
         wideRate = bowler['bowlWideRate']
@@ -364,37 +293,19 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
         #     bowlInfo = bowler
 
         bowlInfo = bowler
-
-
-        # Increase effect and divide from negative things for bowler to positive (W, 1, 0)
-        if('break' or 'spin' in bowler['bowlStyle']):
-            effect = (1.0 - spin)/2
-            # print("effect:", effect, "original:", spin)
-            bowlInfo['bowlOutsRate'] += (effect * 0.25)
-            bowlInfo['bowlRunDenominationsObject']['0'] += (effect * 0.25)
-            bowlInfo['bowlRunDenominationsObject']['1'] += (effect * 0.25)
-            bowlInfo['bowlRunDenominationsObject']['4'] -= (effect * 0.38)
-            bowlInfo['bowlRunDenominationsObject']['6'] -= (effect * 0.3)
-        elif('medium' or 'fast' in bowler['bowlStyle']):
-            effect = (1.0 - fast)/2
-            # print("effect:", effect, "original:", fast)
-            bowlInfo['bowlOutsRate'] += (effect * 0.25)
-            bowlInfo['bowlRunDenominationsObject']['0'] += (effect * 0.25)
-            bowlInfo['bowlRunDenominationsObject']['1'] += (effect * 0.25)
-            bowlInfo['bowlRunDenominationsObject']['4'] -= (effect * 0.38)
-            bowlInfo['bowlRunDenominationsObject']['6'] -= (effect * 0.3)
+        bowlOutsRate, bowlRunDenominations = pitchBowling[blname]
 
         # print(batInfo)
         denAvg = {}
-        outAvg = (batInfo['batOutsRate'] + bowlInfo['bowlOutsRate']) / 2
+        outAvg = (batInfo['batOutsRate'] + bowlOutsRate) / 2
         outTypeAvg = {}
         runoutChance = 0.01
         if(batter['player']['batOutsTotal'] != 0):
-            runoutChance = (batter['player']['runnedOut']) / batter['player']['batBallsTotal']
+            runoutChance = batter['player']['runOutRate']
 
         for batKey in batInfo['batRunDenominationsObject']:
             denAvg[batKey] = (batInfo['batRunDenominationsObject']
-                              [batKey] + bowlInfo['bowlRunDenominationsObject'][batKey])/2
+                              [batKey] + bowlRunDenominations[batKey])/2
 
         runRate = 0
         for a,b in zip(batInfo['batOutTypesObject'], bowlInfo['bowlOutTypesObject']):
@@ -405,17 +316,15 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
 
         def getOutcome(den, out, over):
             nonlocal batterTracker, bowlerTracker, runs, balls, ballLog, wickets, onStrike
-            global innings1Log
 
             # print(den)
-            if(wideRate > random.uniform(0,1)): #add batter tracking & bowler tracking logs, read ln 267 & ln 255
+            if(wideRate > match.rng.delivery.uniform(0,1)): #add batter tracking & bowler tracking logs, read ln 267 & ln 255
              runs += 1
-             print(over, f"{bowler['displayName']} to {batter['player']['displayName']}", "Wide", "Score: " + str(runs) + "/" + str(wickets))
              ballLog.append(f"{str(balls)}:WD")
              bowlerTracker[blname]['runs'] += 1
              bowlerTracker[blname]['ballLog'].append(f"{str(balls)}:WD")
-             innings1Log.append({"event": over + f" {bowler['displayName']} to {batter['player']['displayName']}" + " Wide" + " Score: " + str(runs) + "/" + str(wickets), 
-                "balls": balls, "batterTracker": copy.deepcopy(batterTracker), "bowlerTracker": copy.deepcopy(bowlerTracker), 
+             match.record(1, {"event": over + f" {bowler['displayName']} to {batter['player']['displayName']}" + " Wide" + " Score: " + str(runs) + "/" + str(wickets), 
+                "balls": balls, **ball_log.ball_delta(1, 0, 0, bowlerTracker[blname]['ballLog'][-1], extras=1), 
                 "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "runs": runs, "wickets": wickets})
              return
 
@@ -433,13 +342,12 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                     denominationProbabilties.append(denomObj)
                     last += den[denom]
 
-                decider = random.uniform(0, total)
+                decider = match.rng.delivery.uniform(0, total)
                 for prob in denominationProbabilties:
                     if(prob['start'] <= decider and prob['end'] > decider):
                         # Next - add wicket types, extras, bowler rotation, new batsman, innings change, aggression changes based on over number and rr, and based on last 10 ball player form
                         runs += int(prob['denomination'])
                         if(prob['denomination'] != '0'):
-                            print(over, f"{bowler['displayName']} to {batter['player']['displayName']}", prob['denomination'], "Score: " + str(runs) + "/" + str(wickets))
                             
                             bowlerTracker[blname]['runs'] += int(prob['denomination'])
                             bowlerTracker[blname]['ballLog'].append(f"{str(balls)}:{prob['denomination']}")
@@ -447,8 +355,8 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                             batterTracker[btname]['runs'] += int(prob['denomination'])
                             batterTracker[btname]['ballLog'].append(f"{str(balls)}:{prob['denomination']}")
                             batterTracker[btname]['balls'] += 1
-                            innings1Log.append({"event" : over + f" {bowler['displayName']} to {batter['player']['displayName']} " + prob['denomination'] + " Score: " + str(runs) + "/" + str(wickets), "balls": balls, 
-                                "runs": runs, "batterTracker": copy.deepcopy(batterTracker), "bowlerTracker": copy.deepcopy(bowlerTracker), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})                            
+                            match.record(1, {"event" : over + f" {bowler['displayName']} to {batter['player']['displayName']} " + prob['denomination'] + " Score: " + str(runs) + "/" + str(wickets), "balls": balls, 
+                                "runs": runs, **ball_log.ball_delta(int(prob['denomination']), 1, 0, bowlerTracker[blname]['ballLog'][-1], int(prob['denomination']), 1, batterTracker[btname]['ballLog'][-1]), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})                            
                             ballLog.append(f"{str(balls)}:{prob['denomination']}")
 
                             if(int(prob['denomination']) % 2 == 1):
@@ -461,7 +369,7 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                         if(prob['denomination'] == '0'): #during high rrr or death overs, probability
                         #of boundary & wicket are both higher
                             probOut = outAvg*(total/den['0'])
-                            outDecider = random.uniform(0, 1)
+                            outDecider = match.rng.delivery.uniform(0, 1)
                             # print(over, outDecider)
                             if(probOut > outDecider): #change to >
                                 wickets += 1
@@ -476,17 +384,15 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                      "end": last_o + outTypeAvg[out_k]}
                                     probs_o.append(outobj)
                                     last_o += outTypeAvg[out_k]
-                                typeDeterminer = random.uniform(0, total_o)
+                                typeDeterminer = match.rng.delivery.uniform(0, total_o)
                                 for type_ in probs_o:
                                     if(type_['start'] <= typeDeterminer and type_['end'] > typeDeterminer):
                                         out_type = type_['type']
                                 # print("OUTTTT", typeDeterminer, probs_o)
 
                                 if(out_type == "runOut"): #dodismissal function
-                                    runOutRuns = random.randint(0,2)
+                                    runOutRuns = match.rng.delivery.randint(0,2)
                                     runs += runOutRuns
-                                    print(over, f"{bowler['displayName']} to {batter['player']['displayName']}", 
-                                        "W", "Score: " + str(runs) + "/" + str(wickets), "Run Out!")
                                     ballLog.append(f"{str(balls)}:W")
                                     bowlerTracker[blname]['runs'] += runOutRuns
                                     bowlerTracker[blname]['ballLog'].append(f"{str(balls)}:W{runOutRuns}-runout")
@@ -494,9 +400,10 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                     batterTracker[btname]['runs'] += runOutRuns
                                     batterTracker[btname]['ballLog'].append(f"{str(balls)}:{runOutRuns}")
                                     batterTracker[btname]['balls'] += 1
-                                    innings1Log.append({"event" : over + f" {bowler['displayName']} to {batter['player']['displayName']}" + 
+                                    batterTracker[btname]['dismissal'] = ball_log.dismissal_record("runOut", balls)
+                                    match.record(1, {"event" : over + f" {bowler['displayName']} to {batter['player']['displayName']}" + 
                                         " W" + " Score: " + str(runs) + "/" + str(wickets) + " Run Out!", "balls": balls, "runs": runs,
-                                        "batterTracker": copy.deepcopy(batterTracker), "bowlerTracker": copy.deepcopy(bowlerTracker), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
+                                        **ball_log.ball_delta(runOutRuns, 1, 0, bowlerTracker[blname]['ballLog'][-1], runOutRuns, 1, batterTracker[btname]['ballLog'][-1], dismissal="runOut"), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
                                     playerDismissed(onStrike)
                                     return
 
@@ -517,14 +424,12 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                             'displayName': bowlF['displayName'] ,
                                             "start": fTotal, "end": fTotal + bowlF['catchRate']})
                                         fTotal += bowlF['catchRate']
-                                    catcherDetermine = random.uniform(0, fTotal)
+                                    catcherDetermine = match.rng.delivery.uniform(0, fTotal)
                                     for fItem in fList:
                                         if(fItem['start'] <= catcherDetermine and fItem['end'] > catcherDetermine):
                                             catcher = {"playerInitials": fItem['playerInitials'],
                                             "displayName": fItem['displayName']}
 
-                                    print(over, f"{bowler['displayName']} to {batter['player']['displayName']}", 
-                                        "W", "Score: " + str(runs) + "/" + str(wickets), f"Caught by {catcher['displayName']}")
 
                                     ballLog.append(f"{str(balls)}:W-CaughtBy-{catcher['playerInitials']}")#add who caught for scorecard reference
                                     bowlerTracker[blname]['runs'] += int(prob['denomination'])
@@ -534,16 +439,15 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                     batterTracker[btname]['runs'] += int(prob['denomination'])
                                     batterTracker[btname]['ballLog'].append(f"{str(balls)}:W-CaughtBy-{catcher['playerInitials']}-Bowler-{blname}")
                                     batterTracker[btname]['balls'] += 1
+                                    batterTracker[btname]['dismissal'] = ball_log.dismissal_record("caught", balls, blname, catcher['playerInitials'])
 
-                                    innings1Log.append({"event" : over + f" {bowler['displayName']} to {batter['player']['displayName']}" +
+                                    match.record(1, {"event" : over + f" {bowler['displayName']} to {batter['player']['displayName']}" +
                                         " W" + " Score: " + str(runs) + "/" + str(wickets) + f" Caught by {catcher['displayName']}", "balls": balls,
-                                        "runs": runs, "batterTracker": copy.deepcopy(batterTracker), "bowlerTracker": copy.deepcopy(bowlerTracker), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
+                                        "runs": runs, **ball_log.ball_delta(int(prob['denomination']), 1, 1, bowlerTracker[blname]['ballLog'][-1], int(prob['denomination']), 1, batterTracker[btname]['ballLog'][-1], dismissal="caught", fielder=catcher['playerInitials']), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
                                     playerDismissed(onStrike)
                                     return
 
                                 elif(out_type == "bowled" or out_type == "lbw" or out_type == "hitwicket" or out_type == "stumped"):
-                                    print(over, f"{bowler['displayName']} to {batter['player']['displayName']}", 
-                                        "W", "Score: " + str(runs) + "/" + str(wickets), f"{out_type.title()}")
                                     ballLog.append(f"{str(balls)}:W")#add who caught for scorecard reference
                                     bowlerTracker[blname]['runs'] += int(prob['denomination'])
                                     bowlerTracker[blname]['ballLog'].append(f"{str(balls)}:W")
@@ -552,16 +456,16 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                     batterTracker[btname]['runs'] += int(prob['denomination'])
                                     batterTracker[btname]['ballLog'].append(f"{str(balls)}:W-{out_type}-Bowler-{blname}")
                                     batterTracker[btname]['balls'] += 1
-                                    innings1Log.append({"event": over + f" {bowler['displayName']} to {batter['player']['displayName']}" +
+                                    batterTracker[btname]['dismissal'] = ball_log.dismissal_record(out_type, balls, blname)
+                                    match.record(1, {"event": over + f" {bowler['displayName']} to {batter['player']['displayName']}" +
                                         " W" + " Score: " + str(runs) + "/" + str(wickets) + f" {out_type.title()}", "balls": balls,
-                                        "runs": runs, "batterTracker": copy.deepcopy(batterTracker), "bowlerTracker": copy.deepcopy(bowlerTracker), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
+                                        "runs": runs, **ball_log.ball_delta(int(prob['denomination']), 1, 1, bowlerTracker[blname]['ballLog'][-1], int(prob['denomination']), 1, batterTracker[btname]['ballLog'][-1], dismissal=out_type), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
                                     playerDismissed(onStrike)
                                     return
 
                                
                             else:
                                 # Strike Rotation
-                                print(over, f"{bowler['displayName']} to {batter['player']['displayName']}", prob['denomination'], "Score: " + str(runs) + "/" + str(wickets))
                                 ballLog.append(f"{str(balls)}:{prob['denomination']}")
                                 bowlerTracker[blname]['runs'] += int(prob['denomination'])
                                 bowlerTracker[blname]['ballLog'].append(f"{str(balls)}:{prob['denomination']}")
@@ -569,8 +473,8 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                 batterTracker[btname]['runs'] += int(prob['denomination'])
                                 batterTracker[btname]['ballLog'].append(f"{str(balls)}:{prob['denomination']}")
                                 batterTracker[btname]['balls'] += 1
-                                innings1Log.append({"event": over + f" {bowler['displayName']} to {batter['player']['displayName']} " + prob['denomination'] + " Score: " + str(runs) + "/" + str(wickets),
-                                    "balls": balls, "runs": runs, "batterTracker": copy.deepcopy(batterTracker), "bowlerTracker": copy.deepcopy(bowlerTracker), 
+                                match.record(1, {"event": over + f" {bowler['displayName']} to {batter['player']['displayName']} " + prob['denomination'] + " Score: " + str(runs) + "/" + str(wickets),
+                                    "balls": balls, "runs": runs, **ball_log.ball_delta(int(prob['denomination']), 1, 0, bowlerTracker[blname]['ballLog'][-1], int(prob['denomination']), 1, batterTracker[btname]['ballLog'][-1]), 
                                     "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
                                 return
 
@@ -587,7 +491,7 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                 outsLast10 += 1
 
         if(balls < 105):
-            adjust_last10 = random.uniform(0.02,0.04)
+            adjust_last10 = match.rng.delivery.uniform(0.02,0.04)
             if(outsLast10 < 2):
                 denAvg['0'] -= adjust_last10 * (1/2)
                 denAvg['1'] -= adjust_last10 * (1/2)
@@ -604,7 +508,7 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
 
 
         if(batterTracker[btname]['balls'] < 8 and balls < 80):
-            adjust = random.uniform(-0.01, 0.03)
+            adjust = match.rng.delivery.uniform(-0.01, 0.03)
             outAvg -= 0.015
             denAvg['0'] += adjust * (1.5/3)
             denAvg['1'] += adjust * (1/3)
@@ -613,7 +517,7 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
             denAvg['6'] -= adjust * (1.5/3)
 
         if(batterTracker[btname]['balls'] > 15 and batterTracker[btname]['balls'] < 30):
-            adjust = random.uniform(0.03, 0.07)
+            adjust = match.rng.delivery.uniform(0.03, 0.07)
             denAvg['0'] -= adjust * (1/3)
             # denAvg['1'] -= adjust *(1/3)
             denAvg['4'] += adjust * (1/3)
@@ -626,28 +530,28 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
         #     outAvg += 0.01
 
         if(batterTracker[btname]['balls'] > 20 and (batterTracker[btname]['runs'] / batterTracker[btname]['balls']) < 110):
-            adjust = random.uniform(0.05, 0.08)
+            adjust = match.rng.delivery.uniform(0.05, 0.08)
             denAvg['0'] += adjust * (1.5/3)
             denAvg['1'] += adjust * (0.5/3)
             denAvg['6'] += adjust * (2/3)
             outAvg += 0.05
 
         if(batterTracker[btname]['balls'] > 40 and (batterTracker[btname]['runs'] / batterTracker[btname]['balls']) < 120):
-            adjust = random.uniform(0.06, 0.09)
+            adjust = match.rng.delivery.uniform(0.06, 0.09)
             denAvg['0'] += adjust * (1.2/3)
             denAvg['1'] += adjust * (0.7/3)
             denAvg['6'] += adjust * (1.8/3)
             outAvg += 0.04
 
         if(batterTracker[btname]['balls'] > 30 and (batterTracker[btname]['runs'] / batterTracker[btname]['balls']) > 145 and (wickets < 5) or balls > 102):
-            adjust = random.uniform(0.06, 0.09)
+            adjust = match.rng.delivery.uniform(0.06, 0.09)
             denAvg['0'] -= adjust * (1/3)
             denAvg['1'] -= adjust * (1.5/3)
             denAvg['4'] += adjust * (1.6/3)
             denAvg['6'] += adjust * (1.9/3)
 
         if(balls > 105 and (runs / balls) < 1.17):
-            adjust = random.uniform(0.06, 0.09)
+            adjust = match.rng.delivery.uniform(0.06, 0.09)
             denAvg['0'] += adjust * (1.2/3)
             denAvg['1'] -= adjust * (1.6/3)
             denAvg['4'] += adjust * (1.4/3)
@@ -655,7 +559,7 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
             outAvg += 0.03
 
         elif(balls > 60 and (runs/balls) < 1.1):
-            adjust = random.uniform(0.06, 0.09)
+            adjust = match.rng.delivery.uniform(0.06, 0.09)
             denAvg['0'] -= adjust * (1.2/3)
             denAvg['1'] -= adjust * (0.8/3)
             denAvg['4'] += adjust * (1/3)
@@ -669,7 +573,7 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
             runRate = (runs/balls)*6
 
         if(balls < 12):
-            sixAdjustment = random.uniform(0.02, 0.05)
+            sixAdjustment = match.rng.delivery.uniform(0.02, 0.05)
             if(outAvg < 0.07):
                 outAvg = 0
             else:
@@ -686,14 +590,14 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
         elif(balls >= 12 and balls < 36): #works very well with 120, try to adjust a bit for death and middle but
         #dont tinker too much
             if(wickets == 0):
-                defenseAndOneAdjustment = random.uniform(0.05, 0.11)
+                defenseAndOneAdjustment = match.rng.delivery.uniform(0.05, 0.11)
                 denAvg['0'] -= defenseAndOneAdjustment * (2/3)
                 denAvg['1'] -= defenseAndOneAdjustment * (1/3)
                 denAvg['4'] += defenseAndOneAdjustment * (2/3)
                 denAvg['6'] += defenseAndOneAdjustment * (1/3)
                 getOutcome(denAvg, outAvg, over)
             else:
-                defenseAndOneAdjustment = random.uniform(0.02, 0.08)
+                defenseAndOneAdjustment = match.rng.delivery.uniform(0.02, 0.08)
                 denAvg['0'] -= defenseAndOneAdjustment * (2/3)
                 denAvg['1'] -= defenseAndOneAdjustment * (1/3)
                 denAvg['4'] += defenseAndOneAdjustment * (2.5/3)
@@ -705,14 +609,14 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
         elif(balls >= 36 and balls < 102): #works very well with 120, try to adjust a bit for death and middle but
         #dont tinker too much
             if(wickets < 3):
-                defenseAndOneAdjustment = random.uniform(0.05, 0.11)
+                defenseAndOneAdjustment = match.rng.delivery.uniform(0.05, 0.11)
                 denAvg['0'] -= defenseAndOneAdjustment * (1.5/3)
                 denAvg['1'] -= defenseAndOneAdjustment * (1/3)
                 denAvg['4'] += defenseAndOneAdjustment * (1.5/3)
                 denAvg['6'] += defenseAndOneAdjustment * (1/3)
                 getOutcome(denAvg, outAvg, over)
             else:
-                defenseAndOneAdjustment = random.uniform(0.02, 0.07)
+                defenseAndOneAdjustment = match.rng.delivery.uniform(0.02, 0.07)
                 denAvg['0'] -= defenseAndOneAdjustment * (1.6/3)
                 denAvg['1'] -= defenseAndOneAdjustment * (1.2/3)
                 denAvg['4'] += defenseAndOneAdjustment * (2.1/3)
@@ -724,7 +628,7 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
         else: #works very well with 120, try to adjust a bit for death and middle but
         #dont tinker too much
             if(wickets < 7):
-                defenseAndOneAdjustment = random.uniform(0.07, 0.1)
+                defenseAndOneAdjustment = match.rng.delivery.uniform(0.07, 0.1)
                 denAvg['0'] -= defenseAndOneAdjustment * (0.4/3)
                 denAvg['1'] -= defenseAndOneAdjustment * (1/3)
                 denAvg['4'] += defenseAndOneAdjustment * (1.4/3)
@@ -732,7 +636,7 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                 outAvg += 0.01
                 getOutcome(denAvg, outAvg, over)
             else:
-                defenseAndOneAdjustment = random.uniform(0.07, 0.09)
+                defenseAndOneAdjustment = match.rng.delivery.uniform(0.07, 0.09)
                 denAvg['0'] -= defenseAndOneAdjustment * (0.4/3)
                 denAvg['1'] -= defenseAndOneAdjustment * (1.8/3)
                 denAvg['4'] += defenseAndOneAdjustment * (1.5/3)
@@ -799,8 +703,8 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                     break
                 else:
                     # print(overBowler['byBatsman']['right-hand bat']['bowlRunDenominationsObject']['4'])
-                    delivery(copy.deepcopy(overBowler), copy.deepcopy(
-                        onStrike), str(i) + "." + str(n + 1))
+                    delivery(overBowler, onStrike, str(i) + "." + str(n + 1))
+                    yield stepState(overBowler)
                     n += 1
             lastOver = overBowler['playerInitials']
         elif(i == 1):
@@ -811,8 +715,8 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                     break
                 else:
                     # print(overBowler['byBatsman']['right-hand bat']['bowlRunDenominationsObject']['4'])
-                    delivery(copy.deepcopy(overBowler), copy.deepcopy(
-                        onStrike), str(i) + "." + str(n + 1))
+                    delivery(overBowler, onStrike, str(i) + "." + str(n + 1))
+                    yield stepState(overBowler)
                     n += 1
             lastOver = overBowler['playerInitials']
 
@@ -826,7 +730,7 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                         localBowling = sorted(bowling, key=lambda k: k['overNumbersObject'][str(i)])
                         localBowling.reverse()
                         while(not valid):
-                            pick = localBowling[random.randint(0,3)]
+                            pick = localBowling[match.rng.bowling.randint(0,3)]
                             pickInfo = bowlerTracker[pick['playerInitials']]
                             if(pickInfo['balls'] < 11 and lastOver != pick['playerInitials']):
                                 bowlerToReturn = pick
@@ -850,8 +754,8 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                     break
                 else:
                     # print(overBowler['byBatsman']['right-hand bat']['bowlRunDenominationsObject']['4'])
-                    delivery(copy.deepcopy(overBowler), copy.deepcopy(
-                        onStrike), str(i) + "." + str(n + 1))
+                    delivery(overBowler, onStrike, str(i) + "." + str(n + 1))
+                    yield stepState(overBowler)
                     n += 1
             lastOver = overBowler['playerInitials']
 
@@ -888,7 +792,7 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                 expIndex += 1
 
                             while(not valid):
-                                pick = bowlingMiddle[random.randint(0,loopIndex)]
+                                pick = bowlingMiddle[match.rng.bowling.randint(0,loopIndex)]
                                 pickInfo = bowlerTracker[pick['playerInitials']]
                                 if(pickInfo['balls'] == 0):
                                     bowlerToReturn = pick
@@ -945,7 +849,7 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                         break
                                     expIndex += 1
                                 while(not valid):
-                                    pick = bowlingMiddle[random.randint(0,loopIndex)]
+                                    pick = bowlingMiddle[match.rng.bowling.randint(0,loopIndex)]
                                     pickInfo = bowlerTracker[pick['playerInitials']]
                                     if(pickInfo['balls'] == 0):
                                         bowlerToReturn = pick
@@ -990,8 +894,8 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                     break
                 else:
                     # print(overBowler['byBatsman']['right-hand bat']['bowlRunDenominationsObject']['4'])
-                    delivery(copy.deepcopy(overBowler), copy.deepcopy(
-                        onStrike), str(i) + "." + str(n + 1))
+                    delivery(overBowler, onStrike, str(i) + "." + str(n + 1))
+                    yield stepState(overBowler)
                     n += 1
             lastOver = overBowler['playerInitials']
 
@@ -1049,8 +953,8 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                     break
                 else:
                     # print(overBowler['byBatsman']['right-hand bat']['bowlRunDenominationsObject']['4'])
-                    delivery(copy.deepcopy(overBowler), copy.deepcopy(
-                        onStrike), str(i) + "." + str(n + 1))
+                    delivery(overBowler, onStrike, str(i) + "." + str(n + 1))
+                    yield stepState(overBowler)
                     n += 1
             lastOver = overBowler['playerInitials']
 
@@ -1058,69 +962,32 @@ def innings1(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
             
     # print(batterTracker)
     # print(bowlerTracker)
+    battingCard, _ = scorecard.batting_card(batterTracker)
     batsmanTabulate = []
-    for btckd in batterTracker:
-        localArrayTabulate = [btckd]
-        localArrayTabulate += [batterTracker[btckd]['runs'], batterTracker[btckd]['balls']]
-        sr_ = 'NA'
-        if(batterTracker[btckd]['balls'] != 0):
-            sr_ = (batterTracker[btckd]['runs']*100) / (batterTracker[btckd]['balls'])
-            sr_ = str(round(sr_, 2))
-            localArrayTabulate.append(sr_)
-        out = False
-        howOut = "DNB"
-        batted = False
-        for b in batterTracker[btckd]['ballLog']:
-            batted = True
-            if("W" in b):
-                out = True
-                if("CaughtBy" in b):
-                    splitOT = b.split("-")
-                    lcatcher = splitOT[2]
-                    lbowler = splitOT[-1]
-                    howOut = f"c {lcatcher} b {lbowler}"
-                elif("runout" in b):
-                    howOut = "Run out"
-                else:
-                    splitOT = b.split("-")
-                    howOut = f"{splitOT[1]} b {splitOT[-1]}"
-            else:
-                howOut = "Not out"
-        localArrayTabulate.append(howOut)
-        batsmanTabulate.append(localArrayTabulate)
-        
+    for btckd, row in battingCard.items():
+        sr_ = row['strike_rate'] if row['strike_rate'] is not None else 'NA'
+        batsmanTabulate.append([btckd, row['runs'], row['balls'], sr_, row['how_out']])
 
     bowlerTabulate = []
-    for btrack in bowlerTracker:
-        localBowlerTabulate = [btrack, bowlerTracker[btrack]['runs']]
-        overs_tb = 0
-        remainder_balls = bowlerTracker[btrack]['balls'] % 6 
-        number_overs = bowlerTracker[btrack]['balls'] // 6
-        localBowlerTabulate.append(f"{number_overs}.{remainder_balls}")
-        localBowlerTabulate.append(bowlerTracker[btrack]['wickets'])
-        econ_tb = "NA"
-        if(bowlerTracker[btrack]['balls'] != 0):
-            econ_tb = (bowlerTracker[btrack]['runs'] / bowlerTracker[btrack]['balls'])*6
-            econ_tb = str(round(econ_tb, 2))
-        localBowlerTabulate.append(econ_tb)
-        bowlerTabulate.append(localBowlerTabulate)
-
-    print(tabulate(batsmanTabulate, ["Player", "Runs", "Balls", "SR" ,"Out"], tablefmt="grid"))
-    print(tabulate(bowlerTabulate, ["Player", "Runs", "Overs", "Wickets", "Eco"], tablefmt="grid"))
-        
-    target = runs + 1
-    innings1Balls = balls
-    innings1Runs = runs
-    innings1Batting = tabulate(batsmanTabulate, ["Player", "Runs", "Balls", "SR" ,"Out"], tablefmt="grid")
-    innings1Bowling = tabulate(bowlerTabulate, ["Player", "Runs", "Overs", "Wickets", "Eco"], tablefmt="grid")
-
-    innings1Battracker = batterTracker
-    innings1Bowltracker = bowlerTracker
+    for btrack, row in scorecard.bowling_card(bowlerTracker).items():
+        econ_tb = row['economy'] if row['economy'] is not None else "NA"
+        bowlerTabulate.append([btrack, row['runs'], row['overs'], row['wickets'], econ_tb])
 
-def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, dew, detoriate):
+        
+    match.target = runs + 1
+    match.innings1Balls = balls
+    match.innings1Runs = runs
+    match.innings1Batting = tabulate(batsmanTabulate, ["Player", "Runs", "Balls", "SR" ,"Out"], tablefmt="grid")
+    match.innings1Bowling = tabulate(bowlerTabulate, ["Player", "Runs", "Overs", "Wickets", "Eco"], tablefmt="grid")
+    match.innings1Battracker = batterTracker
+    match.innings1Bowltracker = bowlerTracker
+    match.sink.emit("scorecard", {"innings": 1, "batting": match.innings1Batting, "bowling": match.innings1Bowling})
+
+def innings2(match, batting, bowling, battingName, bowlingName, pace, spin, outfield, dew, detoriate):
+    """Simulates the chase as a generator; yields like innings1 and also settles the result."""
     # print(battingName, bowlingName, pace, spin, outfield, dew, detoriate)
-    global innings2Batting, innings2Bowling, innings2Runs, innings2Balls, winner, winMsg, innings2Bowltracker, innings2Battracker, innings2Log
     bowlerTracker = {} #add names of all in innings def
+    pitchBowling = {} # playerInitials -> (bowlOutsRate, bowlRunDenominations) with the pitch effect applied
     batterTracker = {} #add names of all in innings def
     battingOrder = []
     catchingOrder = []
@@ -1133,108 +1000,40 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
     # break or spin; medium or fast
 
     # Deciding batting order
+    # Probability tables come precompiled on each player (see player_model)
     for i in batting:
-        batterTracker[i['playerInitials']] = {'playerInitials': i['playerInitials'], 'balls': 0, 'runs': 0, 'ballLog': []}
-        runObj = {}
-        outObj = {}
-
-        i['batBallsTotal'] += 1
-        for run in i['batRunDenominations']:
-            runObj[run] = i['batRunDenominations'][run] / i['batBallsTotal']
-        i['batRunDenominationsObject'] = runObj
-
-        for out in i['batOutTypes']:
-            outObj[out] = i['batOutTypes'][out] / i['batBallsTotal']
-        i['batOutTypesObject'] = outObj
-
-        # for styles in i['byBowler']:
-
-        #     runObj2 = {}
-        #     outObj2 = {}
-        #     batOutsRate = i['byBowler'][styles]['batOutsTotal'] / \
-        #         i['byBowler'][styles]['batBallsTotal']
-        #     i['byBowler'][styles]['batOutsRate'] = batOutsRate
-        #     for run in i['byBowler'][styles]['batRunDenominations']:
-        #         runObj2[run] = i['byBowler'][styles]['batRunDenominations'][run] / \
-        #             i['byBowler'][styles]['batBallsTotal']
-        #     i['byBowler'][styles]['batRunDenominationsObject'] = runObj2
-        #     for out in i['byBowler'][styles]['batOutTypes']:
-        #         outObj2[out] = i['byBowler'][styles]['batOutTypes'][out] / \
-        #             i['byBowler'][styles]['batBallsTotal']
-        #     i['byBowler'][styles]['batOutTypesObject'] = outObj2
-
-        i['batOutsRate'] = i['batOutsTotal'] / i['batBallsTotal']
-
-        newPos = []
-        posAvgObj = {"0": 0, "1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "6": 0, "7":0,"8": 0, "9":0, "10":0}
-        for p in i['position']:
-            if(p != "null"):
-                newPos.append(p)
-        posTotal = sum(newPos)
-        for p in newPos:
-            if(str(p) in posAvgObj):
-                posAvgObj[str(p)] += 1
-            else:
-                posAvgObj[str(p)] = 1
-
-        for key_p in posAvgObj:
-            posAvgObj[key_p] = posAvgObj[key_p]/i['matches'] 
-
-        if(len(newPos) != 0):
-            posAvg = posTotal/len(newPos)
-        else:
-            posAvg = 9.0
-        battingOrder.append({"posAvg": posAvg, "player": i, "posAvgsAll": posAvgObj})
+        batterTracker[i['playerInitials']] = {'playerInitials': i['playerInitials'], 'balls': 0, 'runs': 0, 'ballLog': [], 'dismissal': None, 'arrival': None}
+        battingOrder.append({"posAvg": i['posAvg'], "player": i, "posAvgsAll": i['posAvgsAll']})
 
     battingOrder = sorted(battingOrder, key=lambda k: k['posAvg'])
     catchingOrder = sorted(catchingOrder, key=lambda k: k['catchRate'])
 
     for i in bowling:
-        i['bowlBallsTotalRate'] = i['bowlBallsTotal'] / i['matches']
         bowlerTracker[i['playerInitials']] = {'playerInitials': i['playerInitials'], 'balls': 0, 
         'runs': 0, 'ballLog': [], 'overs': 0, 'wickets': 0}
-        runObj = {}
-        outObj = {}
-        i['catchRate'] = i['catches'] / i['matches']
-        i['bowlWideRate'] = i['bowlWides'] / (i['bowlBallsTotal'] + 1)
-        i['bowlNoballRate'] = i['bowlNoballs'] / (i['bowlBallsTotal'] + 1)
-        i['bowlBallsTotal'] += 1
-        for run in i['bowlRunDenominations']:
-            runObj[run] = i['bowlRunDenominations'][run] / i['bowlBallsTotal']
-        i['bowlRunDenominationsObject'] = runObj
-
-        for out in i['bowlOutTypes']:
-            outObj[out] = i['bowlOutTypes'][out] / i['bowlBallsTotal']
-        i['bowlOutTypesObject'] = outObj
-
-        # for styles in i['byBatsman']:
-        #     runObj2 = {}
-        #     outObj2 = {}
-        #     bowlOutsRate = i['byBatsman'][styles]['bowlOutsTotal'] / \
-        #         i['byBatsman'][styles]['bowlBallsTotal']
-        #     i['byBatsman'][styles]['bowlOutsRate'] = batOutsRate
-        #     for run in i['byBatsman'][styles]['bowlRunDenominations']:
-        #         runObj2[run] = i['byBatsman'][styles]['bowlRunDenominations'][run] / \
-        #             i['byBatsman'][styles]['bowlBallsTotal']
-        #     i['byBatsman'][styles]['bowlRunDenominationsObject'] = runObj2
-        #     for out in i['byBatsman'][styles]['bowlOutTypes']:
-        #         outObj2[out] = i['byBatsman'][styles]['bowlOutTypes'][out] / \
-        #             i['byBatsman'][styles]['bowlBallsTotal']
-        #     i['byBatsman'][styles]['bowlOutTypesObject'] = outObj2
-
-        i['bowlOutsRate'] = i['bowlOutsTotal'] / i['bowlBallsTotal']
-
-        obj = {"20": 0, "1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "6": 0, "7": 0, "8": 0, "9": 0,
-               "10": 0, "11": 0, "12": 0, "13": 0, "14": 0, "15": 0, "16": 0, "17": 0, "18": 0, "19": 0}
-        for over in i['overNumbers']:
-            obj[over] += 1
-        for keys in obj:
-            if(i['matches'] != 0):
-                avg = obj[keys]/i['matches']
-            else:
-                avg = -1
-            obj[keys] = avg
-        i['overNumbersObject'] = obj
+
+        # The pitch effect only depends on the bowler and this innings' conditions,
+        # so each bowler's adjusted out rate and run table are built once here
+        bowlOutsRate = i['bowlOutsRate']
+        bowlRunDenominations = dict(i['bowlRunDenominationsObject'])
+        # Increase effect and divide from negative things for bowler to positive (W, 1, 0)
+        if('break' or 'spin' in i['bowlStyle']):
+            effect = (1.0 - spin)/2
+            # print("effect:", effect, "original:", spin)
+            bowlOutsRate += (effect * 0.22)
+            bowlRunDenominations['0'] += (effect * 0.18)
+            bowlRunDenominations['1'] += (effect * 0.22)
+            bowlRunDenominations['4'] -= (effect * 0.4)
+            bowlRunDenominations['6'] -= (effect * 0.3)
+        elif('medium' or 'fast' in i['bowlStyle']):
+            effect = (1.0 - fast)/2
+            # print("effect:", effect, "original:", fast)
+            bowlOutsRate += (effect * 0.22)
+            bowlRunDenominations['0'] += (effect * 0.18)
+            bowlRunDenominations['1'] += (effect * 0.22)
+            bowlRunDenominations['4'] -= (effect * 0.4)
+            bowlRunDenominations['6'] -= (effect * 0.3)
+        pitchBowling[i['playerInitials']] = (bowlOutsRate, bowlRunDenominations)
 
     bowling = sorted(bowling, key=lambda k: k['bowlOutsRate'])
     bowling.reverse()
@@ -1258,12 +1057,20 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
 
     lastOver = None
 
+    def stepState(overBowler):
+        # Everything a caller needs to show or store the innings after a ball;
+        # plain strings, numbers and the live trackers, so it serializes as JSON
+        return {"innings": 2, "runs": runs, "balls": balls, "wickets": wickets, "target": match.target,
+                "batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'],
+                "onStrike": onStrike['player']['playerInitials'], "bowler": overBowler['playerInitials'],
+                "lastOver": lastOver, "batterTracker": batterTracker, "bowlerTracker": bowlerTracker}
+
 
     def playerDismissed(player):
         nonlocal batter1, batter2, onStrike, targetChased
         # print("OUT", player['player']['playerInitials'])
         if(wickets == 10):
-            print("ALL OUT")
+            match.sink.emit("all_out", {"innings": 2})
         else:
             if(batter1 == player):
                 onStrike = battingOrder[wickets + 1]
@@ -1303,7 +1110,11 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
 
     def delivery(bowler, batter, over):
         nonlocal batterTracker, bowlerTracker, onStrike, ballLog, balls, runs, wickets, targetChased
-        global winner, winMsg, innings2Log
+        # Both batters at the crease for this ball have come in; numbered in order for the scorecard
+        for atCrease in (batter1, batter2):
+            creaseStats = batterTracker[atCrease['player']['playerInitials']]
+            if creaseStats['arrival'] is None:
+                creaseStats['arrival'] = 1 + sum(1 for stats in batterTracker.values() if stats['arrival'] is not None)
 
         batInfo = None
         bowlInfo = None
@@ -1327,37 +1138,19 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
         #     bowlInfo = bowler
 
         bowlInfo = bowler
-
-
-        # Increase effect and divide from negative things for bowler to positive (W, 1, 0)
-        if('break' or 'spin' in bowler['bowlStyle']):
-            effect = (1.0 - spin)/2
-            # print("effect:", effect, "original:", spin)
-            bowlInfo['bowlOutsRate'] += (effect * 0.22)
-            bowlInfo['bowlRunDenominationsObject']['0'] += (effect * 0.18)
-            bowlInfo['bowlRunDenominationsObject']['1'] += (effect * 0.22)
-            bowlInfo['bowlRunDenominationsObject']['4'] -= (effect * 0.4)
-            bowlInfo['bowlRunDenominationsObject']['6'] -= (effect * 0.3)
-        elif('medium' or 'fast' in bowler['bowlStyle']):
-            effect = (1.0 - fast)/2
-            # print("effect:", effect, "original:", fast)
-            bowlInfo['bowlOutsRate'] += (effect * 0.22)
-            bowlInfo['bowlRunDenominationsObject']['0'] += (effect * 0.18)
-            bowlInfo['bowlRunDenominationsObject']['1'] += (effect * 0.22)
-            bowlInfo['bowlRunDenominationsObject']['4'] -= (effect * 0.4)
-            bowlInfo['bowlRunDenominationsObject']['6'] -= (effect * 0.3)
+        bowlOutsRate, bowlRunDenominations = pitchBowling[blname]
 
         # print(batInfo)
         denAvg = {}
-        outAvg = (batInfo['batOutsRate'] + bowlInfo['bowlOutsRate']) / 2
+        outAvg = (batInfo['batOutsRate'] + bowlOutsRate) / 2
         outTypeAvg = {}
         runoutChance = 0.01
         if(batter['player']['batOutsTotal'] != 0):
-            runoutChance = (batter['player']['runnedOut']) / batter['player']['batBallsTotal']
+            runoutChance = batter['player']['runOutRate']
 
         for batKey in batInfo['batRunDenominationsObject']:
             denAvg[batKey] = (batInfo['batRunDenominationsObject']
-                              [batKey] + bowlInfo['bowlRunDenominationsObject'][batKey])/2
+                              [batKey] + bowlRunDenominations[batKey])/2
 
         runRate = 0
         for a,b in zip(batInfo['batOutTypesObject'], bowlInfo['bowlOutTypesObject']):
@@ -1368,17 +1161,15 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
 
         def getOutcome(den, out, over):
             nonlocal batterTracker, bowlerTracker, runs, balls, ballLog, wickets, onStrike
-            global innings2Log
 
             # print(den)
-            if(wideRate > random.uniform(0,1)): #add batter tracking & bowler tracking logs, read ln 267 & ln 255
+            if(wideRate > match.rng.delivery.uniform(0,1)): #add batter tracking & bowler tracking logs, read ln 267 & ln 255
              runs += 1
-             print(over, f"{bowler['displayName']} to {batter['player']['displayName']}", "Wide", "Score: " + str(runs) + "/" + str(wickets))
              ballLog.append(f"{str(balls)}:WD")
              bowlerTracker[blname]['runs'] += 1
              bowlerTracker[blname]['ballLog'].append(f"{str(balls)}:WD")
-             innings2Log.append({"event": over + f" {bowler['displayName']} to {batter['player']['displayName']}" + " Wide" + " Score: " + str(runs) + "/" + str(wickets), 
-                "balls": balls, "batterTracker": copy.deepcopy(batterTracker), "bowlerTracker": copy.deepcopy(bowlerTracker), 
+             match.record(2, {"event": over + f" {bowler['displayName']} to {batter['player']['displayName']}" + " Wide" + " Score: " + str(runs) + "/" + str(wickets), 
+                "balls": balls, **ball_log.ball_delta(1, 0, 0, bowlerTracker[blname]['ballLog'][-1], extras=1), 
                 "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "runs": runs, "wickets": wickets})
              return
 
@@ -1396,13 +1187,12 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                     denominationProbabilties.append(denomObj)
                     last += den[denom]
 
-                decider = random.uniform(0, total)
+                decider = match.rng.delivery.uniform(0, total)
                 for prob in denominationProbabilties:
                     if(prob['start'] <= decider and prob['end'] > decider):
                         # Next - add wicket types, extras, bowler rotation, new batsman, innings change, aggression changes based on over number and rr, and based on last 10 ball player form
                         runs += int(prob['denomination'])
                         if(prob['denomination'] != '0'):
-                            print(over, f"{bowler['displayName']} to {batter['player']['displayName']}", prob['denomination'], "Score: " + str(runs) + "/" + str(wickets))
                             
                             bowlerTracker[blname]['runs'] += int(prob['denomination'])
                             bowlerTracker[blname]['ballLog'].append(f"{str(balls)}:{prob['denomination']}")
@@ -1410,8 +1200,8 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                             batterTracker[btname]['runs'] += int(prob['denomination'])
                             batterTracker[btname]['ballLog'].append(f"{str(balls)}:{prob['denomination']}")
                             batterTracker[btname]['balls'] += 1
-                            innings2Log.append({"event" : over + f" {bowler['displayName']} to {batter['player']['displayName']} " + prob['denomination'] + " Score: " + str(runs) + "/" + str(wickets), "balls": balls, 
-                                "runs": runs, "batterTracker": copy.deepcopy(batterTracker), "bowlerTracker": copy.deepcopy(bowlerTracker), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})                            
+                            match.record(2, {"event" : over + f" {bowler['displayName']} to {batter['player']['displayName']} " + prob['denomination'] + " Score: " + str(runs) + "/" + str(wickets), "balls": balls, 
+                                "runs": runs, **ball_log.ball_delta(int(prob['denomination']), 1, 0, bowlerTracker[blname]['ballLog'][-1], int(prob['denomination']), 1, batterTracker[btname]['ballLog'][-1]), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})                            
                             ballLog.append(f"{str(balls)}:{prob['denomination']}")
 
                             if(int(prob['denomination']) % 2 == 1):
@@ -1424,7 +1214,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                         if(prob['denomination'] == '0'): #during high rrr or death overs, probability
                         #of boundary & wicket are both higher
                             probOut = outAvg*(total/den['0'])
-                            outDecider = random.uniform(0, 1)
+                            outDecider = match.rng.delivery.uniform(0, 1)
                             # print(over, outDecider)
                             if(probOut > outDecider): #change to >
                                 wickets += 1
@@ -1439,17 +1229,15 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                      "end": last_o + outTypeAvg[out_k]}
                                     probs_o.append(outobj)
                                     last_o += outTypeAvg[out_k]
-                                typeDeterminer = random.uniform(0, total_o)
+                                typeDeterminer = match.rng.delivery.uniform(0, total_o)
                                 for type_ in probs_o:
                                     if(type_['start'] <= typeDeterminer and type_['end'] > typeDeterminer):
                                         out_type = type_['type']
                                 # print("OUTTTT", typeDeterminer, probs_o)
 
                                 if(out_type == "runOut"): #dodismissal function
-                                    runOutRuns = random.randint(0,2)
+                                    runOutRuns = match.rng.delivery.randint(0,2)
                                     runs += runOutRuns
-                                    print(over, f"{bowler['displayName']} to {batter['player']['displayName']}", 
-                                        "W", "Score: " + str(runs) + "/" + str(wickets), "Run Out!")
                                     ballLog.append(f"{str(balls)}:W")
                                     bowlerTracker[blname]['runs'] += runOutRuns
                                     bowlerTracker[blname]['ballLog'].append(f"{str(balls)}:W{runOutRuns}-runout")
@@ -1457,9 +1245,10 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                     batterTracker[btname]['runs'] += runOutRuns
                                     batterTracker[btname]['ballLog'].append(f"{str(balls)}:{runOutRuns}")
                                     batterTracker[btname]['balls'] += 1
-                                    innings2Log.append({"event" : over + f" {bowler['displayName']} to {batter['player']['displayName']}" + 
+                                    batterTracker[btname]['dismissal'] = ball_log.dismissal_record("runOut", balls)
+                                    match.record(2, {"event" : over + f" {bowler['displayName']} to {batter['player']['displayName']}" + 
                                         " W" + " Score: " + str(runs) + "/" + str(wickets) + " Run Out!", "balls": balls, "runs": runs,
-                                        "batterTracker": copy.deepcopy(batterTracker), "bowlerTracker": copy.deepcopy(bowlerTracker), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
+                                        **ball_log.ball_delta(runOutRuns, 1, 0, bowlerTracker[blname]['ballLog'][-1], runOutRuns, 1, batterTracker[btname]['ballLog'][-1], dismissal="runOut"), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
                                     playerDismissed(onStrike)
                                     return
 
@@ -1480,14 +1269,12 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                             'displayName': bowlF['displayName'] ,
                                             "start": fTotal, "end": fTotal + bowlF['catchRate']})
                                         fTotal += bowlF['catchRate']
-                                    catcherDetermine = random.uniform(0, fTotal)
+                                    catcherDetermine = match.rng.delivery.uniform(0, fTotal)
                                     for fItem in fList:
                                         if(fItem['start'] <= catcherDetermine and fItem['end'] > catcherDetermine):
                                             catcher = {"playerInitials": fItem['playerInitials'],
                                             "displayName": fItem['displayName']}
 
-                                    print(over, f"{bowler['displayName']} to {batter['player']['displayName']}", 
-                                        "W", "Score: " + str(runs) + "/" + str(wickets), f"Caught by {catcher['displayName']}")
 
                                     ballLog.append(f"{str(balls)}:W-CaughtBy-{catcher['playerInitials']}")#add who caught for scorecard reference
                                     bowlerTracker[blname]['runs'] += int(prob['denomination'])
@@ -1497,16 +1284,15 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                     batterTracker[btname]['runs'] += int(prob['denomination'])
                                     batterTracker[btname]['ballLog'].append(f"{str(balls)}:W-CaughtBy-{catcher['playerInitials']}-Bowler-{blname}")
                                     batterTracker[btname]['balls'] += 1
+                                    batterTracker[btname]['dismissal'] = ball_log.dismissal_record("caught", balls, blname, catcher['playerInitials'])
 
-                                    innings2Log.append({"event" : over + f" {bowler['displayName']} to {batter['player']['displayName']}" +
+                                    match.record(2, {"event" : over + f" {bowler['displayName']} to {batter['player']['displayName']}" +
                                         " W" + " Score: " + str(runs) + "/" + str(wickets) + f" Caught by {catcher['displayName']}", "balls": balls,
-                                        "runs": runs, "batterTracker": copy.deepcopy(batterTracker), "bowlerTracker": copy.deepcopy(bowlerTracker), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
+                                        "runs": runs, **ball_log.ball_delta(int(prob['denomination']), 1, 1, bowlerTracker[blname]['ballLog'][-1], int(prob['denomination']), 1, batterTracker[btname]['ballLog'][-1], dismissal="caught", fielder=catcher['playerInitials']), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
                                     playerDismissed(onStrike)
                                     return
 
                                 elif(out_type == "bowled" or out_type == "lbw" or out_type == "hitwicket" or out_type == "stumped"):
-                                    print(over, f"{bowler['displayName']} to {batter['player']['displayName']}", 
-                                        "W", "Score: " + str(runs) + "/" + str(wickets), f"{out_type.title()}")
                                     ballLog.append(f"{str(balls)}:W")#add who caught for scorecard reference
                                     bowlerTracker[blname]['runs'] += int(prob['denomination'])
                                     bowlerTracker[blname]['ballLog'].append(f"{str(balls)}:W")
@@ -1515,16 +1301,16 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                     batterTracker[btname]['runs'] += int(prob['denomination'])
                                     batterTracker[btname]['ballLog'].append(f"{str(balls)}:W-{out_type}-Bowler-{blname}")
                                     batterTracker[btname]['balls'] += 1
-                                    innings2Log.append({"event": over + f" {bowler['displayName']} to {batter['player']['displayName']}" +
+                                    batterTracker[btname]['dismissal'] = ball_log.dismissal_record(out_type, balls, blname)
+                                    match.record(2, {"event": over + f" {bowler['displayName']} to {batter['player']['displayName']}" +
                                         " W" + " Score: " + str(runs) + "/" + str(wickets) + f" {out_type.title()}", "balls": balls,
-                                        "runs": runs, "batterTracker": copy.deepcopy(batterTracker), "bowlerTracker": copy.deepcopy(bowlerTracker), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
+                                        "runs": runs, **ball_log.ball_delta(int(prob['denomination']), 1, 1, bowlerTracker[blname]['ballLog'][-1], int(prob['denomination']), 1, batterTracker[btname]['ballLog'][-1], dismissal=out_type), "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
                                     playerDismissed(onStrike)
                                     return
 
                                
                             else:
                                 # Strike Rotation
-                                print(over, f"{bowler['displayName']} to {batter['player']['displayName']}", prob['denomination'], "Score: " + str(runs) + "/" + str(wickets))
                                 ballLog.append(f"{str(balls)}:{prob['denomination']}")
                                 bowlerTracker[blname]['runs'] += int(prob['denomination'])
                                 bowlerTracker[blname]['ballLog'].append(f"{str(balls)}:{prob['denomination']}")
@@ -1532,8 +1318,8 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                 batterTracker[btname]['runs'] += int(prob['denomination'])
                                 batterTracker[btname]['ballLog'].append(f"{str(balls)}:{prob['denomination']}")
                                 batterTracker[btname]['balls'] += 1
-                                innings2Log.append({"event": over + f" {bowler['displayName']} to {batter['player']['displayName']} " + prob['denomination'] + " Score: " + str(runs) + "/" + str(wickets),
-                                    "balls": balls, "runs": runs, "batterTracker": copy.deepcopy(batterTracker), "bowlerTracker": copy.deepcopy(bowlerTracker), 
+                                match.record(2, {"event": over + f" {bowler['displayName']} to {batter['player']['displayName']} " + prob['denomination'] + " Score: " + str(runs) + "/" + str(wickets),
+                                    "balls": balls, "runs": runs, **ball_log.ball_delta(int(prob['denomination']), 1, 0, bowlerTracker[blname]['ballLog'][-1], int(prob['denomination']), 1, batterTracker[btname]['ballLog'][-1]), 
                                     "batsman": btname,"batter1": batter1['player']['playerInitials'], "batter2": batter2['player']['playerInitials'] , "bowler": blname, "wickets": wickets})
                                 return
 
@@ -1548,7 +1334,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                 outsLast10 += 1
 
         if(balls < 105):
-            adjust_last10 = random.uniform(0.02,0.04)
+            adjust_last10 = match.rng.delivery.uniform(0.02,0.04)
             if(outsLast10 < 2):
                 denAvg['0'] -= adjust_last10 * (1/2)
                 denAvg['1'] -= adjust_last10 * (1/2)
@@ -1565,7 +1351,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
 
 
         if(batterTracker[btname]['balls'] < 8 and balls < 80):
-            adjust = random.uniform(-0.01, 0.03)
+            adjust = match.rng.delivery.uniform(-0.01, 0.03)
             outAvg -= 0.015
             denAvg['0'] += adjust * (1.5/3)
             denAvg['1'] += adjust * (1/3)
@@ -1574,7 +1360,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
             denAvg['6'] -= adjust * (1.5/3)
 
         if(batterTracker[btname]['balls'] > 15 and batterTracker[btname]['balls'] < 30):
-            adjust = random.uniform(0.03, 0.07)
+            adjust = match.rng.delivery.uniform(0.03, 0.07)
             denAvg['0'] -= adjust * (1/3)
             # denAvg['1'] -= adjust *(1/3)
             denAvg['4'] += adjust * (1/3)
@@ -1587,21 +1373,21 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
         #     outAvg += 0.01
 
         if(batterTracker[btname]['balls'] > 20 and (batterTracker[btname]['runs'] / batterTracker[btname]['balls']) < 110):
-            adjust = random.uniform(0.05, 0.08)
+            adjust = match.rng.delivery.uniform(0.05, 0.08)
             denAvg['0'] += adjust * (1.5/3)
             denAvg['1'] += adjust * (0.5/3)
             denAvg['6'] += adjust * (2/3)
             outAvg += 0.05
 
         if(batterTracker[btname]['balls'] > 40 and (batterTracker[btname]['runs'] / batterTracker[btname]['balls']) < 135):
-            adjust = random.uniform(0.06, 0.09)
+            adjust = match.rng.delivery.uniform(0.06, 0.09)
             denAvg['0'] += adjust * (1.5/3)
             denAvg['1'] += adjust * (0.7/3)
             denAvg['6'] += adjust * (1.8/3)
             outAvg += 0.04
 
         if(batterTracker[btname]['balls'] > 30 and (batterTracker[btname]['runs'] / batterTracker[btname]['balls']) > 145 and (wickets < 5) or balls > 102):
-            adjust = random.uniform(0.06, 0.09)
+            adjust = match.rng.delivery.uniform(0.06, 0.09)
             denAvg['0'] -= adjust * (1/3)
             denAvg['1'] -= adjust * (1.5/3)
             denAvg['4'] += adjust * (1.6/3)
@@ -1613,12 +1399,12 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
             rr = runs / balls
 
         if(balls < 120):
-            rrr = (target - runs) / (120 - balls)
+            rrr = (match.target - runs) / (120 - balls)
 
         if(balls < 12):
             # print(rrr)
             if(rrr < 1.5):
-                sixAdjustment = random.uniform(0.02, 0.05)
+                sixAdjustment = match.rng.delivery.uniform(0.02, 0.05)
                 if(outAvg < 0.07):
                     outAvg = 0
                 else:
@@ -1637,7 +1423,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
         elif(balls < 36):
             rrro = rrr*6
             if(rrro < 8):
-                adjust = random.uniform(0.05, 0.09)
+                adjust = match.rng.delivery.uniform(0.05, 0.09)
                 denAvg['6'] -= adjust * (2/3)
                 denAvg['4'] -= adjust * (1/3)
                 denAvg['1'] += adjust
@@ -1645,7 +1431,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                 getOutcome(denAvg, outAvg, over)
 
             elif(rrro >= 8 and rrro <= 10.4):
-                adjust = random.uniform(0.04, 0.08)
+                adjust = match.rng.delivery.uniform(0.04, 0.08)
                 denAvg['6'] += adjust * (0.6/3)
                 denAvg['4'] += adjust * (1/3)
                 denAvg['0'] += adjust * (1/3)
@@ -1655,7 +1441,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                 getOutcome(denAvg, outAvg, over)
 
             else:
-                adjust = random.uniform(0.04,0.08)
+                adjust = match.rng.delivery.uniform(0.04,0.08)
                 adjust += (rrro*1.1)/1000
                 denAvg['6'] += adjust * (1.5/3)
                 denAvg['4'] += adjust * (1/3)
@@ -1669,7 +1455,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
             rrro = rrr*6
             if(rrro < 8):
                 if(wickets < 3):
-                    adjust = random.uniform(0.05, 0.09)
+                    adjust = match.rng.delivery.uniform(0.05, 0.09)
                     denAvg['6'] -= adjust * (0.8/3)
                     # denAvg['4'] -= adjust * (0.5/3)
                     denAvg['0'] -= adjust * (1/3)
@@ -1678,7 +1464,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                     outAvg -= 0.02
                     getOutcome(denAvg, outAvg, over)
                 else:
-                    adjust = random.uniform(0.05, 0.09)
+                    adjust = match.rng.delivery.uniform(0.05, 0.09)
                     # denAvg['6'] -= adjust * (2/3)
                     # denAvg['4'] -= adjust * (1/3)
                     denAvg['1'] += adjust
@@ -1687,7 +1473,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
 
             elif(rrro >= 8 and rrro <= 10.4):
                 if(wickets < 3):
-                    adjust = random.uniform(0.6, 0.08)
+                    adjust = match.rng.delivery.uniform(0.6, 0.08)
                     denAvg['6'] += adjust * (1/3)
                     denAvg['4'] += adjust * (1.15/3)
                     denAvg['0'] += adjust * (0.1/3)
@@ -1697,7 +1483,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                     getOutcome(denAvg, outAvg, over)
                     
                 else:
-                    adjust = random.uniform(0.04, 0.08)
+                    adjust = match.rng.delivery.uniform(0.04, 0.08)
                     denAvg['6'] += adjust * (0.95/3)
                     denAvg['4'] += adjust * (1.12/3)
                     denAvg['0'] += adjust * (0.2/3)
@@ -1711,7 +1497,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
 
             elif(rrro > 10.4 and rrro < 12):
                 if(wickets < 3):
-                    adjust = random.uniform(0.075, 0.1)
+                    adjust = match.rng.delivery.uniform(0.075, 0.1)
                     denAvg['6'] += adjust * (1.5/3)
                     denAvg['4'] += adjust * (1.5/3)
                     denAvg['0'] += adjust * (0.5/3)
@@ -1721,7 +1507,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                     outAvg += 0.025
                     getOutcome(denAvg, outAvg, over)
                 else:
-                    adjust = random.uniform(0.06, 0.1)
+                    adjust = match.rng.delivery.uniform(0.06, 0.1)
                     denAvg['6'] += adjust * (1.4/3)
                     denAvg['4'] += adjust * (1/3)
                     denAvg['0'] += adjust * (0.6/3)
@@ -1736,7 +1522,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
             elif(rrro >= 12 and rrro <= 15):
                 if(balls > 85):
                     if(wickets < 3):
-                        adjust = random.uniform(0.065, 0.115)
+                        adjust = match.rng.delivery.uniform(0.065, 0.115)
                         denAvg['6'] += adjust * (1.5/3)
                         denAvg['4'] += adjust * (1.2/3)
                         denAvg['0'] += adjust * (1.4/3)
@@ -1746,7 +1532,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                         outAvg += 0.04
                         getOutcome(denAvg, outAvg, over)
                     else:
-                        adjust = random.uniform(0.05, 0.1)
+                        adjust = match.rng.delivery.uniform(0.05, 0.1)
                         denAvg['6'] += adjust * (1.2/3)
                         denAvg['4'] += adjust * (0.8/3)
                         denAvg['0'] += adjust * (1.2/3)
@@ -1756,7 +1542,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                         outAvg += 0.05
                         getOutcome(denAvg, outAvg, over)
                 else:
-                        adjust = random.uniform(0.05, 0.1)
+                        adjust = match.rng.delivery.uniform(0.05, 0.1)
                         denAvg['6'] += adjust * (1.3/3)
                         denAvg['4'] += adjust * (1/3)
                         denAvg['0'] += adjust * (1.2/3)
@@ -1767,7 +1553,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                         getOutcome(denAvg, outAvg, over)
             else:
                 if(wickets < 3):
-                    adjust = random.uniform(0.075, 0.125)
+                    adjust = match.rng.delivery.uniform(0.075, 0.125)
                     denAvg['6'] += adjust * (2/3)
                     denAvg['4'] += adjust * (1.5/3)
                     denAvg['0'] += adjust * (1.8/3)
@@ -1777,7 +1563,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                     outAvg += 0.05
                     getOutcome(denAvg, outAvg, over)
                 else:
-                    adjust = random.uniform(0.07, 0.12)
+                    adjust = match.rng.delivery.uniform(0.07, 0.12)
                     denAvg['6'] += adjust * (1.8/3)
                     denAvg['4'] += adjust * (1.5/3)
                     denAvg['0'] += adjust * (1.8/3)
@@ -1792,7 +1578,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
         #dont tinker too much
             rrro = rrr*6
             if(wickets < 7 or rrro > 12):
-                defenseAndOneAdjustment = random.uniform(0.07, 0.1)
+                defenseAndOneAdjustment = match.rng.delivery.uniform(0.07, 0.1)
                 denAvg['0'] += defenseAndOneAdjustment * (1.8/3)
                 denAvg['1'] -= defenseAndOneAdjustment * (1/3)
                 denAvg['4'] += defenseAndOneAdjustment * (1.45/3)
@@ -1800,7 +1586,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                 outAvg += 0.032
                 getOutcome(denAvg, outAvg, over)
             else:
-                defenseAndOneAdjustment = random.uniform(0.07, 0.09)
+                defenseAndOneAdjustment = match.rng.delivery.uniform(0.07, 0.09)
                 denAvg['0'] -= defenseAndOneAdjustment * (1.2/3)
                 denAvg['1'] -= defenseAndOneAdjustment * (1.8/3)
                 denAvg['4'] += defenseAndOneAdjustment * (1.5/3)
@@ -1811,20 +1597,20 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
             #logic for last 3 overs chase
             pass
                     
-        if(runs == (target - 1) and (balls == 120 or wickets == 10)):
-            print("Match tied")
-            winner = "tie"
-            winMsg = "Match Tied"
+        if(runs == (match.target - 1) and (balls == 120 or wickets == 10)):
+            match.winner = "tie"
+            match.winMsg = "Match Tied"
+            match.sink.emit("result", {"winner": match.winner, "message": match.winMsg})
         else:
-            if(runs >= target):
-                print(f"{battingName} won by {10 - wickets} wickets")
-                winner = battingName
-                winMsg = f"{battingName} won by {10 - wickets} wickets"
+            if(runs >= match.target):
+                match.winner = battingName
+                match.winMsg = f"{battingName} won by {10 - wickets} wickets"
+                match.sink.emit("result", {"winner": match.winner, "message": match.winMsg})
                 targetChased = True
             elif(balls == 120 or wickets == 10):
-                print(f"{bowlingName} won by {(target - 1) - runs} runs")
-                winner = bowlingName
-                winMsg = f"{bowlingName} won by {(target - 1) - runs} runs"
+                match.winner = bowlingName
+                match.winMsg = f"{bowlingName} won by {(match.target - 1) - runs} runs"
+                match.sink.emit("result", {"winner": match.winner, "message": match.winMsg})
 
 
         # elif(balls >= 36 and balls < 102):
@@ -1881,29 +1667,29 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
             overBowler = bowler1
             n = 0
             while(balls < 6 ):
-                if(runs >= target or wickets == 10):
-                    if(runs >= target):
+                if(runs >= match.target or wickets == 10):
+                    if(runs >= match.target):
                         # print("Target Chased")
                         break
                     break
                 else:     
                 # print(overBowler['byBatsman']['right-hand bat']['bowlRunDenominationsObject']['4'])
-                    delivery(copy.deepcopy(overBowler), copy.deepcopy(
-                        onStrike), str(i) + "." + str(n + 1))
+                    delivery(overBowler, onStrike, str(i) + "." + str(n + 1))
+                    yield stepState(overBowler)
                     n += 1
             lastOver = overBowler['playerInitials']
         elif(i == 1):
             overBowler = bowler2
             n = 0
             while(balls < 12 ):
-                if(runs >= target or wickets == 10):
-                    if(runs >= target):
+                if(runs >= match.target or wickets == 10):
+                    if(runs >= match.target):
                         # print("Target Chased")
                         break
                     break
                 else:
-                    delivery(copy.deepcopy(overBowler), copy.deepcopy(
-                        onStrike), str(i) + "." + str(n + 1))
+                    delivery(overBowler, onStrike, str(i) + "." + str(n + 1))
+                    yield stepState(overBowler)
                     n += 1
             lastOver = overBowler['playerInitials']
 
@@ -1917,7 +1703,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                         localBowling = sorted(bowling, key=lambda k: k['overNumbersObject'][str(i)])     
                         localBowling.reverse()
                         while(not valid):
-                            pick = localBowling[random.randint(0,3)]
+                            pick = localBowling[match.rng.bowling.randint(0,3)]
                             pickInfo = bowlerTracker[pick['playerInitials']]
                             if(pickInfo['balls'] < 11 and lastOver != pick['playerInitials']):
                                 bowlerToReturn = pick
@@ -1937,13 +1723,14 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
 
             n = 0
             while(balls < ((i + 1)*6) ):
-                if(runs >= target or wickets == 10):
-                    if(runs >= target):
+                if(runs >= match.target or wickets == 10):
+                    if(runs >= match.target):
                         # print("Target Chased")
                         break
                     break
                 else: #Add for the case that the team has to save bowler for death (if death bowler certain number of overs then after 2 in pp, save for later)
-                    delivery(copy.deepcopy(overBowler), copy.deepcopy(onStrike), str(i) + "." + str(n + 1))
+                    delivery(overBowler, onStrike, str(i) + "." + str(n + 1))
+                    yield stepState(overBowler)
                     n += 1
             lastOver = overBowler['playerInitials']
 
@@ -1980,7 +1767,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                 expIndex += 1
 
                             while(not valid):
-                                pick = bowlingMiddle[random.randint(0,loopIndex)]
+                                pick = bowlingMiddle[match.rng.bowling.randint(0,loopIndex)]
                                 pickInfo = bowlerTracker[pick['playerInitials']]
                                 if(pickInfo['balls'] == 0):
                                     bowlerToReturn = pick
@@ -2037,7 +1824,7 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
                                         break
                                     expIndex += 1
                                 while(not valid):
-                                    pick = bowlingMiddle[random.randint(0,loopIndex)]
+                                    pick = bowlingMiddle[match.rng.bowling.randint(0,loopIndex)]
                                     pickInfo = bowlerTracker[pick['playerInitials']]
                                     if(pickInfo['balls'] == 0):
                                         bowlerToReturn = pick
@@ -2079,14 +1866,15 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
 
             n = 0
             while(balls < ((i + 1)*6) ):
-                if(runs >= target or wickets == 10):
-                    if(runs >= target):
+                if(runs >= match.target or wickets == 10):
+                    if(runs >= match.target):
                         # print("Target Chased")
                         break
                     break
                 else:
                  #Add for the case that the team has to save bowler for death (if death bowler certain number of overs then after 2 in pp, save for later)         
-                    delivery(copy.deepcopy(overBowler), copy.deepcopy(onStrike), str(i) + "." + str(n + 1))
+                    delivery(overBowler, onStrike, str(i) + "." + str(n + 1))
+                    yield stepState(overBowler)
                     n += 1
             lastOver = overBowler['playerInitials']
 
@@ -2140,14 +1928,15 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
 
             n = 0
             while(balls < ((i + 1)*6) ):
-                if(runs >= target or wickets == 10):
-                    if(runs >= target):
+                if(runs >= match.target or wickets == 10):
+                    if(runs >= match.target):
                         # print("Target Chased")
                         break
                     break
                 else:
                  #Add for the case that the team has to save bowler for death (if death bowler certain number of overs then after 2 in pp, save for later)         
-                    delivery(copy.deepcopy(overBowler), copy.deepcopy(onStrike), str(i) + "." + str(n + 1))
+                    delivery(overBowler, onStrike, str(i) + "." + str(n + 1))
+                    yield stepState(overBowler)
                     n += 1
             lastOver = overBowler['playerInitials']
 
@@ -2155,85 +1944,160 @@ def innings2(batting, bowling, battingName, bowlingName, pace, spin, outfield, d
             
     # print(batterTracker)
     # print(bowlerTracker)
+    battingCard, _ = scorecard.batting_card(batterTracker)
     batsmanTabulate = []
-    for btckd in batterTracker:
-        localArrayTabulate = [btckd]
-        localArrayTabulate += [batterTracker[btckd]['runs'], batterTracker[btckd]['balls']]
-        sr_ = 'NA'
-        if(batterTracker[btckd]['balls'] != 0):
-            sr_ = (batterTracker[btckd]['runs']*100) / (batterTracker[btckd]['balls'])
-            sr_ = str(round(sr_, 2))
-            localArrayTabulate.append(sr_)
-        out = False
-        howOut = "DNB"
-        batted = False
-        for b in batterTracker[btckd]['ballLog']:
-            batted = True
-            if("W" in b):
-                out = True
-                if("CaughtBy" in b):
-                    splitOT = b.split("-")
-                    lcatcher = splitOT[2]
-                    lbowler = splitOT[-1]
-                    howOut = f"c {lcatcher} b {lbowler}"
-                elif("runout" in b):
-                    howOut = "Run out"
-                else:
-                    splitOT = b.split("-")
-                    howOut = f"{splitOT[1]} b {splitOT[-1]}"
-            else:
-                howOut = "Not out"
-        localArrayTabulate.append(howOut)
-        batsmanTabulate.append(localArrayTabulate)
-        
+    for btckd, row in battingCard.items():
+        sr_ = row['strike_rate'] if row['strike_rate'] is not None else 'NA'
+        batsmanTabulate.append([btckd, row['runs'], row['balls'], sr_, row['how_out']])
 
     bowlerTabulate = []
-    for btrack in bowlerTracker:
-        localBowlerTabulate = [btrack, bowlerTracker[btrack]['runs']]
-        overs_tb = 0
-        remainder_balls = bowlerTracker[btrack]['balls'] % 6 
-        number_overs = bowlerTracker[btrack]['balls'] // 6
-        localBowlerTabulate.append(f"{number_overs}.{remainder_balls}")
-        localBowlerTabulate.append(bowlerTracker[btrack]['wickets'])
-        econ_tb = "NA"
-        if(bowlerTracker[btrack]['balls'] != 0):
-            econ_tb = (bowlerTracker[btrack]['runs'] / bowlerTracker[btrack]['balls'])*6
-            econ_tb = str(round(econ_tb, 2))
-        localBowlerTabulate.append(econ_tb)
-        bowlerTabulate.append(localBowlerTabulate)
-
-    print(tabulate(batsmanTabulate, ["Player", "Runs", "Balls", "SR" ,"Out"], tablefmt="grid"))
-    print(tabulate(bowlerTabulate, ["Player", "Runs", "Overs", "Wickets", "Eco"], tablefmt="grid"))
-    innings2Balls = balls
-    innings2Runs = runs
-    innings2Batting = tabulate(batsmanTabulate, ["Player", "Runs", "Balls", "SR" ,"Out"], tablefmt="grid")
-    innings2Bowling = tabulate(bowlerTabulate, ["Player", "Runs", "Overs", "Wickets", "Eco"], tablefmt="grid")
-
-    innings2Battracker = batterTracker
-    innings2Bowltracker = bowlerTracker
-
-def game(manual=True, sentTeamOne=None, sentTeamTwo=None, switch="group"):
-    global innings1Batting, innings1Bowling, innings2Batting, innings2Bowling, innings1Balls, innings2Balls
-    global innings1Log, innings2Log, innings1Battracker, innings2Battracker, innings2Bowltracker, innings1Bowltracker
-    global innings1Runs, innings2Runs
-
-    innings1Batting = None
-    innings1Bowling = None
-    innings2Batting = None
-    innings2Bowling = None
-    innings1Balls = None
-    innings2Balls = None
-    innings1Runs = None
-    innings2Runs = None
-
-    innings1Battracker = None
-    innings2Battracker = None
-    innings1Bowltracker = None
-    innings2Bowltracker = None
-
-    innings1Log = []
-    innings2Log = []
+    for btrack, row in scorecard.bowling_card(bowlerTracker).items():
+        econ_tb = row['economy'] if row['economy'] is not None else "NA"
+        bowlerTabulate.append([btrack, row['runs'], row['overs'], row['wickets'], econ_tb])
+
+    match.innings2Balls = balls
+    match.innings2Runs = runs
+    match.innings2Batting = tabulate(batsmanTabulate, ["Player", "Runs", "Balls", "SR" ,"Out"], tablefmt="grid")
+    match.innings2Bowling = tabulate(bowlerTabulate, ["Player", "Runs", "Overs", "Wickets", "Eco"], tablefmt="grid")
+    match.innings2Battracker = batterTracker
+    match.innings2Bowltracker = bowlerTracker
+    match.sink.emit("scorecard", {"innings": 2, "batting": match.innings2Batting, "bowling": match.innings2Bowling})
+
+class Match:
+    """One simulated match and all of its state.
+
+    Every per-match value that used to live in module globals (logs, trackers,
+    target, result messages) is an attribute here, so any number of matches
+    can run at the same time in threads, processes or async workers.
+    """
+
+    def __init__(self, team1, team2, sink=None, seed=None, keep_log=True):
+        self.team1 = team1
+        self.team2 = team2
+        # Toss, pitch, delivery and bowler-selection streams, all derived from one match seed
+        self.rng = MatchRandom(seed)
+        self.seed = self.rng.seed
+        # Receives commentary, scorecards and the result as events (see event_sinks); discarded by default
+        self.sink = sink if sink is not None else event_sinks.NullSink()
+
+        self.target = 1
+        self.innings1Batting = None
+        self.innings1Bowling = None
+        self.innings2Batting = None
+        self.innings2Bowling = None
+        self.innings1Balls = None
+        self.innings2Balls = None
+        self.innings1Runs = None
+        self.innings2Runs = None
+        self.winner = None
+        self.winMsg = None
+
+        self.innings1Battracker = None
+        self.innings2Battracker = None
+        self.innings1Bowltracker = None
+        self.innings2Bowltracker = None
+
+        # With keep_log=False balls only go to the sink (e.g. a live stream) and the
+        # result's innings logs stay empty, so memory does not grow with the match
+        self.keep_log = keep_log
+        self.innings1Log = []
+        self.innings2Log = []
+
+        self.tossMsg = None
+        self.result = None
+
+    def record(self, innings, entry):
+        """Appends a ball to the innings log and passes it on to the sink."""
+        if self.keep_log:
+            (self.innings1Log if innings == 1 else self.innings2Log).append(entry)
+        self.sink.emit("ball", {"innings": innings, "ball": entry})
+
+    def play(self):
+        """Simulates the whole match and returns the result dict."""
+        for _ in self.steps():
+            pass
+        return self.result
+
+    def steps(self):
+        """Simulates the match one delivery at a time.
+
+        Yields the innings state after every ball (see ``innings1``), so a
+        caller can pause between deliveries, stream them, or run many matches
+        interleaved on one thread. When the generator finishes the result dict
+        is in ``self.result``. The yielded trackers are the live ones; copy or
+        serialize a state before resuming if it has to be kept.
+        """
+        # pitchTypeInput = input("Enter type of pitch (green, dusty, or dead) ")
+        pitchTypeInput = "dusty"
+
+        # f = open("matches/csk_v_rr.txt", "r")
+        dataFile = team_registry.get_teams()
+
+        team1 = None
+        team2 = None
+        venue = None
+        toss = None
+
+        secondInnDew = False
+        # for 1st
+        dew = False
+        pitchDetoriate = True
+        # for 1st
+        detoriate = False
+
+        paceFactor = None
+        spinFactor = None
+        outfield = None
+        typeOfPitch = pitchTypeInput
+
+        team1Players = []
+        team2Players = []
+
+        team1Info = []
+        team2Info = []
+
+        # spin, pace factor -> 0.0 - 1.0
+        team1Players = dataFile[self.team1]['players'] # Access the 'players' list
+        team2Players = dataFile[self.team2]['players'] # Access the 'players' list
+        team1 = self.team1
+        team2 = self.team2
+        self.sink.emit("squads", {"team1": list(team1Players), "team2": list(team2Players)})
+
+        # Both squads in one repository lookup
+        players = player_model.get_players(team1Players + team2Players)
+        team1Info = [players[player] for player in team1Players]
+        team2Info = [players[player] for player in team2Players]
+
+        pitchInfo_ = pitchInfo(venue, typeOfPitch, self.rng.pitch)
+        paceFactor, spinFactor, outfield = pitchInfo_[
+            0], pitchInfo_[1], pitchInfo_[2]
+        battingFirst = doToss(self, paceFactor, spinFactor, outfield,
+                              secondInnDew, pitchDetoriate, typeOfPitch, team1, team2)
+        # print(paceFactor, spinFactor, outfield)
+
+        def getBatting():
+            if(battingFirst == 0):
+                return [team1Info, team2Info, team1, team2]
+            else:
+                return [team2Info, team1Info, team2, team1]
+
+        self.sink.emit("toss", {"message": self.tossMsg, "batting": getBatting()[2], "bowling": getBatting()[3]})
 
+        yield from innings1(self, getBatting()[0], getBatting()[1], getBatting()[2], getBatting()[
+                3], paceFactor, spinFactor, outfield, dew, detoriate)
+
+        yield from innings2(self, getBatting()[1], getBatting()[0], getBatting()[3], getBatting()[
+                2], paceFactor, spinFactor, outfield, dew, detoriate)
+        # print(innings1Log)
+        # print(innings2Log)
+        self.result = {"innings1Batting": self.innings1Batting, "innings1Bowling": self.innings1Bowling, "innings2Batting": self.innings2Batting,
+                "innings2Bowling": self.innings2Bowling, "innings2Balls": self.innings2Balls, "innings1Balls": 120,
+                "innings1Runs": self.innings1Runs, "innings2Runs": self.innings2Runs, "winMsg": self.winMsg, "innings1Battracker": self.innings1Battracker,
+                "innings2Battracker": self.innings2Battracker, "innings1Bowltracker": self.innings1Bowltracker, "innings2Bowltracker": self.innings2Bowltracker,
+                "innings1BatTeam": getBatting()[2],"innings2BatTeam": getBatting()[3], "winner": self.winner, "innings1Log": self.innings1Log,
+                "innings2Log": self.innings2Log, "tossMsg": self.tossMsg, "seed": self.seed }
+
+def game(manual=True, sentTeamOne=None, sentTeamTwo=None, switch="group", sink=None, seed=None):
     team_one_inp = None
     team_two_inp = None
     if(manual):
@@ -2243,82 +2107,8 @@ def game(manual=True, sentTeamOne=None, sentTeamTwo=None, switch="group"):
         team_one_inp = sentTeamOne
         team_two_inp = sentTeamTwo
 
-    # pitchTypeInput = input("Enter type of pitch (green, dusty, or dead) ")
-    pitchTypeInput = "dusty"
-    stdoutOrigin=sys.stdout 
-    sys.stdout = open(f"scores/{team_one_inp}v{team_two_inp}_{switch}.txt", "w")
-
-    # f = open("matches/csk_v_rr.txt", "r")
-    with open('teams/teams.json') as fl:
-        dataFile = json.load(fl)
-
-    team1 = None
-    team2 = None
-    venue = None
-    toss = None
-
-    secondInnDew = False
-    # for 1st
-    dew = False
-    pitchDetoriate = True
-    # for 1st
-    detoriate = False
-
-    paceFactor = None
-    spinFactor = None
-    outfield = None
-    typeOfPitch = pitchTypeInput
-
-    team1Players = []
-    team2Players = []
-
-    team1Info = []
-    team2Info = []
-
-    # spin, pace factor -> 0.0 - 1.0
-    team1Players = dataFile[team_one_inp]['players'] # Access the 'players' list
-    team2Players = dataFile[team_two_inp]['players'] # Access the 'players' list
-    team1 = team_one_inp
-    team2 = team_two_inp
-    print(team1Players)
-
-    for player in team1Players:
-        obj = accessJSON.getPlayerInfo(player)
-        team1Info.append(obj)
-
-    for player in team2Players:
-        obj = accessJSON.getPlayerInfo(player)
-        team2Info.append(obj)
-
-    pitchInfo_ = pitchInfo(venue, typeOfPitch)
-    paceFactor, spinFactor, outfield = pitchInfo_[
-        0], pitchInfo_[1], pitchInfo_[2]
-    battingFirst = doToss(paceFactor, spinFactor, outfield,
-                          secondInnDew, pitchDetoriate, typeOfPitch, team1, team2)
-    # print(paceFactor, spinFactor, outfield)
-
-    def getBatting():
-        if(battingFirst == 0):
-            return [team1Info, team2Info, team1, team2]
-        else:
-            return [team2Info, team1Info, team2, team1]
-
-    innings1(getBatting()[0], getBatting()[1], getBatting()[2], getBatting()[
-            3], paceFactor, spinFactor, outfield, dew, detoriate)
-
-    innings2(getBatting()[1], getBatting()[0], getBatting()[3], getBatting()[
-            2], paceFactor, spinFactor, outfield, dew, detoriate)
-    sys.stdout.close()
-    sys.stdout=stdoutOrigin
-    # print(innings1Log)
-    # print(innings2Log)
-    return {"innings1Batting": innings1Batting, "innings1Bowling": innings1Bowling, "innings2Batting": innings2Batting, 
-            "innings2Bowling": innings2Bowling, "innings2Balls": innings2Balls, "innings1Balls": 120, 
-            "innings1Runs": innings1Runs, "innings2Runs": innings2Runs, "winMsg": winMsg, "innings1Battracker": innings1Battracker,
-            "innings2Battracker": innings2Battracker, "innings1Bowltracker": innings1Bowltracker, "innings2Bowltracker": innings2Bowltracker,
-            "innings1BatTeam": getBatting()[2],"innings2BatTeam": getBatting()[3], "winner": winner, "innings1Log": innings1Log,
-            "innings2Log": innings2Log, "tossMsg": tossMsg }
-
-
-
-# game()
\ No newline at end of file
+    # Without an explicit sink the commentary goes to the size-capped, expiring store under scores/
+    if sink is None:
+        sink = event_sinks.TextSink(f"{team_one_inp}v{team_two_inp}_{switch}.txt", store=artifact_store.scores())
+    with sink:
+        return Match(team_one_inp, team_two_inp, sink=sink, seed=seed).play()
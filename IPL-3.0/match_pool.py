@@ -0,0 +1,128 @@
+"""Pre-simulated direct matches, ready before they are asked for.
+
+A direct simulation in the web app used to run the whole match inside the
+request. ``MatchPool.take`` instead hands out a finished result for the
+fixture when one is waiting and asks a background worker to simulate a
+replacement, so a repeated fixture only costs the template render.
+
+Results are keyed by (team1, team2, data version, ENGINE_VERSION), where the
+data version covers the player repository and teams.json; results made from
+older data or by another engine are never handed out. Only fixtures that
+have been asked for are kept filled, up to ``depth`` results each, and the
+pool holds at most ``max_bytes`` (measured as pickled size): past that the
+results of the least recently requested fixtures are dropped first.
+"""
+
+import logging
+import pickle
+import queue
+import threading
+from collections import OrderedDict, deque
+
+import event_sinks
+import mainconnect
+import player_model
+import team_registry
+
+
+def data_version():
+    return (player_model.repository.version(), team_registry.version())
+
+
+def simulate_direct(team1, team2):
+    return mainconnect.game(manual=False, sentTeamOne=team1, sentTeamTwo=team2, switch="webapp",
+                            sink=event_sinks.NullSink())
+
+
+class MatchPool:
+
+    def __init__(self, depth=2, max_bytes=32 * 1024 * 1024, simulate=simulate_direct):
+        self.depth = depth
+        self.max_bytes = max_bytes
+        self._simulate = simulate
+        self._ready = OrderedDict()  # key -> deque of (result, size); least recently requested first
+        self._bytes = 0
+        self._queued = set()
+        self._pending = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+
+    def key(self, team1, team2):
+        return (team1, team2, data_version(), mainconnect.ENGINE_VERSION)
+
+    def take(self, team1, team2):
+        """Returns a ready result for the fixture, or None, and schedules a refill either way."""
+        if self.depth <= 0:
+            return None
+        key = self.key(team1, team2)
+        result = None
+        with self._lock:
+            for stale in [k for k in self._ready if k[:2] == key[:2] and k != key]:
+                self._drop(stale)
+            ready = self._ready.setdefault(key, deque())
+            self._ready.move_to_end(key)
+            if ready:
+                result, size = ready.popleft()
+                self._bytes -= size
+            if key not in self._queued:
+                self._queued.add(key)
+                self._pending.put(key)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="match-pool", daemon=True)
+                self._worker.start()
+        return result
+
+    def ready_count(self, team1, team2):
+        with self._lock:
+            return len(self._ready.get(self.key(team1, team2), ()))
+
+    def wait_idle(self):
+        """Blocks until every scheduled refill has finished."""
+        self._pending.join()
+
+    def _drop(self, key):
+        # Caller holds the lock
+        for _, size in self._ready.pop(key):
+            self._bytes -= size
+
+    def _wants(self, key):
+        with self._lock:
+            ready = self._ready.get(key)
+            if ready is not None and len(ready) < self.depth and key == self.key(*key[:2]):
+                return True
+            self._queued.discard(key)
+            return False
+
+    def _run(self):
+        while True:
+            key = self._pending.get()
+            try:
+                while self._wants(key):
+                    result = self._simulate(key[0], key[1])
+                    size = len(pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+                    with self._lock:
+                        ready = self._ready.get(key)
+                        if ready is None:
+                            continue  # dropped while simulating; _wants ends the loop
+                        ready.append((result, size))
+                        self._bytes += size
+                        self._shrink()
+            except Exception:
+                logging.exception(f"Pre-simulating {key[0]} v {key[1]} failed")
+                with self._lock:
+                    self._queued.discard(key)
+                    if key in self._ready:
+                        self._drop(key)  # e.g. an unknown team: stop trying until it is asked for again
+            finally:
+                self._pending.task_done()
+
+    def _shrink(self):
+        # Caller holds the lock
+        while self._bytes > self.max_bytes and self._ready:
+            oldest = next(iter(self._ready))
+            ready = self._ready[oldest]
+            if ready:
+                _, size = ready.popleft()
+                self._bytes -= size
+            if not ready:
+                del self._ready[oldest]
@@ -0,0 +1,44 @@
+"""Per-match random number streams.
+
+Every match owns a ``MatchRandom`` built from a single match seed. It holds
+one ``random.Random`` per concern, so the draws made for, say, commentary
+never shift the deliveries, and a match can be replayed from its teams and
+seed alone:
+
+    toss        toss winner and decision
+    pitch       pitch factors
+    delivery    ball outcomes and their adjustments
+    bowling     bowler selection
+    commentary  cosmetic choices such as commentary lines
+
+Seeds may be ints or strings. Child streams are seeded with "<seed>:<name>",
+which Python hashes deterministically (unlike ``hash()``), so the same seed
+gives the same match in any process.
+"""
+
+import random
+
+STREAMS = ("toss", "pitch", "delivery", "bowling", "commentary")
+
+
+def new_seed():
+    """Draws a fresh match seed from the global generator.
+
+    Going through ``random`` rather than the OS means a caller that seeded the
+    global generator still gets a reproducible sequence of matches.
+    """
+    return random.getrandbits(64)
+
+
+class MatchRandom:
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = new_seed()
+        self.seed = seed
+        for name in STREAMS:
+            setattr(self, name, random.Random(f"{seed}:{name}"))
+
+    def child_seed(self, *parts):
+        """Derives a seed for a sub-simulation (e.g. one match of a season) from this seed."""
+        return ":".join(str(p) for p in (self.seed,) + parts)
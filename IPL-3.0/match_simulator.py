@@ -1,15 +1,32 @@
-import random
-import json
-import accessJSON
+import player_model
+import team_registry
+from match_random import MatchRandom
+import match_snapshot
 import copy
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Bump whenever a change here alters what a given seed produces; snapshots
+# from another version are refused instead of restoring a different match.
+SIMULATOR_VERSION = 1
+
 class MatchSimulator:
-    def __init__(self, team1_code, team2_code, pitch_factors=None, saved_state=None):
+    def __init__(self, team1_code, team2_code, pitch_factors=None, saved_state=None, seed=None):
         self.team1_code = team1_code.lower()
         self.team2_code = team2_code.lower()
+        # saved_state is a snapshot() taken from this fixture; its seed, pitch and
+        # delivery count replace the arguments and the match is re-simulated to that point
+        snapshot = None
+        if saved_state is not None:
+            snapshot = match_snapshot.unpack(saved_state, engine=SIMULATOR_VERSION)
+            if (snapshot.team1, snapshot.team2) != (self.team1_code, self.team2_code):
+                raise match_snapshot.SnapshotError(f"snapshot is for {snapshot.team1} v {snapshot.team2}")
+            seed = snapshot.seed
+            pitch_factors = dict(zip(('pace', 'spin', 'outfield'), snapshot.pitch_factors)) if snapshot.pitch_factors else None
+        # Per-match random streams (toss, delivery, bowling); the seed alone reproduces the match
+        self.rng = MatchRandom(seed)
+        self.seed = self.rng.seed
 
         if pitch_factors:
             self.pace_factor = pitch_factors.get('pace', 1.0)
@@ -19,11 +36,11 @@ class MatchSimulator:
             self.pace_factor = 1.0
             self.spin_factor = 1.0
             self.outfield_factor = 1.0
+        self.has_pitch_factors = bool(pitch_factors)
 
-        self.all_teams_data = {}
         try:
-            with open('teams/teams.json', 'r', encoding='utf-8') as f:
-                self.all_teams_data = json.load(f)
+            # Parsed once per process and shared (read-only) by every simulator
+            self.all_teams_data = team_registry.get_teams()
         except FileNotFoundError:
             logging.error(f"CRITICAL ERROR: teams/teams.json not found.")
             raise
@@ -42,38 +59,58 @@ class MatchSimulator:
         self.team1_players_stats = {}
         self.team2_players_stats = {}
 
+        # Both squads in one repository lookup; compiled once per player and data
+        # version, then shared between simulators
+        try:
+            fetched_stats = player_model.get_players(
+                [str(i).strip() for i in list(team1_player_initials_list) + list(team2_player_initials_list)],
+                compiler=MatchSimulator._preprocess_player_stats)
+        except Exception as e:
+            logging.error(f"Error fetching player info for {self.team1_code} v {self.team2_code}: {e}. Using placeholders.")
+            fetched_stats = {}
+
         for initial in team1_player_initials_list:
             processed_initial_str = str(initial).strip()
             if not processed_initial_str:
                 logging.warning(f"Skipping empty player initial for team {self.team1_code}.")
                 continue
-            raw_stats = None
-            try:
-                raw_stats = accessJSON.getPlayerInfo(processed_initial_str)
-            except KeyError:
+            stats = fetched_stats.get(processed_initial_str)
+            if stats is None:
                 logging.warning(f"Player initial '{processed_initial_str}' not found for team {self.team1_code}. Using placeholder.")
-            except Exception as e:
-                logging.error(f"Error fetching info for '{processed_initial_str}' (Team {self.team1_code}): {e}. Using placeholder.")
-            self.team1_players_stats[processed_initial_str] = self._preprocess_player_stats(processed_initial_str, raw_stats)
+                stats = self._preprocess_player_stats(processed_initial_str, None)
+            self.team1_players_stats[processed_initial_str] = stats
 
         for initial in team2_player_initials_list:
             processed_initial_str = str(initial).strip()
             if not processed_initial_str:
                 logging.warning(f"Skipping empty player initial for team {self.team2_code}.")
                 continue
-            raw_stats = None
-            try:
-                raw_stats = accessJSON.getPlayerInfo(processed_initial_str)
-            except KeyError:
+            stats = fetched_stats.get(processed_initial_str)
+            if stats is None:
                 logging.warning(f"Player initial '{processed_initial_str}' not found for team {self.team2_code}. Using placeholder.")
-            except Exception as e:
-                logging.error(f"Error fetching info for '{processed_initial_str}' (Team {self.team2_code}): {e}. Using placeholder.")
-            self.team2_players_stats[processed_initial_str] = self._preprocess_player_stats(processed_initial_str, raw_stats)
+                stats = self._preprocess_player_stats(processed_initial_str, None)
+            self.team2_players_stats[processed_initial_str] = stats
 
         self._initialize_batting_order_and_bowlers()
 
-        if saved_state and saved_state.get('toss_winner'):
-            self.load_from_saved_state(saved_state)
+        if snapshot is not None:
+            if snapshot.toss_done:
+                self.perform_toss()
+            for _ in range(snapshot.deliveries):
+                self.simulate_one_ball()
+
+    @classmethod
+    def from_snapshot(cls, data):
+        """Rebuilds a simulator from ``snapshot()`` bytes."""
+        snapshot = match_snapshot.unpack(data, engine=SIMULATOR_VERSION)
+        return cls(snapshot.team1, snapshot.team2, saved_state=data)
+
+    def snapshot(self):
+        """Returns the match state as a few dozen bytes (see match_snapshot)."""
+        return match_snapshot.pack(match_snapshot.Snapshot(
+            SIMULATOR_VERSION, self.team1_code, self.team2_code, self.seed, self.deliveries,
+            self.toss_winner is not None,
+            (self.pace_factor, self.spin_factor, self.outfield_factor) if self.has_pitch_factors else None))
 
     def _initialize_fresh_game_state(self):
         self.batting_team_code = None; self.bowling_team_code = None
@@ -91,8 +128,10 @@ class MatchSimulator:
             self.team2_code: {'powerplay': [], 'middle': [], 'death': []}
         }
         self.next_batsman_index = {self.team1_code: 0, self.team2_code: 0}
+        self.deliveries = 0 # calls to simulate_one_ball that advanced the match; all a snapshot needs
 
-    def _create_placeholder_player_stats(self, initial_str):
+    @staticmethod
+    def _create_placeholder_player_stats(initial_str):
         return {
             "playerInitials": str(initial_str), "displayName": str(initial_str),
             "BowlingSkill": "Unknown", "batStyle": "Unknown","BattingHand": "Unknown",
@@ -111,8 +150,10 @@ class MatchSimulator:
             "overNumbersObject": {str(i):0.05 for i in range(20)}
         }
 
-    def _preprocess_player_stats(self, initial, raw_stats_input):
-        placeholder = self._create_placeholder_player_stats(initial)
+    @staticmethod
+    def _preprocess_player_stats(initial, raw_stats_input):
+        # Result is cached and shared via player_model, so it must not alias raw_stats_input
+        placeholder = MatchSimulator._create_placeholder_player_stats(initial)
         if raw_stats_input is None:
             processed = copy.deepcopy(placeholder)
             logging.warning(f"Using full placeholder for {initial} due to missing raw_stats_input.")
@@ -225,7 +266,7 @@ class MatchSimulator:
         return None
 
     def perform_toss(self):
-        self.toss_winner = random.choice([self.team1_code, self.team2_code]); self.toss_decision = random.choice(['bat', 'field'])
+        self.toss_winner = self.rng.toss.choice([self.team1_code, self.team2_code]); self.toss_decision = self.rng.toss.choice(['bat', 'field'])
         if self.toss_decision == 'bat': self.batting_team_code = self.toss_winner; self.bowling_team_code = self.team1_code if self.toss_winner == self.team2_code else self.team2_code
         else: self.bowling_team_code = self.toss_winner; self.batting_team_code = self.team1_code if self.toss_winner == self.team2_code else self.team2_code
         self.toss_message = f"{self.toss_winner.upper()} won the toss and chose to {self.toss_decision}."
@@ -237,7 +278,7 @@ class MatchSimulator:
         # ... (Copy of the existing _calculate_dynamic_probabilities method from the read_files output)
         denAvg = {str(r): (batsman_obj['batRunDenominationsObject'].get(str(r),0) + bowler_obj['bowlRunDenominationsObject'].get(str(r),0))/2 for r in range(7)}
         outAvg = (batsman_obj['batOutsRate'] + bowler_obj['bowlOutsRate']) / 2
-        outTypeAvg = copy.deepcopy(bowler_obj['bowlOutTypesObject'])
+        outTypeAvg = dict(bowler_obj['bowlOutTypesObject'])
         runout_chance_batsman = batsman_obj.get('runnedOut',0) / (batsman_obj.get('batBallsTotal',1) if batsman_obj.get('batBallsTotal',0) > 0 else 1)
         outTypeAvg['runOut'] = outTypeAvg.get('runOut', 0.005) + runout_chance_batsman / 2
         wideRate = bowler_obj['bowlWideRate']; noballRate = bowler_obj['bowlNoballRate']
@@ -256,36 +297,36 @@ class MatchSimulator:
         balls_faced_batsman = bt_current_ball_stats['balls']; innings_balls_total = inn_data['legal_balls_bowled']
         innings_runs_total = inn_data['score']; innings_wickets_total = inn_data['wickets']
         if balls_faced_batsman < 8 and innings_balls_total < 80:
-            adjust = random.uniform(-0.01, 0.03) * (1 if self.current_innings_num == 1 else 0.8)
+            adjust = self.rng.delivery.uniform(-0.01, 0.03) * (1 if self.current_innings_num == 1 else 0.8)
             outAvg = max(0.01, outAvg - 0.015)
             denAvg['0'] = max(0.001, denAvg.get('0',0) + adjust * 0.5); denAvg['1'] = max(0.001, denAvg.get('1',0) + adjust * 0.33)
             denAvg['2'] = max(0.001, denAvg.get('2',0) + adjust * 0.17); denAvg['4'] = max(0.001, denAvg.get('4',0) - adjust * 0.17)
             denAvg['6'] = max(0.001, denAvg.get('6',0) - adjust * 0.5)
         if balls_faced_batsman > 15 and balls_faced_batsman < 30:
-            adjust = random.uniform(0.03, 0.07)
+            adjust = self.rng.delivery.uniform(0.03, 0.07)
             denAvg['0'] = max(0.001, denAvg.get('0',0) - adjust * 0.33); denAvg['4'] = max(0.001, denAvg.get('4',0) + adjust * 0.33)
         if balls_faced_batsman > 20 and (bt_current_ball_stats['runs'] / balls_faced_batsman if balls_faced_batsman > 0 else 0) < 1.1:
-            adjust = random.uniform(0.05, 0.08)
+            adjust = self.rng.delivery.uniform(0.05, 0.08)
             denAvg['0'] = max(0.001, denAvg.get('0',0) + adjust * 0.5); denAvg['1'] = max(0.001, denAvg.get('1',0) + adjust * 0.17)
             denAvg['6'] = max(0.001, denAvg.get('6',0) - adjust * 0.67); outAvg = min(0.95, outAvg + 0.05)
         if innings_balls_total < 36:
             outAvg = max(0.01, outAvg - (0.07 if innings_wickets_total == 0 else 0.03))
-            adj = random.uniform(0.05, 0.11) if innings_wickets_total < 2 else random.uniform(0.02, 0.08)
+            adj = self.rng.delivery.uniform(0.05, 0.11) if innings_wickets_total < 2 else self.rng.delivery.uniform(0.02, 0.08)
             denAvg['0'] = max(0.001, denAvg.get('0',0) - adj * 0.67); denAvg['1'] = max(0.001, denAvg.get('1',0) - adj * 0.33)
             denAvg['4'] = max(0.001, denAvg.get('4',0) + adj * (0.67 if innings_wickets_total < 2 else 0.83))
             denAvg['6'] = max(0.001, denAvg.get('6',0) + adj * (0.33 if innings_wickets_total < 2 else 0.17))
         elif innings_balls_total >= 102:
-            adj = random.uniform(0.07, 0.1) if innings_wickets_total < 7 else random.uniform(0.07,0.09)
+            adj = self.rng.delivery.uniform(0.07, 0.1) if innings_wickets_total < 7 else self.rng.delivery.uniform(0.07,0.09)
             denAvg['0'] = max(0.001, denAvg.get('0',0) + adj * (0.13 if innings_wickets_total < 7 else -0.13))
             denAvg['1'] = max(0.001, denAvg.get('1',0) - adj * 0.33); denAvg['4'] = max(0.001, denAvg.get('4',0) + adj * 0.48)
             denAvg['6'] = max(0.001, denAvg.get('6',0) + adj * 0.62); outAvg = min(0.95, outAvg + (0.015 if innings_wickets_total < 7 else 0.025))
         elif innings_balls_total >= 36 and innings_balls_total < 102:
             if innings_wickets_total < 3:
-                adj = random.uniform(0.05, 0.11)
+                adj = self.rng.delivery.uniform(0.05, 0.11)
                 denAvg['0'] = max(0.001, denAvg.get('0',0) - adj * 0.5); denAvg['1'] = max(0.001, denAvg.get('1',0) - adj*0.33)
                 denAvg['4'] = max(0.001, denAvg.get('4',0) + adj * 0.5); denAvg['6'] = max(0.001, denAvg.get('6',0) + adj*0.33)
             else:
-                adj = random.uniform(0.02, 0.07)
+                adj = self.rng.delivery.uniform(0.02, 0.07)
                 denAvg['0'] = max(0.001, denAvg.get('0',0) - adj * 0.53); denAvg['1'] = max(0.001, denAvg.get('1',0) - adj*0.4)
                 denAvg['4'] = max(0.001, denAvg.get('4',0) + adj * 0.7); denAvg['6'] = max(0.001, denAvg.get('6',0) + adj*0.3)
                 outAvg = max(0.01, outAvg - 0.03)
@@ -294,15 +335,15 @@ class MatchSimulator:
             if runs_needed > 0 :
                 rrr = (runs_needed / balls_remaining) * 6 if balls_remaining > 0 else float('inf')
                 if rrr < 8:
-                    adj = random.uniform(0.05, 0.09) * (1 - (rrr/10)*0.5)
+                    adj = self.rng.delivery.uniform(0.05, 0.09) * (1 - (rrr/10)*0.5)
                     denAvg['6'] = max(0.001, denAvg.get('6',0) - adj * 0.67); denAvg['4'] = max(0.001, denAvg.get('4',0) - adj*0.33)
                     denAvg['1'] = max(0.001, denAvg.get('1',0) + adj); outAvg = max(0.01, outAvg - 0.04)
                 elif rrr <= 10.4:
-                    adj = random.uniform(0.04, 0.08)
+                    adj = self.rng.delivery.uniform(0.04, 0.08)
                     denAvg['6'] = max(0.001, denAvg.get('6',0) + adj * 0.2); denAvg['4'] = max(0.001, denAvg.get('4',0) + adj*0.33)
                     outAvg = min(0.95, outAvg - 0.01)
                 elif rrr > 10.4:
-                    adj = random.uniform(0.04,0.08) + (rrr*1.1)/1000
+                    adj = self.rng.delivery.uniform(0.04,0.08) + (rrr*1.1)/1000
                     denAvg['6'] = max(0.001, denAvg.get('6',0) + adj * 0.5); denAvg['4'] = max(0.001, denAvg.get('4',0) + adj*0.33)
                     denAvg['0'] = max(0.001, denAvg.get('0',0) - adj * 0.17); denAvg['1'] = max(0.001, denAvg.get('1',0) - adj*0.67)
                     outAvg = min(0.95, outAvg + (0.02 + (rrr*1.1)/1000))
@@ -332,17 +373,18 @@ class MatchSimulator:
             score += tracker_stats['balls_bowled'] * 0.1
             eligible_bowlers.append({'initial': initial, 'score': score})
         if not eligible_bowlers:
-            eligible_bowlers = [{'initial': b, 'score': random.random() + (100 if b == self.last_over_bowler_initial else 0) }
+            eligible_bowlers = [{'initial': b, 'score': self.rng.bowling.random() + (100 if b == self.last_over_bowler_initial else 0) }
                                 for b in self.bowlers_list[self.bowling_team_code]
                                 if bowler_tracker_this_innings.get(b,{}).get('balls_bowled',0) < 24]
         if not eligible_bowlers:
-             if self.bowlers_list[self.bowling_team_code]: return random.choice(self.bowlers_list[self.bowling_team_code])
+             if self.bowlers_list[self.bowling_team_code]: return self.rng.bowling.choice(self.bowlers_list[self.bowling_team_code])
              return self.last_over_bowler_initial
         eligible_bowlers.sort(key=lambda x: x['score'])
         return eligible_bowlers[0]['initial']
 
     def simulate_one_ball(self):
         if self.game_over: return {"summary": self.get_game_state(), "ball_event": {"commentary": f"Game is over. {self.win_message}"}}
+        self.deliveries += 1
         inn_data = self.innings[self.current_innings_num]; batsman_initial = self.current_batsmen['on_strike']; non_striker_initial = self.current_batsmen['non_strike']; bowler_initial = self.current_bowler
         if not batsman_initial: self._end_innings(); return {"summary": self.get_game_state(), "ball_event": {"commentary": "Innings ended: No batsman available."}}
         if not bowler_initial:
@@ -356,15 +398,15 @@ class MatchSimulator:
         bowler_tracker = inn_data['bowling_tracker'].setdefault(bowler_initial, {'overs_str': "0.0", 'balls_bowled': 0, 'runs_conceded': 0, 'wickets': 0, 'maidens': 0, 'economy': 0.0, 'dots':0})
         denAvg, outAvg, outTypeAvg, wideRate, noballRate = self._calculate_dynamic_probabilities(batsman_obj, bowler_obj, inn_data, batsman_tracker)
         runs_this_ball = 0; is_wicket_this_ball = False; extra_type_this_ball = None; extra_runs_this_ball = 0; is_legal_delivery = True; commentary_this_ball = ""; wicket_details = {}
-        if random.uniform(0,1) < wideRate:
+        if self.rng.delivery.uniform(0,1) < wideRate:
             is_legal_delivery = False; extra_type_this_ball = 'Wide'; extra_runs_this_ball = 1
             inn_data['score'] += 1; bowler_tracker['runs_conceded'] += 1; commentary_this_ball = "Wide."
         else:
-            if random.uniform(0,1) < outAvg :
+            if self.rng.delivery.uniform(0,1) < outAvg :
                 is_wicket_this_ball = True; inn_data['wickets'] += 1; wicket_type_chosen = "Bowled"
                 out_type_total_prob = sum(v for v in outTypeAvg.values() if isinstance(v, (int,float)) and v > 0)
                 if out_type_total_prob > 0:
-                    out_type_rand = random.uniform(0, out_type_total_prob); current_prob_sum = 0
+                    out_type_rand = self.rng.delivery.uniform(0, out_type_total_prob); current_prob_sum = 0
                     for w_type, w_prob in outTypeAvg.items():
                         current_prob_sum += w_prob
                         if out_type_rand <= current_prob_sum: wicket_type_chosen = w_type; break
@@ -374,7 +416,7 @@ class MatchSimulator:
                 if wicket_type_chosen.lower() == 'caught':
                     fielding_team_pool = self.team1_players_stats if self.bowling_team_code == self.team1_code else self.team2_players_stats
                     possible_catchers_initials = [p_init for p_init in fielding_team_pool.keys() if p_init != bowler_initial]
-                    catcher_initial = random.choice(possible_catchers_initials) if possible_catchers_initials else bowler_initial
+                    catcher_initial = self.rng.delivery.choice(possible_catchers_initials) if possible_catchers_initials else bowler_initial
                     batsman_tracker['fielder'] = catcher_initial; wicket_details['fielder'] = catcher_initial
                     commentary_this_ball = f"{batsman_initial} c {catcher_initial} b {bowler_initial} OUT!"
                 elif wicket_type_chosen.lower() == 'runout': wicket_details['bowler_credit'] = False
@@ -384,7 +426,7 @@ class MatchSimulator:
                 total_run_prob = sum(v for v in denAvg.values() if isinstance(v, (int,float)) and v > 0)
                 runs_this_ball = 0
                 if total_run_prob > 0 :
-                    run_rand = random.uniform(0, total_run_prob); current_prob_sum = 0
+                    run_rand = self.rng.delivery.uniform(0, total_run_prob); current_prob_sum = 0
                     for run_val_str, run_prob in denAvg.items():
                         current_prob_sum += run_prob
                         if run_rand <= current_prob_sum: runs_this_ball = int(run_val_str); break
@@ -439,6 +481,16 @@ class MatchSimulator:
             elif s1 == s2: self.match_winner = "Tie"; self.win_message = "Match Tied."
             else: self.match_winner = inn1_bat_team; self.win_message = f"{self.match_winner.upper()} won by {s1 - s2} runs."
 
+    def get_live_state(self):
+        """The scoreboard without trackers or logs, so its size does not grow with the match."""
+        inn_data = self.innings.get(self.current_innings_num, {})
+        return {"current_innings_num": self.current_innings_num, "score": inn_data.get('score', 0),
+            "wickets": inn_data.get('wickets', 0), "legal_balls_bowled": inn_data.get('legal_balls_bowled', 0),
+            "batting_team": (inn_data.get('batting_team_code') or "").upper() or None,
+            "on_strike": self.current_batsmen['on_strike'], "non_striker": self.current_batsmen['non_strike'],
+            "current_bowler": self.current_bowler, "target_score": self.target, "game_over": self.game_over,
+            "win_message": self.win_message, "toss_message": self.toss_message}
+
     def get_game_state(self):
         current_bat_team_code_for_state = None
         current_bowl_team_code_for_state = None
@@ -0,0 +1,94 @@
+"""Compact, versioned snapshots of an interactive match.
+
+Every random draw a simulator makes comes from its ``MatchRandom`` streams,
+so the state after N deliveries is fully described by the teams, the seed,
+the pitch factors and N. A snapshot stores only that, in a few dozen bytes,
+instead of the trackers and ball logs ``get_game_state()`` carries; restoring
+it re-simulates the N deliveries.
+
+Layout (network byte order):
+
+    magic       2 bytes   b"MS"
+    schema      uint8     SCHEMA_VERSION
+    engine      uint16    version of the simulator that made it
+    flags       uint8     bit 0: toss done, bit 1: pitch factors present
+    deliveries  uint16    deliveries simulated so far
+    [pace, spin, outfield as float64, if flagged]
+    team1, team2, seed    each a uint8 length + UTF-8 text; the seed is
+                          prefixed "i" for an int or "s" for a string
+
+A snapshot from another schema or engine version is rejected rather than
+guessed at, since the same seed would not reproduce the same match.
+"""
+
+import struct
+from collections import namedtuple
+
+SCHEMA_VERSION = 1
+MAGIC = b"MS"
+
+_HEADER = struct.Struct("!2sBHBH")
+_PITCH = struct.Struct("!3d")
+_TOSS_DONE = 1
+_HAS_PITCH = 2
+
+Snapshot = namedtuple("Snapshot", "engine team1 team2 seed deliveries toss_done pitch_factors")
+
+
+class SnapshotError(ValueError):
+    """Raised for bytes that are not a snapshot this code can restore."""
+
+
+def _pack_text(text):
+    raw = text.encode("utf-8")
+    if len(raw) > 255:
+        raise SnapshotError(f"{text[:20]!r}... is too long for a snapshot field")
+    return bytes([len(raw)]) + raw
+
+
+def _unpack_text(data, offset):
+    if offset >= len(data):
+        raise SnapshotError("truncated snapshot")
+    end = offset + 1 + data[offset]
+    if end > len(data):
+        raise SnapshotError("truncated snapshot")
+    return data[offset + 1:end].decode("utf-8"), end
+
+
+def pack(snapshot):
+    """Encodes a ``Snapshot`` as bytes."""
+    flags = (_TOSS_DONE if snapshot.toss_done else 0) | (_HAS_PITCH if snapshot.pitch_factors else 0)
+    parts = [_HEADER.pack(MAGIC, SCHEMA_VERSION, snapshot.engine, flags, snapshot.deliveries)]
+    if snapshot.pitch_factors:
+        parts.append(_PITCH.pack(*snapshot.pitch_factors))
+    seed = f"i{snapshot.seed}" if isinstance(snapshot.seed, int) else f"s{snapshot.seed}"
+    for text in (snapshot.team1, snapshot.team2, seed):
+        parts.append(_pack_text(text))
+    return b"".join(parts)
+
+
+def unpack(data, engine=None):
+    """Decodes bytes from ``pack``; with ``engine`` given, other engine versions are rejected."""
+    if len(data) < _HEADER.size:
+        raise SnapshotError("truncated snapshot")
+    magic, schema, snap_engine, flags, deliveries = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("not a match snapshot")
+    if schema != SCHEMA_VERSION:
+        raise SnapshotError(f"snapshot schema {schema} is not supported (expected {SCHEMA_VERSION})")
+    if engine is not None and snap_engine != engine:
+        raise SnapshotError(f"snapshot was made by engine {snap_engine}, this is engine {engine}")
+    offset = _HEADER.size
+    pitch_factors = None
+    if flags & _HAS_PITCH:
+        if len(data) < offset + _PITCH.size:
+            raise SnapshotError("truncated snapshot")
+        pitch_factors = _PITCH.unpack_from(data, offset)
+        offset += _PITCH.size
+    team1, offset = _unpack_text(data, offset)
+    team2, offset = _unpack_text(data, offset)
+    seed, offset = _unpack_text(data, offset)
+    if offset != len(data):
+        raise SnapshotError("trailing bytes after snapshot")
+    seed = int(seed[1:]) if seed[:1] == "i" else seed[1:]
+    return Snapshot(snap_engine, team1, team2, seed, deliveries, bool(flags & _TOSS_DONE), pitch_factors)
@@ -0,0 +1,163 @@
+"""Batch Monte Carlo simulation of a single fixture.
+
+``simulate_many`` plays N independent seeded matches of the same fixture
+across a process pool and returns aggregated distributions instead of the
+per-match result dicts. Each worker folds its matches into a partial
+aggregate, so only small Counters cross process boundaries, and match ``i``
+is always seeded from ``(seed, i)`` so the output does not depend on the
+number of workers.
+
+Matches run with the default no-op event sink and ``keep_log=False``: nothing
+is written to scores/ and no ball log is kept, so a worker's memory does not
+grow with the number of balls it simulates.
+``engine="batch"`` swaps the per-ball engine for the vectorized one in
+batch_engine (NumPy), which is much faster but keeps no ball log.
+"""
+
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import batch_engine
+import mainconnect
+
+# Matches per batch_engine call; fixed so results do not depend on the worker count
+BATCH_CHUNK = 10000
+
+
+def _empty_aggregate(team1, team2):
+    return {
+        "matches": 0,
+        "wins": Counter(),                                # team code or "tie" -> count
+        "scores": {team1: Counter(), team2: Counter()},   # team -> {total: count}
+        "wickets": {team1: Counter(), team2: Counter()},  # team -> {wickets lost: count}
+        "margins": {"runs": Counter(), "wickets": Counter()},
+        "player_runs": {},                                # initials -> {runs: count}, innings batted only
+        "player_wickets": {},                             # initials -> {wickets: count}, innings bowled only
+    }
+
+
+def _wickets(bat_tracker):
+    # The wickets scorecard.batting_card counts, without building the card
+    return sum(1 for stats in bat_tracker.values() if stats["dismissal"] is not None)
+
+
+def _add_result(agg, result):
+    """Folds one ``Match.play()`` result into an aggregate; the ball logs are not used."""
+    agg["matches"] += 1
+    agg["wins"][result["winner"]] += 1
+
+    for inn in ("innings1", "innings2"):
+        team = result[f"{inn}BatTeam"]
+        agg["scores"][team][result[f"{inn}Runs"]] += 1
+        agg["wickets"][team][_wickets(result[f"{inn}Battracker"])] += 1
+        for name, stats in result[f"{inn}Battracker"].items():
+            if stats["balls"] > 0:
+                agg["player_runs"].setdefault(name, Counter())[stats["runs"]] += 1
+        for name, stats in result[f"{inn}Bowltracker"].items():
+            if stats["balls"] > 0:
+                agg["player_wickets"].setdefault(name, Counter())[stats["wickets"]] += 1
+
+    runs1, runs2 = result["innings1Runs"], result["innings2Runs"]
+    if runs2 > runs1:
+        agg["margins"]["wickets"][10 - _wickets(result["innings2Battracker"])] += 1
+    elif runs1 > runs2:
+        agg["margins"]["runs"][runs1 - runs2] += 1
+
+
+def merge(agg, other):
+    """Adds aggregate ``other`` into ``agg`` in place and returns ``agg``."""
+    agg["matches"] += other["matches"]
+    agg["wins"].update(other["wins"])
+    for key in ("scores", "wickets", "margins"):
+        for team, counts in other[key].items():
+            agg[key].setdefault(team, Counter()).update(counts)
+    for key in ("player_runs", "player_wickets"):
+        for name, counts in other[key].items():
+            agg[key].setdefault(name, Counter()).update(counts)
+    return agg
+
+
+def _run_chunk(team1, team2, seed, indices):
+    agg = _empty_aggregate(team1, team2)
+    for i in indices:
+        _add_result(agg, mainconnect.Match(team1, team2, seed=f"{seed}-{i}", keep_log=False).play())
+    return agg
+
+
+def _run_batch_chunk(team1, team2, seed, indices):
+    result = batch_engine.simulate_batch(team1, team2, len(indices), seed=[seed, indices.start])
+    return batch_engine.aggregate(result)
+
+
+def _summary(counts):
+    """Mean and a few percentiles of a {value: count} Counter."""
+    total = sum(counts.values())
+    if total == 0:
+        return {"mean": None, "p10": None, "p50": None, "p90": None}
+    summary = {"mean": sum(value * count for value, count in counts.items()) / total}
+    targets = [("p10", 0.1), ("p50", 0.5), ("p90", 0.9)]
+    seen = 0
+    for value in sorted(counts):
+        seen += counts[value]
+        while targets and seen >= targets[0][1] * total:
+            summary[targets.pop(0)[0]] = value
+    return summary
+
+
+def summarize(agg):
+    """Turns a raw aggregate into win probabilities and distribution summaries."""
+    n = agg["matches"]
+    return {
+        "matches": n,
+        "win_probability": {team: count / n for team, count in agg["wins"].items()} if n else {},
+        "scores": {team: {"summary": _summary(counts), "histogram": dict(sorted(counts.items()))}
+                   for team, counts in agg["scores"].items()},
+        "wickets": {team: dict(sorted(counts.items())) for team, counts in agg["wickets"].items()},
+        "margins": {kind: dict(sorted(counts.items())) for kind, counts in agg["margins"].items()},
+        "player_runs": {name: {"summary": _summary(counts), "histogram": dict(sorted(counts.items()))}
+                        for name, counts in agg["player_runs"].items()},
+        "player_wickets": {name: {"summary": _summary(counts), "histogram": dict(sorted(counts.items()))}
+                           for name, counts in agg["player_wickets"].items()},
+    }
+
+
+def simulate_many(team1, team2, n, workers=None, seed=None, chunk_size=None, engine="ball"):
+    """Simulates ``n`` matches of ``team1`` v ``team2`` and returns ``summarize()``'d aggregates.
+
+    ``workers`` defaults to the CPU count; 1 runs everything in this process.
+    ``seed`` makes the whole batch reproducible (a random one is drawn when
+    omitted and returned as ``result["seed"]``). ``engine`` is "ball" for
+    mainconnect or "batch" for batch_engine; the two use different random
+    streams, so the same seed gives different (equally distributed) samples.
+    """
+    team1, team2 = team1.lower(), team2.lower()
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    workers = workers or os.cpu_count() or 1
+    if engine == "batch":
+        run_chunk = _run_batch_chunk
+        chunk_size = chunk_size or BATCH_CHUNK
+    elif engine == "ball":
+        run_chunk = _run_chunk
+        if chunk_size is None:
+            # A few chunks per worker keeps the pool busy without much IPC
+            chunk_size = max(1, min(500, n // (workers * 4) or 1))
+    else:
+        raise ValueError(f"unknown engine {engine!r}")
+    chunks = [range(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+
+    agg = _empty_aggregate(team1, team2)
+    if workers == 1 or len(chunks) <= 1:
+        for indices in chunks:
+            merge(agg, run_chunk(team1, team2, seed, indices))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_chunk, team1, team2, seed, indices) for indices in chunks]
+            for future in futures:
+                merge(agg, future.result())
+
+    result = summarize(agg)
+    result["seed"] = seed
+    return result
@@ -0,0 +1,146 @@
+"""Compiled per-player probability tables.
+
+The engines used to turn the raw counts in playerInfoProcessed.json into
+probability tables at the start of every innings. ``get_player`` does that
+work once per player and caches the result keyed by the repository's
+version (the data file's hash for the default JSON backend), so match setup
+is a dictionary lookup and edited data is picked up automatically. Raw
+records come from ``repository`` (see player_repository).
+
+A compiled record is the raw player dict plus these derived keys (computed
+with the +1 smoothing on ball counts that mainconnect has always used):
+
+    batRunDenominationsObject, batOutTypesObject, batOutsRate, runOutRate,
+    posAvg, posAvgsAll,
+    bowlRunDenominationsObject, bowlOutTypesObject, bowlOutsRate,
+    bowlWideRate, bowlNoballRate, bowlBallsTotalRate, catchRate,
+    overNumbersObject ("1".."20")
+
+Compiled records are shared by every match in the process, so they are
+frozen: dicts become read-only mappingproxy views and lists become tuples.
+"""
+
+import threading
+
+import player_repository
+from frozen import freeze
+
+DATA_PATH = "data/playerInfoProcessed.json"
+
+# Where raw records come from; see player_repository and set_repository
+repository = player_repository.from_env()
+
+_lock = threading.Lock()
+_version = None  # repository.version() the cache was filled under
+_compiled = {}   # (version, compiler, initials) -> compiled record
+
+
+def data_hash(path=DATA_PATH):
+    """Returns the sha1 of the player data file, rehashing only when its mtime or size changes."""
+    return player_repository.file_digest(path)
+
+
+def _current_version():
+    global _version
+    version = repository.version()
+    if version != _version:
+        # The data changed: records compiled from the old contents are dead
+        with _lock:
+            _compiled.clear()
+            _version = version
+    return version
+
+
+def _position_averages(raw):
+    newPos = [p for p in raw['position'] if p != "null"]
+    posAvgObj = {"0": 0, "1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "6": 0, "7": 0, "8": 0, "9": 0, "10": 0}
+    for p in newPos:
+        posAvgObj[str(p)] = posAvgObj.get(str(p), 0) + 1
+    for key_p in posAvgObj:
+        posAvgObj[key_p] = posAvgObj[key_p] / raw['matches']
+    posAvg = sum(newPos) / len(newPos) if newPos else 9.0
+    return posAvg, posAvgObj
+
+
+def compile_player(initials, raw):
+    """Builds the compiled record for one raw player dict. ``raw`` is not modified."""
+    player = dict(raw)
+
+    batBalls = raw['batBallsTotal'] + 1
+    player['batRunDenominationsObject'] = {run: count / batBalls for run, count in raw['batRunDenominations'].items()}
+    player['batOutTypesObject'] = {out: count / batBalls for out, count in raw['batOutTypes'].items()}
+    player['batOutsRate'] = raw['batOutsTotal'] / batBalls
+    player['runOutRate'] = raw['runnedOut'] / batBalls
+    player['posAvg'], player['posAvgsAll'] = _position_averages(raw)
+
+    bowlBalls = raw['bowlBallsTotal'] + 1
+    player['bowlBallsTotalRate'] = raw['bowlBallsTotal'] / raw['matches']
+    player['catchRate'] = raw['catches'] / raw['matches']
+    player['bowlWideRate'] = raw['bowlWides'] / bowlBalls
+    player['bowlNoballRate'] = raw['bowlNoballs'] / bowlBalls
+    player['bowlRunDenominationsObject'] = {run: count / bowlBalls for run, count in raw['bowlRunDenominations'].items()}
+    player['bowlOutTypesObject'] = {out: count / bowlBalls for out, count in raw['bowlOutTypes'].items()}
+    player['bowlOutsRate'] = raw['bowlOutsTotal'] / bowlBalls
+
+    overs = {str(o): 0 for o in range(1, 21)}
+    for over in raw['overNumbers']:
+        overs[over] += 1
+    player['overNumbersObject'] = {over: (count / raw['matches'] if raw['matches'] != 0 else -1)
+                                   for over, count in overs.items()}
+    return player
+
+
+def get_players(names, compiler=compile_player):
+    """Returns {initials: frozen compiled record} for the known players in ``names``.
+
+    Records not compiled yet are fetched with a single ``repository.get_many``
+    call, so a match loads both squads in one round trip. ``compiler(initials,
+    raw)`` returns the record to cache; engines with their own table formulas
+    pass their own. Unknown players are left out of the result.
+    """
+    version = _current_version()
+    found = {}
+    missing = []
+    for initials in names:
+        player = _compiled.get((version, compiler, initials))
+        if player is None:
+            missing.append(initials)
+        else:
+            found[initials] = player
+    if missing:
+        raw = repository.get_many(missing)
+        with _lock:
+            for initials, record in raw.items():
+                key = (version, compiler, initials)
+                player = _compiled.get(key)
+                if player is None:
+                    player = freeze(compiler(initials, record))
+                    _compiled[key] = player
+                found[initials] = player
+    return found
+
+
+def get_player(initials, compiler=compile_player):
+    """Returns the frozen compiled record for ``initials``, building it on first use.
+
+    Raises KeyError for unknown players, like accessJSON.getPlayerInfo.
+    """
+    found = get_players([initials], compiler)
+    if initials not in found:
+        raise KeyError(initials)
+    return found[initials]
+
+
+def set_repository(repo):
+    """Switches the backend raw records are read from and drops every compiled record."""
+    global repository
+    with _lock:
+        repository = repo
+    clear_cache()
+
+
+def clear_cache():
+    global _version
+    with _lock:
+        _compiled.clear()
+        _version = None
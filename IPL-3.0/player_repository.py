@@ -0,0 +1,204 @@
+"""Where raw player records come from.
+
+Every backend implements ``PlayerRepository``: ``get_many(names)`` returns
+{name: raw record} for the names it knows (unknown names are simply absent),
+so an engine can fetch both squads in one call, and ``version()`` returns a
+token that changes whenever the underlying data does, which player_model
+uses to key its compiled-record cache.
+
+    JSONPlayerRepository    data/playerInfoProcessed.json via accessJSON's lazy store
+    SQLitePlayerRepository  a self-contained SQLite file built from the JSON data
+    MongoPlayerRepository   the original "cricmanagerrecent" Mongo database
+
+``from_env()`` picks one from IPL_PLAYER_BACKEND ("json", the default,
+"sqlite" or "mongo").
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+import accessJSON
+
+_digests = {}   # path -> (mtime, size, sha1)
+
+
+def file_digest(path):
+    """Returns the sha1 of ``path``, rehashing only when its mtime or size changes."""
+    st = os.stat(path)
+    cached = _digests.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    with open(path, "rb") as fl:
+        digest = hashlib.sha1(fl.read()).hexdigest()
+    _digests[path] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+class PlayerRepository:
+    """Interface of a player data backend."""
+
+    def get_many(self, names):
+        """Returns {name: raw record} for every name in ``names`` the backend knows."""
+        raise NotImplementedError
+
+    def get(self, name):
+        """Returns one raw record. Raises KeyError for unknown players, like accessJSON.getPlayerInfo."""
+        found = self.get_many([name])
+        if name not in found:
+            raise KeyError(name)
+        return found[name]
+
+    def version(self):
+        """A token that changes when the data does; None if changes cannot be detected."""
+        return None
+
+    def close(self):
+        pass
+
+
+class JSONPlayerRepository(PlayerRepository):
+
+    def __init__(self, path=accessJSON.DATA_PATH):
+        self.path = path
+        self.store = accessJSON.data if path == accessJSON.DATA_PATH else accessJSON.PlayerStore(path)
+        self._version = None
+
+    def get_many(self, names):
+        store = self.store
+        return {name: store[name] for name in names if name in store}
+
+    def version(self):
+        digest = file_digest(self.path)
+        if self._version is not None and self._version != digest:
+            # The file was edited: drop the stale index and decoded records
+            self.store.reload()
+        self._version = digest
+        return digest
+
+    def records(self):
+        """Yields every (name, raw record); used to build the other backends."""
+        for name in self.store:
+            yield name, self.store[name]
+
+
+class SQLitePlayerRepository(PlayerRepository):
+    """Players in one SQLite table keyed (and so indexed) by displayName.
+
+    The database records the sha1 of the JSON file it was built from and is
+    rebuilt from ``source`` on open when that no longer matches, so it never
+    needs a separate import step or a server. The rebuild runs in one
+    ``BEGIN IMMEDIATE`` transaction: other processes sharing the file keep
+    reading the old table until it commits, and only one of them rebuilds.
+    """
+
+    def __init__(self, path="data/players.sqlite", source=None):
+        self.path = path
+        self.source = source if source is not None else JSONPlayerRepository()
+        self._local = threading.local()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode, so _ensure_built controls its transaction (and DDL is part of it)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def _ensure_built(self):
+        """Returns the source sha1 the database holds, rebuilding it first if it is stale."""
+        wanted = self.source.version()
+        if self._version == wanted:
+            return wanted
+        with self._lock:
+            conn = self._connection()
+            # The write lock is taken before the version check, so a process that
+            # waited for another one's rebuild sees it is current and skips its own
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+                row = conn.execute("SELECT value FROM meta WHERE key = 'source_version'").fetchone()
+                if row is None or row[0] != wanted:
+                    conn.execute("DROP TABLE IF EXISTS players")
+                    conn.execute("CREATE TABLE players (displayName TEXT PRIMARY KEY, playerInitials TEXT, record TEXT NOT NULL)")
+                    conn.execute("CREATE INDEX players_initials ON players (playerInitials)")
+                    conn.executemany("INSERT INTO players VALUES (?, ?, ?)",
+                                     ((name, record.get("playerInitials"), json.dumps(record))
+                                      for name, record in self.source.records()))
+                    conn.execute("INSERT OR REPLACE INTO meta VALUES ('source_version', ?)", (wanted,))
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self._version = wanted
+        return wanted
+
+    def get_many(self, names):
+        self._ensure_built()
+        names = list(dict.fromkeys(names))
+        found = {}
+        # SQLite caps bound parameters (999 on older builds)
+        for start in range(0, len(names), 500):
+            batch = names[start:start + 500]
+            rows = self._connection().execute(
+                f"SELECT displayName, record FROM players WHERE displayName IN ({','.join('?' * len(batch))})", batch)
+            for name, record in rows:
+                found[name] = json.loads(record)
+        return found
+
+    def version(self):
+        return self._ensure_built()
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class MongoPlayerRepository(PlayerRepository):
+    """The Mongo collection accessDB used, read with one ``$in`` query per call.
+
+    pymongo is imported on first use, and its MongoClient keeps a connection
+    pool shared by every thread.
+    """
+
+    def __init__(self, uri="mongodb://localhost:27017", database="cricmanagerrecent", collection="playerInfo"):
+        self.uri = uri
+        self.database = database
+        self.collectionName = collection
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _collection(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import pymongo
+                    self._client = pymongo.MongoClient(self.uri)
+        return self._client[self.database][self.collectionName]
+
+    def get_many(self, names):
+        names = list(dict.fromkeys(names))
+        return {doc["displayName"]: doc for doc in self._collection().find({"displayName": {"$in": names}})}
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+def from_env():
+    """Builds the repository named by IPL_PLAYER_BACKEND (json, sqlite or mongo)."""
+    backend = os.environ.get("IPL_PLAYER_BACKEND", "json").lower()
+    if backend == "json":
+        return JSONPlayerRepository()
+    if backend == "sqlite":
+        return SQLitePlayerRepository(os.environ.get("IPL_PLAYER_DB", "data/players.sqlite"))
+    if backend == "mongo":
+        return MongoPlayerRepository(os.environ.get("IPL_MONGO_URI", "mongodb://localhost:27017"))
+    raise ValueError(f"unknown IPL_PLAYER_BACKEND {backend!r}")
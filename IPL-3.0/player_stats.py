@@ -0,0 +1,119 @@
+"""Season batting and bowling totals that stay the same size however many balls are played.
+
+``SeasonStats`` keeps one small row of counters per player and folds each
+innings into them: batting rows hold innings, runs, balls, outs, fours,
+sixes and the highest score; bowling rows hold matches, balls, runs and
+wickets. A match's ballLogs are read once (for boundaries) and dropped, so
+memory grows with the number of players, never with the number of balls.
+
+``innings_lines`` reduces one innings' trackers to compact per-player lines;
+season.py sends those back from its workers instead of the trackers, and
+``SeasonStats`` objects built in different processes combine with ``merge``.
+Leaderboards come from ``top_batters``/``top_bowlers``, which take the top K
+with a bounded heap rather than sorting every player.
+"""
+
+import heapq
+
+
+def _runs_off(entry):
+    # ballLog entries look like "12:4" or "12:W-CaughtBy-..."
+    return entry.partition(":")[2]
+
+
+def innings_lines(bat_tracker, bowl_tracker):
+    """One innings as ({player: (runs, balls, out, fours, sixes)}, {player: (balls, runs, wickets)}).
+
+    Batters who neither faced a ball nor were dismissed, and bowlers who did
+    not bowl, are left out.
+    """
+    batting, bowling = {}, {}
+    for player, stats in bat_tracker.items():
+        if stats["balls"] or stats["dismissal"]:
+            shots = [_runs_off(entry) for entry in stats["ballLog"]]
+            batting[player] = (stats["runs"], stats["balls"], stats["dismissal"] is not None,
+                               shots.count("4"), shots.count("6"))
+    for player, stats in bowl_tracker.items():
+        if stats["balls"] or stats["runs"]:
+            bowling[player] = (stats["balls"], stats["runs"], stats["wickets"])
+    return batting, bowling
+
+
+def batting_average(row):
+    return row["runs"] / row["outs"] if row["outs"] else None
+
+
+def strike_rate(row):
+    return row["runs"] / row["balls"] * 100 if row["balls"] else None
+
+
+def economy(row):
+    return row["runs"] / row["balls"] * 6 if row["balls"] else None
+
+
+class SeasonStats:
+
+    def __init__(self):
+        self.batting = {}  # player -> {"innings", "runs", "balls", "outs", "fours", "sixes", "highest"}
+        self.bowling = {}  # player -> {"matches", "balls", "runs", "wickets"}
+
+    def __eq__(self, other):
+        if not isinstance(other, SeasonStats):
+            return NotImplemented
+        return self.batting == other.batting and self.bowling == other.bowling
+
+    def __repr__(self):
+        return f"SeasonStats({len(self.batting)} batters, {len(self.bowling)} bowlers)"
+
+    def add_lines(self, batting, bowling):
+        """Adds per-player lines from ``innings_lines`` (or a season.play_fixture summary)."""
+        for player, (runs, balls, out, fours, sixes) in batting.items():
+            row = self.batting.get(player)
+            if row is None:
+                row = self.batting[player] = {"innings": 0, "runs": 0, "balls": 0, "outs": 0,
+                                              "fours": 0, "sixes": 0, "highest": 0}
+            row["innings"] += 1
+            row["runs"] += runs
+            row["balls"] += balls
+            row["outs"] += out
+            row["fours"] += fours
+            row["sixes"] += sixes
+            row["highest"] = max(row["highest"], runs)
+        for player, (balls, runs, wickets) in bowling.items():
+            row = self.bowling.get(player)
+            if row is None:
+                row = self.bowling[player] = {"matches": 0, "balls": 0, "runs": 0, "wickets": 0}
+            row["matches"] += 1
+            row["balls"] += balls
+            row["runs"] += runs
+            row["wickets"] += wickets
+        return self
+
+    def add_innings(self, bat_tracker, bowl_tracker):
+        return self.add_lines(*innings_lines(bat_tracker, bowl_tracker))
+
+    def add_match(self, result):
+        """Adds both innings of a mainconnect result dict."""
+        for inn in ("innings1", "innings2"):
+            self.add_innings(result[f"{inn}Battracker"], result[f"{inn}Bowltracker"])
+        return self
+
+    def merge(self, other):
+        """Adds ``other``'s totals into this one and returns it."""
+        for player, theirs in other.batting.items():
+            row = self.batting.setdefault(player, dict.fromkeys(theirs, 0))
+            for key, value in theirs.items():
+                row[key] = max(row[key], value) if key == "highest" else row[key] + value
+        for player, theirs in other.bowling.items():
+            row = self.bowling.setdefault(player, dict.fromkeys(theirs, 0))
+            for key, value in theirs.items():
+                row[key] += value
+        return self
+
+    def top_batters(self, k=3):
+        """The ``k`` leading run scorers as [(player, row)], fewer balls first on equal runs."""
+        return heapq.nsmallest(k, self.batting.items(), key=lambda item: (-item[1]["runs"], item[1]["balls"], item[0]))
+
+    def top_bowlers(self, k=3):
+        """The ``k`` leading wicket takers as [(player, row)], fewer runs conceded first on equal wickets."""
+        return heapq.nsmallest(k, self.bowling.items(), key=lambda item: (-item[1]["wickets"], item[1]["runs"], item[0]))
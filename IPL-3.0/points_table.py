@@ -0,0 +1,116 @@
+"""League points table with net run rate and standings kept up to date.
+
+``PointsTable`` is a read-only mapping of team code to its row (P, W, L, T,
+pts, the four run/ball totals and ``nrr``). ``record`` adds one match and
+updates only the two teams involved: their net run rate is recomputed from
+the running totals and they are moved to their new places in the ranking,
+so ``standings()`` is a lookup rather than a sort. Teams with no balls faced
+or bowled yet have a net run rate of 0.
+
+The ranking is points, then net run rate, then team code, so equal teams
+always come out in the same order. Tables are plain data and pickle cheaply;
+``merge`` adds another table's results (e.g. from a worker process) into
+this one.
+"""
+
+from bisect import bisect_left, insort
+from collections.abc import Mapping
+
+_TOTALS = ("P", "W", "L", "T", "pts", "runsScored", "ballsFaced", "runsConceded", "ballsBowled")
+
+
+def net_run_rate(row):
+    if not row["ballsFaced"] or not row["ballsBowled"]:
+        return 0.0
+    return (row["runsScored"] / row["ballsFaced"]) * 6 - (row["runsConceded"] / row["ballsBowled"]) * 6
+
+
+class PointsTable(Mapping):
+
+    def __init__(self, teams):
+        self._rows = {team: dict(dict.fromkeys(_TOTALS, 0), nrr=0.0) for team in teams}
+        self._ranking = sorted(self._rank_key(team) for team in self._rows)
+        self._publish()
+
+    def __getitem__(self, team):
+        return self._rows[team]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __repr__(self):
+        return f"PointsTable({list(self._standings)!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, PointsTable):
+            return self._rows == other._rows
+        return super().__eq__(other)
+
+    def _publish(self):
+        self._standings = tuple(key[2] for key in self._ranking)
+        self._places = {team: place for place, team in enumerate(self._standings, 1)}
+
+    def _rank_key(self, team):
+        row = self._rows[team]
+        return (-row["pts"], -row["nrr"], team)
+
+    def record(self, team1, team2, winner, innings):
+        """Adds one match.
+
+        ``winner`` is a team code or "tie"; ``innings`` holds both innings as
+        {"team", "runs", "balls"} dicts (the shape of season.play_fixture).
+        """
+        for team in (team1, team2):
+            if team not in self._rows:
+                raise KeyError(f"{team!r} is not in this points table")
+        old_keys = [self._rank_key(team) for team in (team1, team2)]
+        rows = self._rows
+        rows[team1]["P"] += 1
+        rows[team2]["P"] += 1
+        if winner == "tie":
+            for team in (team1, team2):
+                rows[team]["T"] += 1
+                rows[team]["pts"] += 1
+        else:
+            rows[winner]["W"] += 1
+            rows[team2 if winner == team1 else team1]["L"] += 1
+            rows[winner]["pts"] += 2
+        first, second = innings
+        for bat, bowl in ((first, second), (second, first)):
+            row = rows[bat["team"]]
+            row["runsScored"] += bat["runs"]
+            row["ballsFaced"] += bat["balls"]
+            row["runsConceded"] += bowl["runs"]
+            row["ballsBowled"] += bowl["balls"]
+        for key in old_keys:
+            del self._ranking[bisect_left(self._ranking, key)]
+        for team in (team1, team2):
+            rows[team]["nrr"] = net_run_rate(rows[team])
+            insort(self._ranking, self._rank_key(team))
+        self._publish()
+
+    def record_match(self, match):
+        """Adds a season.play_fixture summary."""
+        self.record(match["team1"], match["team2"], match["winner"], match["innings"])
+
+    def merge(self, other):
+        """Adds every result in ``other`` into this table and returns it."""
+        for team, row in other.items():
+            mine = self._rows.setdefault(team, dict(dict.fromkeys(_TOTALS, 0), nrr=0.0))
+            for total in _TOTALS:
+                mine[total] += row[total]
+            mine["nrr"] = net_run_rate(mine)
+        self._ranking = sorted(self._rank_key(team) for team in self._rows)
+        self._publish()
+        return self
+
+    def standings(self):
+        """Team codes in table order, as a tuple."""
+        return self._standings
+
+    def position(self, team):
+        """1-based place of ``team`` in the table."""
+        return self._places[team]
@@ -0,0 +1,115 @@
+"""Compact, per-over form of a match's ball-by-ball log for the replay page.
+
+The replay page fetches one over at a time instead of the whole log, and
+each ball carries only the fields the page animates, under short keys:
+
+    e  event text          r  innings runs       w  innings wickets
+    b  legal balls bowled  s  striker            b1, b2  the two batters
+    o  bowler
+
+``stream_match`` plays a match on a worker thread and yields the same
+compact balls as they are bowled, for the live (SSE) view.
+"""
+
+import threading
+
+import event_sinks
+import mainconnect
+import scorecard
+
+COMPACT_FIELDS = (("e", "event"), ("r", "runs"), ("w", "wickets"), ("b", "balls"),
+                  ("s", "batsman"), ("b1", "batter1"), ("b2", "batter2"), ("o", "bowler"))
+
+
+def compact_ball(entry):
+    """One log entry with only the replayed fields, under their short keys."""
+    return {short: entry.get(name) for short, name in COMPACT_FIELDS}
+
+
+def over_of(entry):
+    """0-based over a log entry belongs to, from its "<over>.<ball> ..." event text."""
+    return int(entry['event'].split('.', 1)[0])
+
+
+def over_chunks(log):
+    """Splits an innings log into a list of overs, each a list of compact balls.
+
+    Every over up to the last one bowled is present (empty if, somehow, no
+    ball of it was logged), so chunk ``i`` is always over ``i``.
+    """
+    chunks = []
+    for entry in log:
+        over = over_of(entry)
+        while len(chunks) <= over:
+            chunks.append([])
+        chunks[over].append(compact_ball(entry))
+    return chunks
+
+
+class _LiveSink(event_sinks.QueueSink):
+    """Turns a match's events into JSON-ready stream events on the simulating thread.
+
+    Translating here, rather than in the consumer, means nothing reads the
+    match's trackers while the engine is still updating them.
+    """
+
+    def __init__(self, maxsize):
+        super().__init__(maxsize)
+        self.match = None
+        self.bat_teams = {}
+
+    def emit(self, kind, payload):
+        if kind == "ball":
+            self.put(("ball", {"innings": payload["innings"], "ball": compact_ball(payload["ball"])}))
+        elif kind == "toss":
+            self.bat_teams = {1: payload["batting"], 2: payload["bowling"]}
+            self.put(("toss", {"message": payload["message"], "batting": payload["batting"], "bowling": payload["bowling"]}))
+        elif kind == "scorecard":
+            innings = payload["innings"]
+            match = self.match
+            batting, wickets = scorecard.batting_card(getattr(match, f"innings{innings}Battracker"))
+            self.put(("innings", {
+                "innings": innings, "bat_team": self.bat_teams.get(innings),
+                "runs": getattr(match, f"innings{innings}Runs"), "wickets": wickets,
+                "balls": getattr(match, f"innings{innings}Balls"),
+                "battracker": batting, "bowltracker": scorecard.bowling_card(getattr(match, f"innings{innings}Bowltracker")),
+            }))
+        elif kind == "result":
+            self.put(("result", dict(payload)))
+
+
+def stream_match(team1, team2, seed, queue_size=64):
+    """Yields (kind, data) events while ``team1`` v ``team2`` is simulated from ``seed``.
+
+    Kinds, in order: "toss", then "ball" for every delivery with an "innings"
+    summary (runs, wickets, batting and bowling cards) after each innings,
+    "result" just before the second innings' summary, and "error" if the
+    match fails. The match keeps no ball log and at most ``queue_size``
+    events wait for the consumer; closing the generator stops the match.
+    """
+    sink = _LiveSink(queue_size)
+    match = mainconnect.Match(team1, team2, sink=sink, seed=seed, keep_log=False)
+    sink.match = match
+
+    def run():
+        try:
+            match.play()
+        except event_sinks.SinkClosed:
+            return
+        except Exception as e:
+            try:
+                sink.put(("error", {"message": str(e)}))
+            except event_sinks.SinkClosed:
+                return
+        sink.close()
+
+    worker = threading.Thread(target=run, name=f"live-{team1}-{team2}", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = sink.queue.get()
+            if item is event_sinks.QueueSink.DONE:
+                return
+            yield item
+    finally:
+        sink.cancel()
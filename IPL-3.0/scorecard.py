@@ -0,0 +1,64 @@
+"""Batting and bowling cards built from the engine's trackers.
+
+The engine records each dismissal as a structured ``dismissal`` on the
+batter's tracker (see ball_log.dismissal_record), so a card is one pass over
+each tracker with no ballLog parsing and no copying of the trackers.
+"""
+
+
+def describe_dismissal(dismissal):
+    """Scorecard text for a tracker's ``dismissal``: "c X b Y", "lbw b Y", "Run out", or "Not out" for None."""
+    if dismissal is None:
+        return "Not out"
+    out_type = dismissal["type"]
+    if out_type == "caught":
+        return f"c {dismissal['fielder']} b {dismissal['bowler']}"
+    if out_type == "runOut":
+        return "Run out"
+    if dismissal.get("bowler"):
+        return f"{out_type} b {dismissal['bowler']}"
+    return "Wicket"
+
+
+def batting_card(bat_tracker):
+    """Returns ({initials: row}, wickets) for one innings' batterTracker.
+
+    Each row has runs, balls, strike_rate (None before a ball is faced) and
+    how_out ("DNB" for batters who never came in). Rows are in batting order:
+    by the tracker's ``arrival``, then the batters who did not bat in squad
+    order. A batter who came in counts as batted even without facing a ball
+    (e.g. a not-out non-striker). Trackers without ``arrival`` fall back to
+    whether the batter faced a ball.
+    """
+    card = {}
+    wickets = 0
+    order = sorted(bat_tracker, key=lambda name: (bat_tracker[name].get('arrival') is None,
+                                                  bat_tracker[name].get('arrival') or 0))
+    for name in order:
+        stats = bat_tracker[name]
+        runs, balls = stats['runs'], stats['balls']
+        dismissal = stats.get('dismissal')
+        if dismissal is not None:
+            wickets += 1
+            how_out = describe_dismissal(dismissal)
+        elif stats.get('arrival') is not None or stats['ballLog']:
+            how_out = "Not out"
+        else:
+            how_out = "DNB"
+        card[name] = {"runs": runs, "balls": balls, "how_out": how_out,
+                      "strike_rate": round(runs / balls * 100, 2) if balls else None}
+    return card, wickets
+
+
+def bowling_card(bowl_tracker):
+    """Returns {initials: row} for one innings' bowlerTracker.
+
+    Each row has overs ("3.2"), balls, runs, wickets and economy (None for a
+    bowler who did not bowl).
+    """
+    card = {}
+    for name, stats in bowl_tracker.items():
+        balls = stats['balls']
+        card[name] = {"overs": f"{balls // 6}.{balls % 6}", "balls": balls, "runs": stats['runs'],
+                      "wickets": stats['wickets'], "economy": round(stats['runs'] / balls * 6, 2) if balls else None}
+    return card
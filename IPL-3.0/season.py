@@ -0,0 +1,182 @@
+"""Headless IPL season: league, points table and playoffs without a console.
+
+``run_season`` plays every league fixture (each pair of teams once, as in
+doipl.py) across a process pool, folds the results into a
+``points_table.PointsTable`` in fixture order, then plays the playoff
+bracket: Qualifier 1 and the Eliminator together, then Qualifier 2 and the
+Final. Match seeds come from the season seed exactly as in doipl.py, so a
+season seed gives the same matches here and there, whatever the number of
+workers.
+
+Workers send back a small summary per match (scores, result and per-player
+totals) rather than the full result dict; matches run without a ball log or
+commentary.
+
+    python season.py --seed 42 --workers 4 --stats-dir scores
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from tabulate import tabulate
+
+import ball_export
+import mainconnect
+import scorecard
+from match_random import MatchRandom
+from player_stats import SeasonStats, batting_average, economy, innings_lines, strike_rate
+from points_table import PointsTable
+
+TEAMS = ('dc', 'csk', 'rcb', 'mi', 'kkr', 'pbks', 'rr', 'srh')
+
+
+def league_fixtures(teams):
+    """Every pair of teams once, in the order doipl.py plays them."""
+    return [(teams[i], teams[j]) for i in range(len(teams)) for j in range(i + 1, len(teams))]
+
+
+def play_fixture(team1, team2, seed, export=False):
+    """Plays one match and returns its summary (see module docstring).
+
+    With ``export`` the summary also carries the match's deliveries as
+    ``ball_export.BallRowSink`` rows under "balls".
+    """
+    sink = ball_export.BallRowSink() if export else None
+    result = mainconnect.Match(team1, team2, sink=sink, seed=seed, keep_log=False).play()
+    summary = {"team1": team1, "team2": team2, "seed": seed, "winner": result["winner"], "winMsg": result["winMsg"],
+               "innings": [], "batting": {}, "bowling": {}}
+    if export:
+        summary["balls"] = sink.rows
+    for inn in ("innings1", "innings2"):
+        _, wickets = scorecard.batting_card(result[f"{inn}Battracker"])
+        summary["innings"].append({"team": result[f"{inn}BatTeam"], "runs": result[f"{inn}Runs"],
+                                   "balls": result[f"{inn}Balls"], "wickets": wickets})
+        batting, bowling = innings_lines(result[f"{inn}Battracker"], result[f"{inn}Bowltracker"])
+        summary["batting"].update(batting)
+        summary["bowling"].update(bowling)
+    return summary
+
+
+def _play(job):
+    return play_fixture(*job)
+
+
+def run_season(teams=TEAMS, seed=None, workers=None, exporter=None):
+    """Plays a full season and returns its fixtures, points table, playoffs, champion and player totals
+    (a ``player_stats.SeasonStats``).
+
+    ``workers`` defaults to the CPU count; 1 plays every match in this process.
+    ``seed`` is the season seed (a fresh one is drawn when omitted and returned
+    as ``result["seed"]``). With an ``exporter`` (a ``ball_export.BallExporter``)
+    every delivery is written to it as each match comes back, in match order.
+    """
+    teams = [team.lower() for team in teams]
+    if len(teams) < 4:
+        raise ValueError("a season needs at least four teams for the playoffs")
+    season = MatchRandom(seed)
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    played = []
+
+    def play_all(jobs):
+        tags = [tag for _, _, tag in jobs]
+        jobs = [(team1, team2, season.child_seed(team1, team2, tag), exporter is not None) for team1, team2, tag in jobs]
+        matches = []
+        for tag, match in zip(tags, map(_play, jobs) if pool is None else pool.map(_play, jobs)):
+            if exporter is not None:
+                exporter.write_match(f"{season.seed}:{len(played)}", tag, match.pop("balls"))
+            played.append(match)
+            matches.append(match)
+        return matches
+
+    try:
+        league = play_all([(team1, team2, "group") for team1, team2 in league_fixtures(teams)])
+        points = PointsTable(teams)
+        for match in league:
+            points.record_match(match)
+        table = list(points.standings())
+
+        def decided(match):
+            winner = match["winner"]
+            if winner == "tie":  # no super overs: the higher-placed team goes through
+                winner = min((match["team1"], match["team2"]), key=points.position)
+            return winner, match["team2"] if winner == match["team1"] else match["team1"]
+
+        qualifier1, eliminator = play_all([(table[0], table[1], "Qualifier 1"), (table[2], table[3], "Eliminator")])
+        winner_q1, loser_q1 = decided(qualifier1)
+        winner_elim, _ = decided(eliminator)
+        qualifier2, = play_all([(winner_elim, loser_q1, "Qualifier 2")])
+        winner_q2, _ = decided(qualifier2)
+        final, = play_all([(winner_q1, winner_q2, "Final")])
+        champion, _ = decided(final)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    playoffs = {"Qualifier 1": qualifier1, "Eliminator": eliminator, "Qualifier 2": qualifier2, "Final": final}
+    stats = SeasonStats()
+    for match in league + list(playoffs.values()):
+        stats.add_lines(match["batting"], match["bowling"])
+    return {"seed": season.seed, "league": league, "points": points, "standings": table,
+            "playoffs": playoffs, "champion": champion, "stats": stats}
+
+
+def points_table_text(result):
+    points = result["points"]
+    rows = [[team.upper(), points[team]["P"], points[team]["W"], points[team]["L"], points[team]["T"],
+             round(points[team]["nrr"], 2), points[team]["pts"]] for team in result["standings"]]
+    return tabulate(rows, headers=["Team", "Played", "Won", "Lost", "Tied", "NRR", "Points"], tablefmt="grid")
+
+
+def batting_stats_text(result):
+    rows = []
+    batting = result["stats"].batting
+    for player, c in result["stats"].top_batters(len(batting)):
+        avg, sr = batting_average(c), strike_rate(c)
+        rows.append([player, c["innings"], c["runs"], "NA" if avg is None else round(avg, 2), c["highest"],
+                     "NA" if sr is None else round(sr, 2), c["balls"], c["fours"], c["sixes"]])
+    return tabulate(rows, headers=["Player", "Innings", "Runs", "Average", "Highest", "SR", "Balls", "4s", "6s"],
+                    tablefmt="grid")
+
+
+def bowling_stats_text(result):
+    rows = []
+    bowling = result["stats"].bowling
+    for player, c in result["stats"].top_bowlers(len(bowling)):
+        econ = economy(c)
+        rows.append([player, c["wickets"], f"{c['balls'] // 6}.{c['balls'] % 6}", c["runs"],
+                     "NA" if econ is None else round(econ, 2)])
+    return tabulate(rows, headers=["Player", "Wickets", "Overs", "Runs Conceded", "Economy"], tablefmt="grid")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate a full IPL season without interaction.")
+    parser.add_argument("--teams", default=",".join(TEAMS), help="comma-separated team codes")
+    parser.add_argument("--seed", help="season seed (default: IPL_SEASON_SEED, else random)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--stats-dir", help="also write batStats.txt and bowlStats.txt here")
+    parser.add_argument("--export", help="write every ball to this .parquet, .arrow or .csv file")
+    args = parser.parse_args(argv)
+
+    seed = args.seed if args.seed is not None else os.environ.get("IPL_SEASON_SEED")
+    if args.export:
+        with ball_export.BallExporter(args.export) as exporter:
+            result = run_season(args.teams.split(","), seed=seed, workers=args.workers, exporter=exporter)
+    else:
+        result = run_season(args.teams.split(","), seed=seed, workers=args.workers)
+    print(f"Season seed: {result['seed']}")
+    print(points_table_text(result))
+    for tag, match in result["playoffs"].items():
+        print(f"{tag}: {match['team1'].upper()} vs {match['team2'].upper()} - {match['winMsg']}")
+    print(f"Champion: {result['champion'].upper()}")
+    if args.stats_dir:
+        os.makedirs(args.stats_dir, exist_ok=True)
+        with open(os.path.join(args.stats_dir, "batStats.txt"), "w") as fl:
+            fl.write(batting_stats_text(result) + "\n")
+        with open(os.path.join(args.stats_dir, "bowlStats.txt"), "w") as fl:
+            fl.write(bowling_stats_text(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Server-side storage for per-user objects that do not belong in a cookie.
+
+The Flask session is a signed cookie, so anything put in it travels with
+every request. ``TTLStore`` keeps the object itself in process memory under
+a random key; the cookie only carries the key (and, for interactive
+matches, a small snapshot to rebuild from when the entry has gone, e.g.
+after a restart or on another worker).
+
+Entries expire ``ttl`` seconds after they were last stored or read, and the
+least recently used entry is dropped once ``max_entries`` is reached.
+Expired entries are swept whenever the store is written to.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+
+class TTLStore:
+
+    def __init__(self, ttl=1800, max_entries=1024, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (expires_at, value), oldest first
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def new_key(self):
+        return uuid.uuid4().hex
+
+    def put(self, key, value):
+        now = self._clock()
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (now + self.ttl, value)
+            self._sweep(now)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key, default=None):
+        """Returns the value for ``key`` and extends its lifetime, or ``default`` if it is missing or expired."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or entry[0] <= now:
+                return default
+            self._entries[key] = (now + self.ttl, entry[1])
+            return entry[1]
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None or entry[0] <= self._clock():
+            return default
+        return entry[1]
+
+    def _sweep(self, now):
+        # Entries are in last-touched order, so the expired ones are at the front
+        while self._entries:
+            key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            del self._entries[key]
@@ -0,0 +1,61 @@
+"""Process-wide registry of teams/teams.json.
+
+The web app, mainconnect and MatchSimulator all need the team list; each
+used to open and parse the file on every request or match. ``get_teams``
+parses it once and re-reads it only when its mtime or size changes (and
+then only re-parses if the contents actually differ), so an edited
+teams.json is still picked up without a restart.
+
+Each path is cached separately. The returned mapping is shared by every
+caller, so it is frozen with frozen.freeze: team dicts are read-only mappingproxy views and the
+player lists are tuples.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from frozen import freeze
+
+TEAMS_PATH = "teams/teams.json"
+
+_lock = threading.Lock()
+_loaded = {}   # path -> (mtime, size, sha1, frozen teams) when it was last read
+
+
+def get_teams(path=TEAMS_PATH):
+    """Returns the frozen {team code: team dict} mapping, reloading it if the file changed."""
+    st = os.stat(path)
+    loaded = _loaded.get(path)
+    if loaded is not None and loaded[0] == st.st_mtime_ns and loaded[1] == st.st_size:
+        return loaded[3]
+    with _lock:
+        loaded = _loaded.get(path)
+        if loaded is not None and loaded[0] == st.st_mtime_ns and loaded[1] == st.st_size:
+            return loaded[3]
+        with open(path, "rb") as fl:
+            content = fl.read()
+        digest = hashlib.sha1(content).hexdigest()
+        if loaded is not None and loaded[2] == digest:
+            teams = loaded[3]   # touched but unchanged: keep handing out the same object
+        else:
+            teams = freeze(json.loads(content))
+        _loaded[path] = (st.st_mtime_ns, st.st_size, digest, teams)
+        return teams
+
+
+def version(path=TEAMS_PATH):
+    """Returns the sha1 of the teams file at ``path`` as the registry currently holds it."""
+    get_teams(path)
+    return _loaded[path][2]
+
+
+def get_team(code):
+    """Returns one team's frozen dict. Raises KeyError for unknown team codes."""
+    return get_teams()[code]
+
+
+def clear_cache():
+    with _lock:
+        _loaded.clear()
@@ -0,0 +1,72 @@
+import unittest
+import os
+import sys
+import json
+import tempfile
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import accessJSON
+from frozen import freeze
+
+
+class TestPlayerStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "players.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, players):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(players, f, indent=2, ensure_ascii=False)
+
+    def test_matches_full_load(self):
+        with open(accessJSON.DATA_PATH) as f:
+            full = json.load(f)
+        self.assertEqual(len(accessJSON.data), len(full))
+        for name in ("MS Dhoni", "RINKU SINGH"):
+            self.assertEqual(accessJSON.getPlayerInfo(name), freeze(full[name]))
+        with self.assertRaises(KeyError):
+            accessJSON.getPlayerInfo("not a player")
+
+    def test_player_info_is_read_only(self):
+        record = accessJSON.getPlayerInfo("MS Dhoni")
+        with self.assertRaises(TypeError):
+            record['batBallsTotal'] += 1
+        with self.assertRaises(AttributeError):
+            record['overNumbers'].append(0)
+        self.assertEqual(accessJSON.data["MS Dhoni"]['batBallsTotal'], record['batBallsTotal'])
+
+    def test_offsets_with_non_ascii_records(self):
+        players = {"Zoë": {"n": "ü" * 5}, "Ĳ B": {"n": [1, {"x": "ß"}]}, "plain": {"n": 3}}
+        self.write(players)
+        store = accessJSON.PlayerStore(self.path)
+        self.assertEqual(dict(store), players)
+
+    def test_index_rebuilt_when_file_changes(self):
+        self.write({"a": {"n": 1}})
+        store = accessJSON.PlayerStore(self.path)
+        self.assertEqual(store["a"], {"n": 1})
+        self.assertTrue(os.path.exists(self.path + ".idx"))
+        self.write({"b": {"n": 22}, "a": {"n": 333}})
+        self.assertEqual(accessJSON.PlayerStore(self.path)["a"], {"n": 333})
+
+    def test_cache_is_bounded(self):
+        self.write({str(i): {"n": i} for i in range(10)})
+        store = accessJSON.PlayerStore(self.path, cacheSize=3)
+        for i in range(10):
+            self.assertEqual(store[str(i)]["n"], i)
+        self.assertEqual(list(store._cache), ["7", "8", "9"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,259 @@
+import unittest
+import os
+import sys
+import gzip
+import importlib.util
+import json
+import subprocess
+import threading
+from unittest import mock
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import app as webapp
+import mainconnect
+import replay
+
+
+def _signed_path(team1, team2, seed):
+    engine, data = mainconnect.ENGINE_VERSION, webapp.replay_data_version()
+    token = webapp.replay_token(engine, data, team1, team2, seed)
+    return f"{engine}/{data}/{team1}/{team2}/{seed}/{token}"
+
+
+def replay_url(team1, team2, seed):
+    return "/api/replay/" + _signed_path(team1, team2, seed)
+
+
+def live_url(team1, team2, seed):
+    return "/api/live/" + _signed_path(team1, team2, seed)
+
+
+def load_app_instance(secret):
+    """A separate copy of the app module, standing in for another worker process."""
+    spec = importlib.util.spec_from_file_location("app_worker", os.path.join(project_root_dir, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(os.environ, {"IPL_SECRET_KEY": secret}):
+        spec.loader.exec_module(module)
+    return module
+
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self):
+        webapp.build_replay_data.cache_clear()
+        self.client = webapp.app.test_client()
+
+    def test_replay_is_regenerated_from_seed(self):
+        version = webapp.replay_data_version()
+        first = webapp.build_replay_data("csk", "mi", 4242, version)
+        webapp.build_replay_data.cache_clear()
+        second = webapp.build_replay_data("csk", "mi", 4242, version)
+        self.assertEqual(first, second)
+        self.assertIs(second, webapp.build_replay_data("csk", "mi", 4242, version))
+
+    def test_ball_by_ball_stores_only_a_replay_record(self):
+        response = self.client.post('/generate_scorecard', data={
+            'selectedTeam1': 'csk', 'selectedTeam2': 'mi', 'simulation_type': 'ball_by_ball'})
+        self.assertEqual(response.status_code, 302)
+        with self.client.session_transaction() as session:
+            replay = session['replay_match']
+        self.assertEqual(set(replay), {"team1", "team2", "seed", "engine", "data"})
+        self.assertEqual(replay["engine"], mainconnect.ENGINE_VERSION)
+        self.assertEqual(replay["data"], webapp.replay_data_version())
+
+        live = self.client.get('/replay_match_view')
+        self.assertEqual(live.status_code, 200)
+        self.assertIn(b'/api/live/', live.data)  # first view streams the match as it is simulated
+        self.assertEqual(webapp.build_replay_data.cache_info().currsize, 0)
+
+        page = self.client.get('/replay_match_view')
+        self.assertEqual(page.status_code, 200)
+        expected = webapp.build_replay_data("csk", "mi", replay["seed"], replay["data"])
+        self.assertIn(expected["win_msg"].encode(), page.data)
+
+    def test_replay_served_per_over(self):
+        self.client.post('/generate_scorecard', data={
+            'selectedTeam1': 'rcb', 'selectedTeam2': 'kkr', 'simulation_type': 'ball_by_ball'})
+        with self.client.session_transaction() as session:
+            seed = session['replay_match']['seed']
+        self.client.get('/replay_match_view')
+        page = self.client.get('/replay_match_view')
+        self.assertNotIn(b'"e":', page.data)  # no balls embedded in the page
+
+        result = mainconnect.Match("rcb", "kkr", seed=seed).play()
+        self.assertIn(replay_url("rcb", "kkr", seed).encode(), page.data)
+        base = replay_url("rcb", "kkr", seed)
+        for innings in (1, 2):
+            balls = []
+            over = 0
+            while True:
+                response = self.client.get(f"{base}/{innings}/{over}")
+                if response.status_code == 404:
+                    break
+                balls += response.get_json()["balls"]
+                over += 1
+            self.assertEqual(balls, [replay.compact_ball(entry) for entry in result[f"innings{innings}Log"]])
+
+    def test_replay_chunk_caching_and_gzip(self):
+        url = replay_url("csk", "mi", 77) + "/1/0"
+        response = self.client.get(url, headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(response.data))["over"], 0)
+        webapp.build_replay_data.cache_clear()
+        cached = self.client.get(url, headers={'If-None-Match': response.headers['ETag']})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(webapp.build_replay_data.cache_info().currsize, 0)  # answered without re-simulating
+
+    def test_replay_chunks_need_a_known_fixture_and_an_issued_seed(self):
+        url = replay_url("csk", "mi", 77) + "/1/0"
+        etag = webapp.replay_etag(mainconnect.ENGINE_VERSION, webapp.replay_data_version(), "xyz", "mi", 77, 1, 0)
+        unknown = self.client.get(url.replace("/csk/", "/xyz/"), headers={'If-None-Match': etag})
+        self.assertEqual(unknown.status_code, 404)
+        forged = self.client.get(url.replace("/77/", "/78/"))
+        self.assertEqual(forged.status_code, 403)
+        self.assertEqual(webapp.build_replay_data.cache_info().currsize, 0)
+
+    def test_replay_chunks_expire_with_the_data(self):
+        url = replay_url("csk", "mi", 77) + "/1/0"
+        etag = self.client.get(url).headers['ETag']
+        with mock.patch.object(webapp, "replay_data_version", return_value="after-an-edit"):
+            stale = self.client.get(url, headers={'If-None-Match': etag})
+            self.assertEqual(stale.status_code, 410)
+            fresh = replay_url("csk", "mi", 77) + "/1/0"
+            self.assertNotEqual(self.client.get(fresh).headers['ETag'], etag)
+
+    def test_live_stream(self):
+        response = self.client.get(live_url("csk", "mi", 99))
+        self.assertEqual(response.mimetype, "text/event-stream")
+        events = []
+        for frame in response.get_data(as_text=True).strip().split("\n\n"):
+            kind, data = frame.split("\n")
+            events.append((kind[len("event: "):], json.loads(data[len("data: "):])))
+        self.assertEqual(events[0][0], "toss")
+        self.assertEqual(events[-1][0], "done")
+        self.assertEqual([kind for kind, _ in events if kind not in ("ball", "toss", "done")], ["innings", "result", "innings"])
+
+        result = mainconnect.Match("csk", "mi", seed=99).play()
+        balls = [data["ball"] for kind, data in events if kind == "ball"]
+        self.assertEqual(balls, [replay.compact_ball(entry) for entry in result["innings1Log"] + result["innings2Log"]])
+        summary = [data for kind, data in events if kind == "innings"][1]
+        self.assertEqual(summary["runs"], result["innings2Runs"])
+        self.assertEqual(summary["bat_team"], result["innings2BatTeam"])
+
+    def test_live_streams_are_issued_and_capped(self):
+        self.assertEqual(self.client.get(live_url("csk", "mi", 99).replace("/csk/", "/xyz/")).status_code, 404)
+        self.assertEqual(self.client.get(live_url("csk", "mi", 99).replace("/99/", "/98/")).status_code, 403)
+        with mock.patch.object(webapp, "live_streams", threading.BoundedSemaphore(1)):
+            first = self.client.get(live_url("csk", "mi", 5))
+            self.assertEqual(first.status_code, 200)
+            busy = self.client.get(live_url("rcb", "kkr", 6))
+            self.assertEqual(busy.status_code, 503)
+            first.close()
+            second = self.client.get(live_url("rcb", "kkr", 6))
+            self.assertEqual(second.status_code, 200)
+            second.get_data()
+            second.close()
+
+    def test_direct_simulation_is_served_from_the_pool(self):
+        form = {'selectedTeam1': 'dc', 'selectedTeam2': 'srh', 'simulation_type': 'direct'}
+        self.assertEqual(self.client.post('/generate_scorecard', data=form).status_code, 200)
+        webapp.direct_matches.wait_idle()
+        self.assertEqual(webapp.direct_matches.ready_count('dc', 'srh'), webapp.MATCH_POOL_DEPTH)
+        response = self.client.post('/generate_scorecard', data=form)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'won the toss', response.data)
+
+    def test_replay_from_other_engine_version_is_rejected(self):
+        with self.client.session_transaction() as session:
+            session['replay_match'] = {"team1": "csk", "team2": "mi", "seed": 1,
+                                       "engine": mainconnect.ENGINE_VERSION - 1, "data": webapp.replay_data_version()}
+        response = self.client.get('/replay_match_view')
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(webapp.build_replay_data.cache_info().currsize, 0)
+
+    def test_replay_from_older_data_is_rejected(self):
+        with self.client.session_transaction() as session:
+            session['replay_match'] = {"team1": "csk", "team2": "mi", "seed": 1, "streamed": True,
+                                       "engine": mainconnect.ENGINE_VERSION, "data": "before-an-edit"}
+        response = self.client.get('/replay_match_view')
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("data changed", response.headers['Location'].replace('+', ' '))
+        self.assertEqual(webapp.build_replay_data.cache_info().currsize, 0)
+
+
+
+class TestInteractiveMatch(unittest.TestCase):
+
+    def setUp(self):
+        self.client = webapp.app.test_client()
+
+    def test_session_holds_only_a_key_and_snapshot(self):
+        start = self.client.post('/api/interactive', data={'selectedTeam1': 'csk', 'selectedTeam2': 'mi'})
+        self.assertEqual(start.status_code, 200)
+        sizes = set()
+        events = []
+        for _ in range(40):
+            response = self.client.post('/simulate_next_ball')
+            self.assertEqual(response.status_code, 200)
+            events.append(response.get_json()["ball_event"])
+            with self.client.session_transaction() as session:
+                record = session['interactive_match']
+            sizes.add(len(record['snapshot']))
+        self.assertEqual(set(record), {"id", "snapshot"})
+        self.assertLess(max(sizes), 100)
+
+        # Losing the in-memory simulator (expiry, restart, another worker) falls back to the snapshot
+        original = webapp.interactive_matches.pop(record['id'])
+        following = original.simulate_one_ball()["ball_event"]
+        self.assertEqual(self.client.post('/simulate_next_ball').get_json()["ball_event"], following)
+
+    def test_next_ball_without_a_match(self):
+        self.assertEqual(self.client.post('/simulate_next_ball').status_code, 404)
+
+    def test_match_resumes_on_another_worker(self):
+        first, second = load_app_instance("shared"), load_app_instance("shared")
+        self.assertEqual(first.app.secret_key, "shared")
+        client = first.app.test_client()
+        client.post('/api/interactive', data={'selectedTeam1': 'rr', 'selectedTeam2': 'pbks'})
+        for _ in range(10):
+            client.post('/simulate_next_ball')
+        with client.session_transaction() as session:
+            record_id = session['interactive_match']['id']
+        following = first.interactive_matches.get(record_id).simulate_one_ball()["ball_event"]
+
+        other = second.app.test_client()
+        other.set_cookie('session', client.get_cookie('session').value)
+        response = other.post('/simulate_next_ball')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["ball_event"], following)
+        self.assertIsNotNone(second.interactive_matches.get(record_id))
+
+    def test_overlapping_balls_are_rejected(self):
+        self.client.post('/api/interactive', data={'selectedTeam1': 'csk', 'selectedTeam2': 'mi'})
+        with self.client.session_transaction() as session:
+            record_id = session['interactive_match']['id']
+        webapp._busy_matches.add(record_id)
+        try:
+            self.assertEqual(self.client.post('/simulate_next_ball').status_code, 409)
+        finally:
+            webapp._busy_matches.discard(record_id)
+        self.assertEqual(self.client.post('/simulate_next_ball').status_code, 200)
+
+
+class TestImport(unittest.TestCase):
+
+    def test_import_starts_no_threads(self):
+        code = "import threading, app; print(threading.active_count())"
+        out = subprocess.run([sys.executable, "-c", code], cwd=project_root_dir, capture_output=True, text=True)
+        self.assertEqual(out.stdout.strip().splitlines()[-1], "1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest import mock
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import artifact_store
+import mainconnect
+from artifact_store import ArtifactStore
+
+
+class TestArtifactStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.now = 1000.0
+        self.store = ArtifactStore(self.tmp.name, max_bytes=100, ttl=60, clock=lambda: self.now)
+
+    def tearDown(self):
+        self.store.wait_idle()
+        self.tmp.cleanup()
+
+    def _age(self, path, seconds):
+        os.utime(path, (self.now - seconds, self.now - seconds))
+
+    def test_put_is_sharded_and_readable(self):
+        path = self.store.put("cskvmi.txt", "commentary")
+        self.assertEqual(os.path.basename(path), "cskvmi.txt")
+        self.assertEqual(len(os.path.relpath(path, self.tmp.name).split(os.sep)), 3)
+        self._age(path, 0)
+        self.assertEqual(self.store.get("cskvmi.txt"), b"commentary")
+        self.assertIsNone(self.store.get("missing.txt"))
+        with self.assertRaises(ValueError):
+            self.store.path_for("../escape")
+
+    def test_expired_files_are_evicted(self):
+        old = self.store.put("old.txt", "x")
+        fresh = self.store.put("fresh.txt", "y")
+        self.store.wait_idle()
+        flat = os.path.join(self.tmp.name, "flat.txt")
+        artifact_store.atomic_write(flat, "z")
+        self._age(old, 61)
+        self._age(fresh, 10)
+        self._age(flat, 120)
+        self.assertIsNone(self.store.get("old.txt"))
+        self.assertEqual(self.store.evict(), 2)
+        self.assertFalse(os.path.exists(old))
+        self.assertFalse(os.path.exists(os.path.dirname(old)))  # empty shard removed
+        self.assertFalse(os.path.exists(flat))
+        self.assertTrue(os.path.exists(fresh))
+
+    def test_writes_start_evictions_in_the_background(self):
+        stale = os.path.join(self.tmp.name, "left-behind.txt")
+        artifact_store.atomic_write(stale, "x")
+        self._age(stale, 120)
+        self.store.put("first.txt", "x")  # the first write sweeps what earlier runs left
+        self.store.wait_idle()
+        self.assertFalse(os.path.exists(stale))
+
+        paths = [self.store.put(f"match{i}.txt", "x" * 40) for i in range(2)]
+        self._age(paths[0], 30)
+        self._age(paths[1], 20)
+        paths.append(self.store.put("match2.txt", "x" * 40))  # past max_bytes: evicts straight away
+        self.store.wait_idle()
+        self.assertEqual([os.path.exists(p) for p in paths], [False, True, True])
+
+    def test_atomic_write_leaves_no_temporary_files(self):
+        path = os.path.join(self.tmp.name, "a", "b.txt")
+        artifact_store.atomic_write(path, "first")
+        artifact_store.atomic_write(path, b"second")
+        with open(path, "rb") as fl:
+            self.assertEqual(fl.read(), b"second")
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["b.txt"])
+
+    def test_game_writes_commentary_to_the_scores_store(self):
+        store = ArtifactStore(self.tmp.name)
+        with mock.patch.object(artifact_store, "_scores", store):
+            result = mainconnect.game(manual=False, sentTeamOne="csk", sentTeamTwo="mi", switch="test", seed=7)
+        store.wait_idle()
+        self.assertIn(result["winMsg"].encode(), store.get("cskvmi_test.txt"))
+
+
+if __name__ == '__main__':
+    unittest.main()
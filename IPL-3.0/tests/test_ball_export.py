@@ -0,0 +1,105 @@
+import unittest
+import csv
+import os
+import sys
+import tempfile
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import ball_export
+import forecast
+import mainconnect
+import season
+
+TEAMS = ("csk", "mi", "rcb", "kkr")
+
+
+class TestBallRows(unittest.TestCase):
+
+    def test_rows_follow_the_innings_log(self):
+        sink = ball_export.BallRowSink()
+        result = mainconnect.Match("csk", "mi", sink=sink, seed=7).play()
+        log = [(1, entry) for entry in result["innings1Log"]] + [(2, entry) for entry in result["innings2Log"]]
+        self.assertEqual(len(sink.rows), len(log))
+        for row, (innings, entry) in zip(sink.rows, log):
+            self.assertEqual(row[0], innings)
+            self.assertEqual(entry["event"].split()[0], f"{row[1]}.{row[2]}")  # same over.ball as the commentary
+            self.assertEqual(row[3], result[f"innings{innings}BatTeam"])
+            self.assertEqual((row[5], row[6]), (entry["batsman"], entry["bowler"]))
+            self.assertEqual((row[11], row[12]), (entry["runs"], entry["wickets"]))
+        for innings in (1, 2):
+            rows = [row for row in sink.rows if row[0] == innings]
+            self.assertEqual(sum(row[7] + row[8] for row in rows), result[f"innings{innings}Runs"])
+            self.assertEqual(sum(row[9] is not None for row in rows), rows[-1][12])
+
+
+class TestBallExporter(unittest.TestCase):
+
+    def test_csv_is_written_in_row_groups(self):
+        rows = [("s:0", "group", 1, 0, i % 6 + 1, "csk", "mi", "A", "B", 1, 0, None, None, i, 0) for i in range(25)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "balls.csv")
+            with ball_export.BallExporter(path, row_group_size=10) as exporter:
+                exporter.write_rows(rows[:7])
+                self.assertEqual(exporter.rows_written, 0)
+                exporter.write_rows(rows[7:])
+                self.assertEqual(exporter.rows_written, 20)
+            self.assertEqual(exporter.rows_written, 25)
+            with open(path, newline="") as fl:
+                read = list(csv.reader(fl))
+        self.assertEqual(tuple(read[0]), ball_export.COLUMNS)
+        self.assertEqual(len(read), 26)
+        self.assertEqual(read[1][11:14], ["", "", "0"])
+
+    def test_unknown_extension(self):
+        with self.assertRaises(ValueError):
+            ball_export.BallExporter("balls.txt")
+
+    @unittest.skipIf(ball_export.pa is not None, "pyarrow is installed")
+    def test_parquet_needs_pyarrow(self):
+        with tempfile.TemporaryDirectory() as tmp, self.assertRaises(ImportError):
+            ball_export.BallExporter(os.path.join(tmp, "balls.parquet"))
+
+    @unittest.skipIf(ball_export.pa is None, "pyarrow not installed")
+    def test_parquet_row_groups(self):
+        import pyarrow.parquet
+        buffer = ball_export.RowBuffer()
+        season.run_season(TEAMS, seed=1, workers=1, exporter=buffer)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "balls.parquet")
+            with ball_export.BallExporter(path, row_group_size=1000) as exporter:
+                exporter.write_rows(buffer)
+            parquet = pyarrow.parquet.ParquetFile(path)
+            self.assertEqual(parquet.metadata.num_rows, len(buffer))
+            self.assertEqual(parquet.metadata.num_row_groups, -(-len(buffer) // 1000))
+            self.assertEqual(parquet.schema_arrow.names, list(ball_export.COLUMNS))
+
+
+class TestSeasonExport(unittest.TestCase):
+
+    def test_season_exports_every_match_in_order(self):
+        serial, parallel = ball_export.RowBuffer(), ball_export.RowBuffer()
+        result = season.run_season(TEAMS, seed=9, workers=1, exporter=serial)
+        self.assertEqual(season.run_season(TEAMS, seed=9, workers=2, exporter=parallel), result)
+        self.assertEqual(serial, parallel)
+        match_ids = list(dict.fromkeys(row[0] for row in serial))
+        self.assertEqual(match_ids, [f"9:{n}" for n in range(len(result["league"]) + 4)])
+        self.assertNotIn("balls", result["league"][0])
+        self.assertEqual({row[1] for row in serial}, {"group", "Qualifier 1", "Eliminator", "Qualifier 2", "Final"})
+
+    def test_forecast_exports_the_seasons_it_counts(self):
+        buffer = ball_export.RowBuffer()
+        result = forecast.forecast(TEAMS, seasons=4, workers=1, seed=2, chunk_size=2, exporter=buffer)
+        self.assertEqual({row[0].split(":")[0] for row in buffer}, {f"2-{i}" for i in range(result["seasons"])})
+        with self.assertRaises(ValueError):
+            forecast.forecast(TEAMS, seasons=2, engine="batch", exporter=buffer)
+
+
+if __name__ == '__main__':
+    unittest.main()
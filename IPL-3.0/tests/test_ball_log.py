@@ -0,0 +1,64 @@
+import unittest
+import os
+import sys
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import mainconnect
+import ball_log
+import event_sinks
+
+
+class TestBallLog(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.result = mainconnect.game(manual=False, sentTeamOne="csk", sentTeamTwo="mi", switch="test", seed=1234,
+                                      sink=event_sinks.NullSink())
+
+    def test_entries_do_not_carry_full_trackers(self):
+        for entry in self.result["innings1Log"] + self.result["innings2Log"]:
+            self.assertNotIn("batterTracker", entry)
+            self.assertNotIn("bowlerTracker", entry)
+            self.assertIn("bowl", entry)
+
+    def test_final_state_matches_trackers(self):
+        for inn in ("innings1", "innings2"):
+            bat_final = self.result[f"{inn}Battracker"]
+            bowl_final = self.result[f"{inn}Bowltracker"]
+            log = self.result[f"{inn}Log"]
+            batters, bowlers = ball_log.trackers_at(log, len(log) - 1, bat_final, bowl_final)
+            self.assertEqual(list(batters), list(bat_final))
+            for name, stats in bat_final.items():
+                self.assertEqual(batters[name]['runs'], stats['runs'])
+                self.assertEqual(batters[name]['balls'], stats['balls'])
+                self.assertEqual(batters[name]['ballLog'], stats['ballLog'])
+            for name, stats in bowl_final.items():
+                self.assertEqual(bowlers[name]['runs'], stats['runs'])
+                self.assertEqual(bowlers[name]['balls'], stats['balls'])
+                self.assertEqual(bowlers[name]['wickets'], stats['wickets'])
+                self.assertEqual(bowlers[name]['ballLog'], stats['ballLog'])
+
+    def test_intermediate_state_matches_score(self):
+        log = self.result["innings1Log"]
+        bat_final = self.result["innings1Battracker"]
+        bowl_final = self.result["innings1Bowltracker"]
+        for entry, batters, bowlers in ball_log.iter_trackers(log, bat_final, bowl_final):
+            self.assertEqual(sum(b['runs'] for b in bowlers.values()), entry['runs'])
+            self.assertEqual(sum(b['balls'] for b in bowlers.values()), entry['balls'])
+
+    def test_before_first_ball_is_empty(self):
+        batters, bowlers = ball_log.trackers_at(self.result["innings1Log"], -1,
+                                                self.result["innings1Battracker"], self.result["innings1Bowltracker"])
+        self.assertTrue(all(b['balls'] == 0 and b['ballLog'] == [] for b in batters.values()))
+        self.assertTrue(all(b['runs'] == 0 for b in bowlers.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import os
+import sys
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import batch_engine
+import monte_carlo
+
+
+@unittest.skipIf(batch_engine.np is None, "NumPy is not installed")
+class TestBatchEngine(unittest.TestCase):
+
+    def test_batch_results_are_consistent(self):
+        result = batch_engine.simulate_batch("csk", "mi", 500, seed=11)
+        self.assertEqual(len(result["winner"]), 500)
+        self.assertEqual(sum(len(g["rows"]) for g in result["groups"]), 500)
+        for group in result["groups"]:
+            inn1, inn2 = group["innings1"], group["innings2"]
+            self.assertTrue((inn1["balls"] <= 120).all() and (inn1["wickets"] <= 10).all())
+            self.assertTrue(((inn1["balls"] == 120) | (inn1["wickets"] == 10)).all())
+            self.assertTrue((inn2["runs"] <= inn1["runs"] + 6).all())
+            # Team totals are the batters' runs plus wides
+            self.assertTrue((inn1["bat_runs"].sum(axis=1) <= inn1["runs"]).all())
+        self.assertTrue(140 < result["groups"][0]["innings1"]["runs"].mean() < 210)
+
+    def test_same_seed_same_batch(self):
+        a = batch_engine.simulate_batch("rcb", "kkr", 50, seed=4)
+        b = batch_engine.simulate_batch("rcb", "kkr", 50, seed=4)
+        self.assertTrue((a["winner"] == b["winner"]).all())
+
+    def test_simulate_many_batch_engine(self):
+        result = monte_carlo.simulate_many("csk", "mi", 300, workers=1, seed=2, engine="batch", chunk_size=120)
+        self.assertEqual(result["matches"], 300)
+        self.assertAlmostEqual(sum(result["win_probability"].values()), 1.0)
+        self.assertEqual(sum(result["scores"]["csk"]["histogram"].values()), 300)
+        self.assertIn("KA Pollard", result["player_runs"])
+
+    def test_string_seeds(self):
+        # simulate_many accepts the same string seeds as the per-ball engine
+        a = monte_carlo.simulate_many("csk", "mi", 40, workers=1, seed="season-7", engine="batch", chunk_size=15)
+        b = monte_carlo.simulate_many("csk", "mi", 40, workers=2, seed="season-7", engine="batch", chunk_size=15)
+        self.assertEqual(a, b)
+        self.assertEqual(a["seed"], "season-7")
+        self.assertEqual(batch_engine.seed_entropy(4), 4)
+        self.assertNotEqual(batch_engine.seed_entropy("4"), batch_engine.seed_entropy(4))
+        self.assertEqual(batch_engine.seed_entropy(["a", 2]), [batch_engine.seed_entropy("a"), 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
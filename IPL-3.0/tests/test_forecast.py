@@ -0,0 +1,70 @@
+import unittest
+import os
+import sys
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import forecast
+import batch_engine
+
+TEAMS = ("csk", "mi", "rcb", "kkr")
+
+
+class TestForecast(unittest.TestCase):
+
+    def check_consistent(self, result):
+        n = result["seasons"]
+        teams = result["teams"]
+        for place in range(len(TEAMS)):
+            self.assertAlmostEqual(sum(row["positions"][place]["p"] for row in teams.values()), 1.0)
+        self.assertAlmostEqual(sum(row["title"]["p"] for row in teams.values()), 1.0)
+        self.assertAlmostEqual(sum(row["final"]["p"] for row in teams.values()), 2.0)
+        for row in teams.values():
+            self.assertAlmostEqual(row["playoffs"]["p"], 1.0)  # four teams: everyone makes the top four
+            for interval in row["positions"] + [row["final"], row["title"]]:
+                self.assertLessEqual(interval["low"], interval["p"])
+                self.assertLessEqual(interval["p"], interval["high"])
+        self.assertGreater(n, 0)
+
+    def test_streams_estimates_and_is_reproducible(self):
+        estimates = list(forecast.iter_forecast(TEAMS, seasons=4, workers=1, seed=11, chunk_size=2))
+        self.assertEqual([e["seasons"] for e in estimates], [2, 4])
+        self.assertEqual([e["done"] for e in estimates], [False, True])
+        self.check_consistent(estimates[-1])
+        parallel = forecast.forecast(TEAMS, seasons=4, workers=2, seed=11, chunk_size=2)
+        self.assertEqual(parallel, estimates[-1])
+
+    def test_stops_early_once_intervals_are_tight(self):
+        result = forecast.forecast(TEAMS, seasons=40, workers=1, seed=3, chunk_size=2, tolerance=0.5, min_seasons=2)
+        self.assertEqual(result["seasons"], 2)
+        self.assertTrue(result["stopped_early"])
+        self.assertLessEqual(result["max_half_width"], 0.5)
+
+    @unittest.skipIf(batch_engine.np is None, "NumPy not installed")
+    def test_batch_engine(self):
+        result = forecast.forecast(TEAMS, seasons=30, workers=1, seed=5, engine="batch")
+        self.assertEqual(result["seasons"], 30)
+        self.check_consistent(result)
+
+    @unittest.skipIf(batch_engine.np is None, "NumPy not installed")
+    def test_batch_engine_takes_string_seeds(self):
+        result = forecast.forecast(TEAMS, seasons=10, workers=1, seed="playoff-race", engine="batch")
+        self.assertEqual(result["seed"], "playoff-race")
+        self.assertEqual(result, forecast.forecast(TEAMS, seasons=10, workers=1, seed="playoff-race", engine="batch"))
+
+    def test_wilson_interval(self):
+        z = 1.959963984540054
+        interval = forecast.wilson_interval(50, 100, z)
+        self.assertAlmostEqual(interval["low"], 0.4038, places=4)
+        self.assertAlmostEqual(interval["high"], 0.5962, places=4)
+        self.assertEqual(forecast.wilson_interval(0, 10, z)["low"], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+import os
+import sys
+import threading
+import io
+import json
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import mainconnect
+import event_sinks
+
+
+class TestMatch(unittest.TestCase):
+
+    def test_play_returns_result_dict(self):
+        result = mainconnect.Match("csk", "mi").play()
+        for key in ("innings1Runs", "innings2Runs", "innings1Battracker", "innings2Bowltracker",
+                    "innings1Log", "innings2Log", "winner", "winMsg", "tossMsg"):
+            self.assertIn(key, result)
+        self.assertIn(result["innings1BatTeam"], ("csk", "mi"))
+        self.assertEqual(result["innings1Log"][-1]["runs"], result["innings1Runs"])
+        self.assertEqual(result["innings2Log"][-1]["runs"], result["innings2Runs"])
+
+    def test_concurrent_matches_keep_separate_state(self):
+        fixtures = [("csk", "mi"), ("rcb", "kkr"), ("dc", "srh"), ("rr", "pbks")]
+        results = {}
+
+        def run(team1, team2):
+            results[(team1, team2)] = mainconnect.Match(team1, team2).play()
+
+        threads = [threading.Thread(target=run, args=fixture) for fixture in fixtures]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for (team1, team2), result in results.items():
+            self.assertEqual({result["innings1BatTeam"], result["innings2BatTeam"]}, {team1, team2})
+            self.assertEqual(result["innings1Log"][-1]["runs"], result["innings1Runs"])
+            self.assertEqual(result["innings2Log"][-1]["runs"], result["innings2Runs"])
+            self.assertTrue(result["tossMsg"].startswith((team1, team2)))
+
+
+    def test_seed_reproduces_match(self):
+        first = mainconnect.Match("csk", "mi", seed="fixture-7").play()
+        second = mainconnect.Match("csk", "mi", seed="fixture-7").play()
+        self.assertEqual(first, second)
+        self.assertEqual(first["seed"], "fixture-7")
+        other = mainconnect.Match("csk", "mi", seed="fixture-8").play()
+        self.assertNotEqual(first["innings1Log"], other["innings1Log"])
+
+    def test_seeded_matches_ignore_global_random_state(self):
+        import random
+        random.seed(1)
+        first = mainconnect.Match("rcb", "kkr", seed=99).play()
+        random.seed(2)
+        random.random()
+        second = mainconnect.Match("rcb", "kkr", seed=99).play()
+        self.assertEqual(first["innings2Log"], second["innings2Log"])
+
+    def test_steps_yield_state_after_every_ball(self):
+        match = mainconnect.Match("csk", "mi", seed=21)
+        states = [json.loads(json.dumps(state)) for state in match.steps()]  # a copy of each state as it was yielded
+        result = match.result
+        log = result["innings1Log"] + result["innings2Log"]
+        self.assertEqual(len(states), len(log))
+        for state, entry in zip(states, log):
+            self.assertEqual((state["runs"], state["balls"], state["wickets"]), (entry["runs"], entry["balls"], entry["wickets"]))
+            self.assertEqual(state["bowler"], entry["bowler"])
+        self.assertEqual(states[-1]["innings"], 2)
+        self.assertEqual(states[-1]["target"], result["innings1Runs"] + 1)
+        self.assertEqual(states[-1]["batterTracker"], result["innings2Battracker"])
+        self.assertEqual(result, mainconnect.Match("csk", "mi", seed=21).play())
+
+    def test_interleaved_steps_match_sequential_play(self):
+        fixtures = [("csk", "mi"), ("rcb", "kkr")]
+        matches = [mainconnect.Match(team1, team2, seed=5) for team1, team2 in fixtures]
+        running = [match.steps() for match in matches]
+        while running:
+            for steps in list(running):
+                if next(steps, None) is None:
+                    running.remove(steps)
+        for match, (team1, team2) in zip(matches, fixtures):
+            self.assertEqual(match.result, mainconnect.Match(team1, team2, seed=5).play())
+
+    def test_memory_sink_receives_every_ball(self):
+        sink = event_sinks.MemorySink()
+        result = mainconnect.Match("csk", "mi", sink=sink).play()
+        kinds = [kind for kind, _ in sink.events]
+        self.assertEqual(kinds[:2], ["squads", "toss"])
+        self.assertEqual(kinds.count("result"), 1)
+        self.assertEqual(kinds.count("scorecard"), 2)
+        balls = [payload["ball"] for kind, payload in sink.events if kind == "ball"]
+        self.assertEqual(balls, result["innings1Log"] + result["innings2Log"])
+
+    def test_text_and_json_lines_sinks(self):
+        text_out, json_out = io.StringIO(), io.StringIO()
+        with event_sinks.TextSink(text_out) as sink:
+            result = mainconnect.Match("rcb", "kkr", sink=sink).play()
+            self.assertEqual(text_out.getvalue(), "")  # buffered until close
+        lines = text_out.getvalue().splitlines()
+        self.assertEqual(lines[1], result["tossMsg"])
+        self.assertIn(result["innings1Log"][0]["event"], lines)
+        self.assertIn(result["winMsg"], lines)
+
+        with event_sinks.JsonLinesSink(json_out) as sink:
+            result = mainconnect.Match("rcb", "kkr", sink=sink).play()
+        records = [json.loads(line) for line in json_out.getvalue().splitlines()]
+        self.assertIn({"type": "result", "winner": result["winner"], "message": result["winMsg"]}, records)
+        self.assertEqual(sum(r["type"] == "ball" for r in records), len(result["innings1Log"]) + len(result["innings2Log"]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import os
+import sys
+import threading
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import match_pool
+import mainconnect
+
+
+class TestMatchPool(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def fake_simulate(self, team1, team2):
+        with self.lock:
+            self.calls.append((team1, team2))
+            return {"fixture": (team1, team2), "n": len(self.calls), "padding": "x" * 1000}
+
+    def test_first_request_misses_then_pool_is_refilled(self):
+        pool = match_pool.MatchPool(depth=2, simulate=self.fake_simulate)
+        self.assertIsNone(pool.take("csk", "mi"))
+        pool.wait_idle()
+        self.assertEqual(pool.ready_count("csk", "mi"), 2)
+        first = pool.take("csk", "mi")
+        self.assertEqual(first["fixture"], ("csk", "mi"))
+        pool.wait_idle()
+        self.assertEqual(pool.ready_count("csk", "mi"), 2)
+        self.assertNotEqual(pool.take("csk", "mi")["n"], first["n"])  # each result is handed out once
+        self.assertEqual(pool.ready_count("rcb", "kkr"), 0)  # never asked for, never simulated
+
+    def test_results_from_other_data_versions_are_dropped(self):
+        pool = match_pool.MatchPool(depth=1, simulate=self.fake_simulate)
+        pool.take("csk", "mi")
+        pool.wait_idle()
+        original = match_pool.data_version
+        match_pool.data_version = lambda: ("edited", "teams")
+        try:
+            self.assertIsNone(pool.take("csk", "mi"))
+            pool.wait_idle()
+            self.assertEqual(pool.ready_count("csk", "mi"), 1)
+        finally:
+            match_pool.data_version = original
+
+    def test_memory_limit_drops_least_recently_requested_fixture(self):
+        pool = match_pool.MatchPool(depth=2, max_bytes=3500, simulate=self.fake_simulate)
+        pool.take("csk", "mi")
+        pool.wait_idle()
+        pool.take("rcb", "kkr")
+        pool.wait_idle()
+        self.assertLessEqual(pool._bytes, 3500)
+        self.assertEqual(pool.ready_count("rcb", "kkr"), 2)
+        self.assertLess(pool.ready_count("csk", "mi"), 2)
+
+    def test_failed_simulation_is_not_retried(self):
+        def broken(team1, team2):
+            raise KeyError(team1)
+        pool = match_pool.MatchPool(depth=2, simulate=broken)
+        with self.assertLogs(level="ERROR"):
+            self.assertIsNone(pool.take("xyz", "mi"))
+            pool.wait_idle()
+        self.assertEqual(pool.ready_count("xyz", "mi"), 0)
+
+    def test_disabled_pool(self):
+        pool = match_pool.MatchPool(depth=0, simulate=self.fake_simulate)
+        self.assertIsNone(pool.take("csk", "mi"))
+        self.assertEqual(self.calls, [])
+
+    def test_pooled_result_is_a_direct_match(self):
+        pool = match_pool.MatchPool(depth=1)
+        pool.take("csk", "mi")
+        pool.wait_idle()
+        result = pool.take("csk", "mi")
+        self.assertEqual(result["innings1Log"][-1]["runs"], result["innings1Runs"])
+        self.assertEqual(mainconnect.Match("csk", "mi", seed=result["seed"]).play(), result)
+
+
+if __name__ == '__main__':
+    unittest.main()
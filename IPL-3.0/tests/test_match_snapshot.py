@@ -0,0 +1,65 @@
+import unittest
+import os
+import sys
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# match_simulator/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import match_snapshot
+import match_simulator
+from match_simulator import MatchSimulator
+
+
+class TestMatchSnapshot(unittest.TestCase):
+
+    def test_round_trip(self):
+        for seed in (0, 2**64 - 1, -5, "fixture-7"):
+            snapshot = match_snapshot.Snapshot(1, "csk", "mi", seed, 117, True, (0.9, 1.0, 1.1))
+            self.assertEqual(match_snapshot.unpack(match_snapshot.pack(snapshot)), snapshot)
+        snapshot = match_snapshot.Snapshot(1, "rcb", "kkr", 3, 0, False, None)
+        data = match_snapshot.pack(snapshot)
+        self.assertEqual(match_snapshot.unpack(data), snapshot)
+        self.assertLess(len(data), 32)
+
+    def test_rejects_other_versions_and_garbage(self):
+        data = match_snapshot.pack(match_snapshot.Snapshot(2, "csk", "mi", 1, 10, True, None))
+        with self.assertRaises(match_snapshot.SnapshotError):
+            match_snapshot.unpack(data, engine=1)
+        with self.assertRaises(match_snapshot.SnapshotError):
+            match_snapshot.unpack(data[:2] + bytes([match_snapshot.SCHEMA_VERSION + 1]) + data[3:])
+        for bad in (b"", b"nonsense", data[:-1], data + b"x"):
+            with self.assertRaises(match_snapshot.SnapshotError):
+                match_snapshot.unpack(bad)
+
+    def test_simulator_restores_mid_match(self):
+        simulator = MatchSimulator("csk", "mi", seed=3, pitch_factors={"pace": 0.9})
+        simulator.perform_toss()
+        for _ in range(130):
+            simulator.simulate_one_ball()
+        data = simulator.snapshot()
+        self.assertLess(len(data), 64)
+
+        restored = MatchSimulator.from_snapshot(data)
+        self.assertEqual(restored.pace_factor, 0.9)
+        self.assertEqual(restored.get_game_state(), simulator.get_game_state())
+        while not simulator.game_over:
+            self.assertEqual(restored.simulate_one_ball()["ball_event"], simulator.simulate_one_ball()["ball_event"])
+        self.assertTrue(restored.game_over)
+        self.assertEqual(restored.win_message, simulator.win_message)
+
+    def test_snapshot_must_match_fixture_and_version(self):
+        data = MatchSimulator("csk", "mi", seed=1).snapshot()
+        with self.assertRaises(match_snapshot.SnapshotError):
+            MatchSimulator("rcb", "kkr", saved_state=data)
+        other_engine = match_snapshot.pack(match_snapshot.unpack(data)._replace(engine=match_simulator.SIMULATOR_VERSION + 1))
+        with self.assertRaises(match_snapshot.SnapshotError):
+            MatchSimulator.from_snapshot(other_engine)
+
+
+if __name__ == '__main__':
+    unittest.main()
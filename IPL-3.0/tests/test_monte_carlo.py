@@ -0,0 +1,46 @@
+import unittest
+import os
+import sys
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import mainconnect
+import monte_carlo
+import scorecard
+
+
+class TestSimulateMany(unittest.TestCase):
+
+    def test_aggregates_cover_every_match(self):
+        result = monte_carlo.simulate_many("csk", "mi", 12, workers=1, seed=7)
+        self.assertEqual(result["matches"], 12)
+        self.assertAlmostEqual(sum(result["win_probability"].values()), 1.0)
+        for team in ("csk", "mi"):
+            self.assertEqual(sum(result["scores"][team]["histogram"].values()), 12)
+        decided = 12 - round(result["win_probability"].get("tie", 0) * 12)
+        self.assertEqual(sum(result["margins"]["runs"].values()) + sum(result["margins"]["wickets"].values()), decided)
+        self.assertIn("KA Pollard", result["player_runs"])
+
+    def test_same_seed_same_result_regardless_of_workers(self):
+        serial = monte_carlo.simulate_many("rcb", "kkr", 8, workers=1, seed=3)
+        parallel = monte_carlo.simulate_many("rcb", "kkr", 8, workers=2, seed=3, chunk_size=3)
+        self.assertEqual(serial, parallel)
+
+    def test_aggregates_matches_without_ball_logs(self):
+        result = mainconnect.Match("dc", "srh", seed="7-0", keep_log=False).play()
+        self.assertEqual(result["innings1Log"], [])
+        agg = monte_carlo._empty_aggregate("dc", "srh")
+        monte_carlo._add_result(agg, result)
+        for inn in ("innings1", "innings2"):
+            _, wickets = scorecard.batting_card(result[f"{inn}Battracker"])
+            self.assertEqual(agg["wickets"][result[f"{inn}BatTeam"]], {wickets: 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
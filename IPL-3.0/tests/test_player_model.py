@@ -0,0 +1,50 @@
+import unittest
+import os
+import sys
+import copy
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import accessJSON
+import mainconnect
+import player_model
+
+
+class TestPlayerModel(unittest.TestCase):
+
+    def test_compiled_tables(self):
+        raw = accessJSON.getPlayerInfo("MS Dhoni")
+        player = player_model.get_player("MS Dhoni")
+        balls = raw['batBallsTotal'] + 1
+        self.assertAlmostEqual(player['batOutsRate'], raw['batOutsTotal'] / balls)
+        self.assertAlmostEqual(player['runOutRate'], raw['runnedOut'] / balls)
+        self.assertEqual(set(player['overNumbersObject']), {str(o) for o in range(1, 21)})
+        self.assertEqual(player['playerInitials'], raw['playerInitials'])
+
+    def test_compiled_once_per_data_file(self):
+        self.assertIs(player_model.get_player("MS Dhoni"), player_model.get_player("MS Dhoni"))
+        with self.assertRaises(KeyError):
+            player_model.get_player("not a player")
+
+    def test_compiled_records_are_read_only(self):
+        player = player_model.get_player("MS Dhoni")
+        with self.assertRaises(TypeError):
+            player['batBallsTotal'] += 1
+        with self.assertRaises(TypeError):
+            player['bowlRunDenominationsObject']['4'] = 0
+
+    def test_matches_leave_player_data_untouched(self):
+        before = copy.deepcopy(accessJSON.data["MS Dhoni"])
+        mainconnect.Match("csk", "mi").play()
+        mainconnect.Match("csk", "mi").play()
+        self.assertEqual(accessJSON.data["MS Dhoni"], before)
+
+
+if __name__ == '__main__':
+    unittest.main()
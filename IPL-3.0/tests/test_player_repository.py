@@ -0,0 +1,105 @@
+import unittest
+import os
+import sys
+import json
+import sqlite3
+import tempfile
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import mainconnect
+import player_model
+import player_repository
+
+
+class CountingRepository(player_repository.JSONPlayerRepository):
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def get_many(self, names):
+        self.calls.append(list(names))
+        return super().get_many(names)
+
+
+class TestPlayerRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        player_model.set_repository(player_repository.JSONPlayerRepository())
+        self.tmp.cleanup()
+
+    def test_sqlite_matches_json(self):
+        source = player_repository.JSONPlayerRepository()
+        sqlite = player_repository.SQLitePlayerRepository(os.path.join(self.tmp.name, "players.sqlite"), source)
+        names = ["MS Dhoni", "RINKU SINGH", "not a player"]
+        self.assertEqual(sqlite.get_many(names), source.get_many(names))
+        self.assertNotIn("not a player", sqlite.get_many(names))
+        with self.assertRaises(KeyError):
+            sqlite.get("not a player")
+        sqlite.close()
+
+    def test_sqlite_rebuilds_when_source_changes(self):
+        path = os.path.join(self.tmp.name, "players.json")
+        with open(path, "w") as fl:
+            json.dump({"A": {"playerInitials": "A", "n": 1}}, fl)
+        db = os.path.join(self.tmp.name, "players.sqlite")
+        repo = player_repository.SQLitePlayerRepository(db, player_repository.JSONPlayerRepository(path))
+        self.assertEqual(repo.get("A")["n"], 1)
+        with open(path, "w") as fl:
+            json.dump({"A": {"playerInitials": "A", "n": 22}, "B": {"playerInitials": "B"}}, fl)
+        self.assertEqual(repo.get("A")["n"], 22)
+        self.assertIn("B", repo.get_many(["B"]))
+        repo.close()
+
+    def test_sqlite_rebuild_is_invisible_until_committed(self):
+        path = os.path.join(self.tmp.name, "players.json")
+        with open(path, "w") as fl:
+            json.dump({"A": {"playerInitials": "A", "n": 1}}, fl)
+        db = os.path.join(self.tmp.name, "players.sqlite")
+        repo = player_repository.SQLitePlayerRepository(db, player_repository.JSONPlayerRepository(path))
+        self.assertEqual(repo.get("A")["n"], 1)
+        seen_mid_rebuild = []
+
+        class PeekingSource(player_repository.JSONPlayerRepository):
+            def records(self):
+                # Another process reading the file halfway through the rebuild
+                other = sqlite3.connect(db, isolation_level=None)
+                seen_mid_rebuild.extend(other.execute("SELECT displayName, record FROM players").fetchall())
+                other.close()
+                yield from super().records()
+
+        with open(path, "w") as fl:
+            json.dump({"A": {"playerInitials": "A", "n": 22}}, fl)
+        repo.source = PeekingSource(path)
+        self.assertEqual(repo.get("A")["n"], 22)
+        self.assertEqual([(name, json.loads(record)["n"]) for name, record in seen_mid_rebuild], [("A", 1)])
+        repo.close()
+
+    def test_match_fetches_both_squads_in_one_call(self):
+        repo = CountingRepository()
+        player_model.set_repository(repo)
+        mainconnect.Match("csk", "mi", seed=1).play()
+        self.assertEqual(len(repo.calls), 1)
+        self.assertEqual(len(repo.calls[0]), 22)
+        mainconnect.Match("csk", "mi", seed=2).play()
+        self.assertEqual(len(repo.calls), 1)  # compiled records are reused
+
+    def test_sqlite_backend_plays_same_match(self):
+        expected = mainconnect.Match("rcb", "kkr", seed=5).play()
+        player_model.set_repository(player_repository.SQLitePlayerRepository(os.path.join(self.tmp.name, "players.sqlite")))
+        self.assertEqual(mainconnect.Match("rcb", "kkr", seed=5).play(), expected)
+        player_model.repository.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import os
+import pickle
+import sys
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import mainconnect
+from player_stats import SeasonStats, batting_average, economy, innings_lines
+
+
+class TestSeasonStats(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.matches = [mainconnect.Match(t1, t2, seed=seed, keep_log=False).play()
+                       for t1, t2, seed in (("csk", "mi", 1), ("rcb", "kkr", 2), ("csk", "rcb", 3))]
+
+    def test_totals_match_the_trackers(self):
+        result = self.matches[0]
+        stats = SeasonStats().add_match(result)
+        for inn in ("innings1", "innings2"):
+            for player, tracker in result[f"{inn}Battracker"].items():
+                if not (tracker["balls"] or tracker["dismissal"]):
+                    self.assertNotIn(player, stats.batting)
+                    continue
+                row = stats.batting[player]
+                self.assertEqual((row["runs"], row["balls"], row["highest"]), (tracker["runs"], tracker["balls"], tracker["runs"]))
+                self.assertEqual(row["outs"], int(tracker["dismissal"] is not None))
+                self.assertEqual(row["fours"], sum(entry.endswith(":4") for entry in tracker["ballLog"]))
+                self.assertEqual(row["sixes"], sum(entry.endswith(":6") for entry in tracker["ballLog"]))
+            for player, tracker in result[f"{inn}Bowltracker"].items():
+                if tracker["balls"]:
+                    self.assertEqual(stats.bowling[player]["wickets"], tracker["wickets"])
+        self.assertEqual(sum(row["runs"] for row in stats.bowling.values()),
+                         result["innings1Runs"] + result["innings2Runs"])
+
+    def test_rows_do_not_grow_with_balls(self):
+        stats = SeasonStats()
+        for _ in range(5):
+            stats.add_match(self.matches[0])
+        for row in stats.batting.values():
+            self.assertEqual(len(row), 7)
+            self.assertEqual(row["innings"], 5)
+        self.assertEqual(len(stats.batting), len(SeasonStats().add_match(self.matches[0]).batting))
+
+    def test_merge_equals_one_accumulator(self):
+        whole = SeasonStats()
+        for result in self.matches:
+            whole.add_match(result)
+        left = SeasonStats().add_match(self.matches[0])
+        right = SeasonStats().add_match(self.matches[1]).add_match(self.matches[2])
+        self.assertEqual(left.merge(pickle.loads(pickle.dumps(right))), whole)
+
+    def test_leaderboards(self):
+        stats = SeasonStats()
+        for result in self.matches:
+            stats.add_lines(*innings_lines(result["innings1Battracker"], result["innings1Bowltracker"]))
+        runs = sorted((row["runs"] for row in stats.batting.values()), reverse=True)
+        self.assertEqual([row["runs"] for _, row in stats.top_batters(3)], runs[:3])
+        wickets = sorted((row["wickets"] for row in stats.bowling.values()), reverse=True)
+        self.assertEqual([row["wickets"] for _, row in stats.top_bowlers(3)], wickets[:3])
+        self.assertEqual(len(stats.top_batters(len(stats.batting) + 10)), len(stats.batting))
+
+    def test_rates(self):
+        self.assertIsNone(batting_average({"runs": 30, "outs": 0}))
+        self.assertEqual(batting_average({"runs": 30, "outs": 2}), 15)
+        self.assertIsNone(economy({"runs": 0, "balls": 0}))
+        self.assertEqual(economy({"runs": 30, "balls": 24}), 7.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
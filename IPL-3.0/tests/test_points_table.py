@@ -0,0 +1,74 @@
+import unittest
+import os
+import pickle
+import random
+import sys
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+from points_table import PointsTable, net_run_rate
+
+TEAMS = ["dc", "csk", "rcb", "mi"]
+
+
+def innings(first, runs1, balls1, second, runs2, balls2):
+    return [{"team": first, "runs": runs1, "balls": balls1}, {"team": second, "runs": runs2, "balls": balls2}]
+
+
+def random_results(rng, count):
+    results = []
+    for _ in range(count):
+        team1, team2 = rng.sample(TEAMS, 2)
+        runs1, runs2 = rng.randint(100, 220), rng.randint(100, 220)
+        winner = team1 if runs1 > runs2 else team2 if runs2 > runs1 else "tie"
+        results.append((team1, team2, winner, innings(team1, runs1, 120, team2, runs2, rng.randint(60, 120))))
+    return results
+
+
+class TestPointsTable(unittest.TestCase):
+
+    def test_empty_table_has_zero_nrr_and_code_order(self):
+        table = PointsTable(TEAMS)
+        self.assertEqual(table.standings(), ("csk", "dc", "mi", "rcb"))
+        self.assertEqual(table["dc"]["nrr"], 0.0)
+        self.assertEqual(net_run_rate(table["dc"]), 0.0)  # no balls faced: no ZeroDivisionError
+
+    def test_record_updates_rows_and_ranking(self):
+        table = PointsTable(TEAMS)
+        table.record("dc", "csk", "dc", innings("dc", 180, 120, "csk", 150, 120))
+        table.record("rcb", "mi", "tie", innings("rcb", 160, 120, "mi", 160, 120))
+        self.assertEqual(table["dc"]["W"], 1)
+        self.assertEqual(table["csk"]["L"], 1)
+        self.assertEqual((table["rcb"]["T"], table["rcb"]["pts"]), (1, 1))
+        self.assertAlmostEqual(table["dc"]["nrr"], 1.5)
+        self.assertAlmostEqual(table["csk"]["nrr"], -1.5)
+        self.assertEqual(table.standings(), ("dc", "mi", "rcb", "csk"))
+        self.assertEqual(table.position("csk"), 4)
+        with self.assertRaises(KeyError):
+            table.record("dc", "kkr", "dc", innings("dc", 1, 6, "kkr", 0, 6))
+
+    def test_standings_match_a_full_sort(self):
+        table = PointsTable(TEAMS)
+        for result in random_results(random.Random(7), 60):
+            table.record(*result)
+            expected = sorted(TEAMS, key=lambda team: (-table[team]["pts"], -net_run_rate(table[team]), team))
+            self.assertEqual(list(table.standings()), expected)
+
+    def test_merge_equals_recording_everything(self):
+        results = random_results(random.Random(3), 40)
+        whole, left, right = PointsTable(TEAMS), PointsTable(TEAMS), PointsTable(TEAMS)
+        for i, result in enumerate(results):
+            whole.record(*result)
+            (left if i % 2 else right).record(*result)
+        merged = left.merge(pickle.loads(pickle.dumps(right)))
+        self.assertEqual(merged, whole)
+        self.assertEqual(merged.standings(), whole.standings())
+        for team in TEAMS:
+            self.assertAlmostEqual(merged[team]["nrr"], whole[team]["nrr"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import os
+import sys
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import ball_log
+import mainconnect
+import scorecard
+
+
+class TestScorecard(unittest.TestCase):
+
+    def test_describe_dismissal(self):
+        self.assertEqual(scorecard.describe_dismissal(ball_log.dismissal_record("caught", 7, "JJ Bumrah", "KA Pollard")),
+                         "c KA Pollard b JJ Bumrah")
+        self.assertEqual(scorecard.describe_dismissal(ball_log.dismissal_record("lbw", 7, "JJ Bumrah")), "lbw b JJ Bumrah")
+        self.assertEqual(scorecard.describe_dismissal(ball_log.dismissal_record("runOut", 7)), "Run out")
+        self.assertEqual(scorecard.describe_dismissal(None), "Not out")
+
+    def test_batting_card(self):
+        tracker = {
+            "A": {'runs': 10, 'balls': 8, 'ballLog': ["1:1"], 'dismissal': ball_log.dismissal_record("runOut", 8)},
+            "B": {'runs': 4, 'balls': 2, 'ballLog': ["2:4"], 'dismissal': None},
+            "C": {'runs': 0, 'balls': 0, 'ballLog': [], 'dismissal': None},
+        }
+        card, wickets = scorecard.batting_card(tracker)
+        self.assertEqual(wickets, 1)
+        self.assertEqual([row['how_out'] for row in card.values()], ["Run out", "Not out", "DNB"])
+        self.assertEqual(card["A"]['strike_rate'], 125.0)
+        self.assertIsNone(card["C"]['strike_rate'])
+        self.assertNotIn('how_out', tracker["A"])
+
+    def test_batting_card_follows_arrival_order(self):
+        tracker = {
+            "A": {'runs': 0, 'balls': 0, 'ballLog': [], 'dismissal': None, 'arrival': None},
+            "B": {'runs': 30, 'balls': 20, 'ballLog': ["1:1"], 'dismissal': ball_log.dismissal_record("bowled", 20, "X"),
+                  'arrival': 2},
+            "C": {'runs': 0, 'balls': 0, 'ballLog': [], 'dismissal': None, 'arrival': 3},  # not-out non-striker
+            "D": {'runs': 12, 'balls': 9, 'ballLog': ["2:4"], 'dismissal': None, 'arrival': 1},
+        }
+        card, _ = scorecard.batting_card(tracker)
+        self.assertEqual(list(card), ["D", "B", "C", "A"])
+        self.assertEqual([row['how_out'] for row in card.values()], ["Not out", "bowled b X", "Not out", "DNB"])
+
+    def test_match_cards_in_arrival_order(self):
+        for seed in range(10):
+            result = mainconnect.Match("rcb", "kkr", seed=seed).play()
+            for inn in ("innings1", "innings2"):
+                log = result[f"{inn}Log"]
+                came_in = list(dict.fromkeys(name for entry in log for name in (entry['batter1'], entry['batter2'])))
+                card, _ = scorecard.batting_card(result[f"{inn}Battracker"])
+                self.assertEqual(list(card)[:len(came_in)], came_in)
+                self.assertTrue(all(card[name]['how_out'] != "DNB" for name in came_in))
+                self.assertTrue(all(row['how_out'] == "DNB" for row in list(card.values())[len(came_in):]))
+                batters, _ = ball_log.trackers_at(log, len(log) - 1, result[f"{inn}Battracker"], result[f"{inn}Bowltracker"])
+                self.assertEqual({name: stats['arrival'] for name, stats in batters.items()},
+                                 {name: stats['arrival'] for name, stats in result[f"{inn}Battracker"].items()})
+
+    def test_cards_agree_with_match(self):
+        result = mainconnect.Match("csk", "mi", seed=33).play()
+        for inn in ("innings1", "innings2"):
+            log = result[f"{inn}Log"]
+            card, wickets = scorecard.batting_card(result[f"{inn}Battracker"])
+            # A batter's last dismissal in the log is the one on the card
+            last_out = {entry['batsman']: entry['dismissal'] for entry in log if entry['dismissal']}
+            self.assertEqual(wickets, len(last_out))
+            for name, out_type in last_out.items():
+                self.assertEqual(result[f"{inn}Battracker"][name]['dismissal']['type'], out_type)
+            credited = sum(1 for entry in log if entry['dismissal'] not in (None, "runOut"))
+            self.assertEqual(sum(row['wickets'] for row in scorecard.bowling_card(result[f"{inn}Bowltracker"]).values()), credited)
+            # Trackers rebuilt from the compact log carry the same dismissals
+            batters, _ = ball_log.trackers_at(log, len(log) - 1, result[f"{inn}Battracker"], result[f"{inn}Bowltracker"])
+            for name, stats in result[f"{inn}Battracker"].items():
+                self.assertEqual(batters[name]['dismissal'], stats['dismissal'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import os
+import sys
+import io
+import tempfile
+import contextlib
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import season
+from match_random import MatchRandom
+
+
+class TestRunSeason(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.result = season.run_season(seed=42, workers=1)
+
+    def test_league_and_points_table(self):
+        result = self.result
+        self.assertEqual(len(result["league"]), 28)
+        self.assertEqual(result["league"][0]["seed"], MatchRandom(42).child_seed("dc", "csk", "group"))  # as doipl.py seeds it
+        points = result["points"]
+        self.assertEqual(sum(row["P"] for row in points.values()), 56)
+        self.assertEqual(sum(row["pts"] for row in points.values()), 56)
+        self.assertEqual(sum(row["runsScored"] for row in points.values()),
+                         sum(row["runsConceded"] for row in points.values()))
+        pts = [points[team]["pts"] for team in result["standings"]]
+        self.assertEqual(pts, sorted(pts, reverse=True))
+
+    def test_playoff_bracket(self):
+        result = self.result
+        playoffs = result["playoffs"]
+        table = result["standings"]
+        self.assertEqual({playoffs["Qualifier 1"]["team1"], playoffs["Qualifier 1"]["team2"]}, set(table[:2]))
+        self.assertEqual({playoffs["Eliminator"]["team1"], playoffs["Eliminator"]["team2"]}, set(table[2:4]))
+        self.assertIn(result["champion"], (playoffs["Final"]["team1"], playoffs["Final"]["team2"]))
+        self.assertTrue(result["stats"].batting and result["stats"].bowling)
+
+    def test_parallel_season_matches_serial(self):
+        self.assertEqual(season.run_season(seed=42, workers=3), self.result)
+
+    def test_cli_writes_stats(self):
+        with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()) as out:
+            season.main(["--seed", "42", "--workers", "1", "--stats-dir", tmp])
+            self.assertTrue(os.path.getsize(os.path.join(tmp, "batStats.txt")))
+            self.assertTrue(os.path.getsize(os.path.join(tmp, "bowlStats.txt")))
+        self.assertIn(f"Champion: {self.result['champion'].upper()}", out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
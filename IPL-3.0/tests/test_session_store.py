@@ -0,0 +1,56 @@
+import unittest
+import os
+import sys
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+from session_store import TTLStore
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLStore(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.store = TTLStore(ttl=10, max_entries=3, clock=self.clock)
+
+    def test_entries_expire_after_ttl(self):
+        self.store.put("a", 1)
+        self.clock.now = 9
+        self.assertEqual(self.store.get("a"), 1)  # reading extends the lifetime
+        self.clock.now = 18
+        self.assertEqual(self.store.get("a"), 1)
+        self.clock.now = 29
+        self.assertIsNone(self.store.get("a"))
+
+    def test_expired_entries_are_swept_on_write(self):
+        self.store.put("a", 1)
+        self.store.put("b", 2)
+        self.clock.now = 11
+        self.store.put("c", 3)
+        self.assertEqual(len(self.store), 1)
+
+    def test_least_recently_used_entry_is_dropped_at_capacity(self):
+        for key in "abc":
+            self.store.put(key, key)
+        self.store.get("a")
+        self.store.put("d", "d")
+        self.assertIsNone(self.store.get("b"))
+        self.assertEqual([self.store.get(key) for key in "acd"], ["a", "c", "d"])
+        self.assertEqual(self.store.pop("a"), "a")
+        self.assertIsNone(self.store.get("a"))
+
+
+if __name__ == '__main__':
+    unittest.main()
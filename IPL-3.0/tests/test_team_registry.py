@@ -0,0 +1,65 @@
+import unittest
+import os
+import sys
+import json
+import subprocess
+import tempfile
+
+current_script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root_dir = os.path.dirname(current_script_dir)
+if project_root_dir not in sys.path:
+    sys.path.insert(0, project_root_dir)
+
+# mainconnect/accessJSON open data files relative to the project root.
+os.chdir(project_root_dir)
+
+import team_registry
+
+
+class TestTeamRegistry(unittest.TestCase):
+
+    def tearDown(self):
+        team_registry.clear_cache()
+
+    def test_loaded_once_and_read_only(self):
+        teams = team_registry.get_teams()
+        self.assertIs(teams, team_registry.get_teams())
+        self.assertIn("Ishan Kishan", team_registry.get_team("mi")["players"])
+        with self.assertRaises(TypeError):
+            teams["mi"]["name"] = "x"
+        with self.assertRaises(KeyError):
+            team_registry.get_team("not a team")
+
+    def test_reloads_when_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "teams.json")
+            with open(path, "w") as fl:
+                json.dump({"aaa": {"players": ["A"]}}, fl)
+            first = team_registry.get_teams(path)
+            os.utime(path, ns=(1, 1))
+            self.assertIs(team_registry.get_teams(path), first)  # touched, same contents
+            with open(path, "w") as fl:
+                json.dump({"aaa": {"players": ["A", "B"]}}, fl)
+            self.assertEqual(team_registry.get_teams(path)["aaa"]["players"], ("A", "B"))
+
+    def test_paths_are_cached_separately(self):
+        default = team_registry.get_teams()
+        default_version = team_registry.version()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "teams.json")
+            with open(path, "w") as fl:
+                json.dump({"aaa": {"players": ["A"]}}, fl)
+            other = team_registry.get_teams(path)
+            self.assertNotEqual(team_registry.version(path), default_version)
+            self.assertIs(team_registry.get_teams(), default)
+            self.assertEqual(team_registry.version(), default_version)
+            self.assertIs(team_registry.get_teams(path), other)
+
+    def test_import_does_not_load_players(self):
+        code = "import sys, team_registry; print('player_model' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], cwd=project_root_dir, capture_output=True, text=True)
+        self.assertEqual(out.stdout.strip(), "False")
+
+
+if __name__ == '__main__':
+    unittest.main()